@@ -3,6 +3,7 @@ import json
 import glob
 import re
 from pathlib import Path
+from job_manifest import load_checked_job_records
 try:
     import numpy as np
     from scipy.interpolate import interp1d, CubicSpline, UnivariateSpline
@@ -517,9 +518,15 @@ def collect_feature_data_to_json_advanced(root_folder, output_file="feature_data
     result = {}
     root_path = Path(root_folder)
 
-    # 查找所有feature_data.txt文件
-    all_feature_files = list(root_path.rglob("feature_data.txt"))
-    print(f"找到 {len(all_feature_files)} 个feature_data.txt文件")
+    # 查找所有feature_data.txt文件：优先按作业清单定位，没有清单时遍历目录树
+    records = load_checked_job_records(root_folder)
+    if records is not None:
+        all_feature_files = [root_path / record['dir'] / "feature_data.txt" for record in records]
+        all_feature_files = [feature_file for feature_file in all_feature_files if feature_file.exists()]
+        print(f"从作业清单 ({len(records)} 个作业) 中找到 {len(all_feature_files)} 个feature_data.txt文件")
+    else:
+        all_feature_files = list(root_path.rglob("feature_data.txt"))
+        print(f"找到 {len(all_feature_files)} 个feature_data.txt文件")
 
     # 按样本分组
     sample_curve_map = {}  # {sample_name: {curve_type: file_path}}
@@ -712,4 +719,4 @@ if __name__ == "__main__":
     print("\n" + "=" * 50)
     print("\n✓ 全部完成！")
     print(f"  - 数据已保存到: feature_data.json")
-    print(f"  - 已处理X值重复的数据点")
\ No newline at end of file
+    print(f"  - 已处理X值重复的数据点")
\ No newline at end of file
@@ -5,42 +5,137 @@
 
 使用方法:
 1. 使用UI生成多个前处理和后处理脚本
-2. 运行此脚本: python batch_runner.py
+2. 运行此脚本: python batch_runner.py [--cae-slots 4] [--pipeline]
 3. 执行策略：
-   Phase 1: 批量运行所有前处理（连续执行，快速释放CAE）
-   Phase 2: 逐个提交求解并后处理（求解完立即处理ODB，避免堆积）
+   Phase 1: 批量运行所有前处理（按 --cae-slots 限制并发，快速释放CAE）
+   Phase 2: 按节点CPU/内存预算并发求解并后处理（求解完立即处理ODB，避免堆积）
+   --pipeline: 三阶段流水线，.inp生成后立即求解，后处理与下一个求解重叠；
+               未后处理的ODB数不超过 --max-pending-odbs
+4. 进度记录在 generate_script/job_ledger.json，中断后重新运行会跳过已完成的阶段；
+   上次失败的作业默认跳过，使用 --retry-failed 只重跑失败的作业
+   求解停滞（.sta中分析时间长时间几乎不推进）的作业会被终止并记为 stalled，释放CPU和license
+   设置 Config.DISK_BUDGET_GB 后，磁盘占用超过高水位（DISK_HIGH_WATER）时暂停启动新的求解；
+   求解器中间文件在求解结束后立即删除
+   作业按历史求解用时（runtime_history.json，无记录时按杆件总长和半径估计）从长到短运行
+5. 求解进度（由 .sta 文件解析的完成百分比和剩余时间）写入 generate_script/solver_status.json
 """
 
 import subprocess
 import os
 import time
+import argparse
+import threading
+import queue
+import select
+import signal
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 import sys
-
-def find_all_jobs(base_dir="generate_script"):
-    """查找所有作业（前处理脚本）"""
-    preprocess_files = []
-    for root, dirs, files in os.walk(base_dir):
-        for file in files:
-            if file.endswith('_preprocess.py'):
-                preprocess_files.append(os.path.join(root, file))
+from config import Config
+from job_manifest import load_checked_job_records, resolve_job_path, scan_job_dirs
+from solver_progress import ProgressMonitor
+from disk_governor import DiskGovernor, CaeSlots, remove_solver_files
+from runtime_history import RuntimeHistory, estimate_requirements, predict_makespan
+from job_ledger import JobLedger, PREPROCESSED, SOLVED, POSTPROCESSED, FAILED, STALLED, check_feature_data
+
+def find_all_jobs(base_dir="generate_script", rescan=False):
+    """
+    查找所有作业：有作业清单时按清单顺序读取（不遍历目录树），没有清单时遍历目录树
+    查找前处理脚本和后处理脚本都存在的目录；rescan=True 时遍历目录树补充清单之外的作业
+
+    作业的 key 为相对任务目录的层级路径 (cell_type/size/radius/slider/mode)，用于记录和估计运行时间；
+    cpus / memory_gb 取自作业清单，清单中没有时按结构估计
+    """
+    records = load_checked_job_records(base_dir, rescan)
+    if records is not None:
+        print(f"从作业清单读取 {len(records)} 个作业")
+    else:
+        # 没有作业清单（旧版本生成的目录）时按遍历结果
+        records = [{
+            'id': job_name,
+            'dir': rel_dir,
+            'preprocess': f"{rel_dir}/{job_name}_preprocess.py",
+            'postprocess': f"{rel_dir}/{job_name}_postprocess.py",
+        } for rel_dir, job_name in scan_job_dirs(base_dir).items()]
 
     jobs = []
-    for pf in preprocess_files:
-        postprocess_file = pf.replace('_preprocess.py', '_postprocess.py')
-        if os.path.exists(postprocess_file):
-            jobs.append({
-                'preprocess': pf,
-                'postprocess': postprocess_file,
-                'dir': os.path.dirname(pf),
-                'job_name': os.path.basename(pf).replace('_preprocess.py', '')
-            })
-
+    for record in records:
+        cpus, memory_gb = record.get('cpus'), record.get('memory_gb')
+        if not cpus or not memory_gb:
+            cpus, memory_gb = estimate_requirements(record['dir'])
+        jobs.append({
+            'preprocess': resolve_job_path(base_dir, record['preprocess']),
+            'postprocess': resolve_job_path(base_dir, record['postprocess']),
+            'dir': resolve_job_path(base_dir, record['dir']),
+            'job_name': record['id'],
+            'key': record['dir'],
+            'cpus': cpus,
+            'memory_gb': memory_gb,
+        })
     return jobs
 
 
-def run_batch_preprocessing(jobs):
-    """Phase 1: 批量运行所有前处理脚本"""
+# 调度被中断（Ctrl+C / kill）时被终止的作业不记为失败，重新运行时从断点继续
+_interrupted = threading.Event()
+
+
+def note_exit_code(returncode):
+    """子进程被 SIGINT/SIGTERM 终止说明调度被中断，而不是作业本身失败"""
+    if returncode is not None and returncode < 0 and -returncode in (signal.SIGINT, signal.SIGTERM):
+        _interrupted.set()
+
+
+def mark_stage(ledger, job_name, stage, message=None):
+    """在作业进度记录中记录阶段，失败时同时记录原因（未启用记录或已中断时不记录失败）"""
+    if ledger is None or (stage == FAILED and _interrupted.is_set()):
+        return
+    ledger.mark(job_name, stage, message if stage in (FAILED, STALLED) else None)
+
+
+def mark_solve_failure(ledger, monitor, job_name):
+    """记录求解失败：被看门狗终止的作业记为 STALLED"""
+    if monitor is not None and monitor.was_stalled(job_name):
+        mark_stage(ledger, job_name, STALLED, "求解停滞")
+    else:
+        mark_stage(ledger, job_name, FAILED, "求解失败")
+
+
+def run_preprocess_job(job, log_to_file=False):
+    """运行单个前处理脚本，返回 (是否成功, 结果说明, 用时秒数)
+
+    并发运行时输出写入作业目录下的 {job_name}_preprocess.log，避免多个CAE会话的输出交错
+    """
+    job_name = job['job_name']
+    script_dir = job['dir']
+    preprocess_script = os.path.basename(job['preprocess'])
+    command = ['abaqus', 'cae', f'noGUI={preprocess_script}']
+
+    start_time = time.time()
+    try:
+        if log_to_file:
+            log_path = os.path.join(script_dir, f"{job_name}_preprocess.log")
+            with open(log_path, 'w', encoding='utf-8') as log_file:
+                result = subprocess.call(command, cwd=script_dir, stdout=log_file, stderr=subprocess.STDOUT)
+        else:
+            result = subprocess.call(command, cwd=script_dir)
+        note_exit_code(result)
+
+        if result == 0:
+            inp_file = os.path.join(script_dir, f"{job_name}.inp")
+            if os.path.exists(inp_file):
+                return True, "✓ 前处理成功", time.time() - start_time
+            return False, "✗ 前处理完成但未找到.inp文件", time.time() - start_time
+        return False, f"✗ 前处理失败 (错误码: {result})", time.time() - start_time
+
+    except Exception as e:
+        return False, f"✗ 前处理出错: {e}", time.time() - start_time
+
+
+def run_batch_preprocessing(jobs, cae_slots=1, ledger=None):
+    """Phase 1: 批量运行所有前处理脚本
+
+    最多同时运行 cae_slots 个CAE会话（线程池大小即CAE license占用上限）
+    """
     print("\n" + "=" * 80)
     print("Phase 1: 批量运行前处理脚本（生成.inp文件）")
     print("=" * 80)
@@ -49,111 +144,618 @@ def run_batch_preprocessing(jobs):
         print("没有作业需要处理")
         return []
 
-    print(f"找到 {len(jobs)} 个前处理脚本\n")
-
-    successful_jobs = []
-    for i, job in enumerate(jobs, 1):
-        job_name = job['job_name']
-        script_dir = job['dir']
-        preprocess_script = os.path.basename(job['preprocess'])
-
-        print(f"[{i}/{len(jobs)}] 运行前处理: {job_name}")
-        try:
-            result = subprocess.call(
-                ['abaqus', 'cae', f'noGUI={preprocess_script}'],
-                cwd=script_dir
-            )
-
-            if result == 0:
-                inp_file = os.path.join(script_dir, f"{job_name}.inp")
-                if os.path.exists(inp_file):
-                    print(f"✓ 前处理成功")
-                    successful_jobs.append(job)
-                else:
-                    print(f"✗ 前处理完成但未找到.inp文件")
+    cae_slots = max(1, min(cae_slots, len(jobs)))
+    print(f"找到 {len(jobs)} 个前处理脚本，同时运行的CAE会话数: {cae_slots}\n")
+
+    log_to_file = cae_slots > 1
+    print_lock = threading.Lock()
+    outcomes = [None] * len(jobs)
+    finished = 0
+
+    def run_job(index, job):
+        nonlocal finished
+        with print_lock:
+            print(f"[{index + 1}/{len(jobs)}] 运行前处理: {job['job_name']}")
+        success, message, elapsed = run_preprocess_job(job, log_to_file)
+        outcomes[index] = (success, elapsed)
+        mark_stage(ledger, job['job_name'], PREPROCESSED if success else FAILED, message)
+        with print_lock:
+            finished += 1
+            if log_to_file:
+                print(f"[完成 {finished}/{len(jobs)}] {job['job_name']}: {message} ({elapsed/60:.1f}分钟)")
+                if not success:
+                    print(f"  日志: {os.path.join(job['dir'], job['job_name'] + '_preprocess.log')}")
             else:
-                print(f"✗ 前处理失败 (错误码: {result})")
+                print(message)
 
-        except Exception as e:
-            print(f"✗ 前处理出错: {e}")
+    phase_start = time.time()
+    with ThreadPoolExecutor(max_workers=cae_slots) as executor:
+        for future in [executor.submit(run_job, index, job) for index, job in enumerate(jobs)]:
+            future.result()
+    wall_time = time.time() - phase_start
+
+    # 保持作业原有顺序
+    successful_jobs = [job for job, (success, _) in zip(jobs, outcomes) if success]
+    busy_time = sum(elapsed for _, elapsed in outcomes)
 
     print(f"\n成功完成 {len(successful_jobs)}/{len(jobs)} 个前处理")
+    print(f"Phase 1 用时: {wall_time/60:.1f}分钟，累计CAE会话时间: {busy_time/60:.1f}分钟")
+    if wall_time > 0:
+        print(f"实际并行度: {busy_time / wall_time:.2f}（上限 {cae_slots}），"
+              f"相比串行节省: {max(0.0, busy_time - wall_time)/60:.1f}分钟")
     return successful_jobs
 
 
-def run_solve_and_postprocess(job, job_index, total_jobs, check_interval=30):
-    """Phase 2: 提交求解器 → 等待完成 → 立即后处理"""
+_IN_DELETE = 0x00000200
+_IN_MOVED_FROM = 0x00000040
+_libc = None
+
+
+def _watch_directory(directory):
+    """
+    用inotify监视目录中的删除事件，返回可select的文件描述符
+
+    非Linux平台或无法创建监视时返回 None，调用方回退到轮询
+    """
+    global _libc
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        if _libc is None:
+            import ctypes
+            import ctypes.util
+            _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if _libc.inotify_add_watch(fd, os.fsencode(directory), _IN_DELETE | _IN_MOVED_FROM) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+
+def wait_for_file_removal(path, timeout=None, poll_interval=1.0):
+    """
+    等待文件被删除，返回文件是否已不存在
+
+    Linux上由inotify事件唤醒；网络文件系统上不一定能收到事件，
+    因此每隔 poll_interval 秒仍会重新检查一次（其他平台即为纯轮询）
+    """
+    if not os.path.exists(path):
+        return True
+
+    fd = _watch_directory(os.path.dirname(path) or '.')
+    deadline = None if timeout is None else time.time() + timeout
+    try:
+        while os.path.exists(path):
+            remaining = poll_interval if deadline is None else min(poll_interval, deadline - time.time())
+            if remaining <= 0:
+                return False
+            if fd is None:
+                time.sleep(remaining)
+            elif select.select([fd], [], [], remaining)[0]:
+                try:
+                    os.read(fd, 4096)  # 取走事件，随后重新检查文件
+                except BlockingIOError:
+                    pass
+        return True
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+
+def run_solver(job, check_interval=30, monitor=None, disk=None):
+    """提交求解器并等待完成，返回是否成功生成ODB
+
+    求解器使用 job_requirements(job) 中的CPU数，输出写入作业目录下的 {job_name}_solver.log；
+    提供 monitor (ProgressMonitor) 时登记作业，进度输出中包含 .sta 解析出的完成百分比和剩余时间。
+    求解器退出后删除 Config.SOLVER_SCRATCH_EXTENSIONS 中的中间文件
+    """
     job_name = job['job_name']
     script_dir = job['dir']
-
-    print("\n" + "=" * 80)
-    print(f"[{job_index}/{total_jobs}] 处理任务: {job_name}")
-    print("=" * 80)
+    cpus, _ = job_requirements(job)
 
     # 提交求解器
-    print(f"\n提交求解器...")
     try:
-        solver_process = subprocess.Popen(
-            ['abaqus', f'job={job_name}', f'input={job_name}.inp', 'cpus=8', 'interactive'],
-            cwd=script_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        print(f"✓ 已提交求解器 (PID: {solver_process.pid})")
+        # 输出写入日志文件而不是管道：多个求解器并发时不会因管道缓冲区写满而阻塞
+        with open(os.path.join(script_dir, f"{job_name}_solver.log"), 'w', encoding='utf-8') as solver_log:
+            solver_process = subprocess.Popen(
+                ['abaqus', f'job={job_name}', f'input={job_name}.inp', f'cpus={cpus}', 'interactive'],
+                cwd=script_dir,
+                stdout=solver_log,
+                stderr=subprocess.STDOUT
+            )
+        print(f"✓ 已提交求解器 {job_name} (PID: {solver_process.pid}, cpus={cpus})")
     except Exception as e:
-        print(f"✗ 求解器提交失败: {e}")
+        print(f"✗ 求解器提交失败 {job_name}: {e}")
         return False
 
-    # 等待求解完成
-    print(f"等待求解完成 (检查间隔: {check_interval}秒)...")
+    # 等待求解完成：直接等待求解器进程退出，check_interval 仅用于打印进度
     start_time = time.time()
-
+    if monitor is not None:
+        monitor.start_job(job, solver_process)
     while True:
-        time.sleep(check_interval)
+        try:
+            exit_code = solver_process.wait(timeout=check_interval)
+            note_exit_code(exit_code)
+            break
+        except subprocess.TimeoutExpired:
+            elapsed = time.time() - start_time
+            progress = monitor.describe(job_name) if monitor is not None else ""
+            sweep = monitor.describe_sweep() if monitor is not None else ""
+            print(f"  求解中 {job_name}... (已用时: {elapsed/60:.1f}分钟{'，' + progress if progress else ''})")
+            if sweep:
+                print(f"  {sweep}")
+
+    if monitor is not None and monitor.was_stalled(job_name):
+        print(f"✗ 求解停滞已终止 {job_name} (用时: {(time.time() - start_time)/60:.1f}分钟)")
+        success = False
+    else:
+        success = wait_for_solver_result(job, exit_code, start_time)
+
+    # 求解器已退出，重启/中间文件不再需要，立即删除释放磁盘
+    freed = remove_solver_files(script_dir, job_name, Config.SOLVER_SCRATCH_EXTENSIONS)
+    if disk is not None:
+        disk.release(freed)
+    if monitor is not None:
+        monitor.finish_job(job_name, success)
+    return success
+
+
+def terminate_solver(job, process):
+    """
+    终止停滞的求解作业，释放CPU和license
+
+    先用 abaqus terminate 让求解器正常退出，超时后强制结束进程，最后删除残留的.lck以便重跑
+    """
+    job_name = job['job_name']
+    print(f"✗ 求解停滞（{Config.STALL_WINDOW:.0f}秒内推进不足 {Config.STALL_MIN_PROGRESS:.1%}），终止作业 {job_name}")
+    try:
+        subprocess.call(['abaqus', 'terminate', f'job={job_name}'], cwd=job['dir'],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, timeout=Config.LCK_WAIT_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"警告: abaqus terminate 失败 {job_name}: {e}")
 
-        lck_file = os.path.join(script_dir, f"{job_name}.lck")
-        odb_file = os.path.join(script_dir, f"{job_name}.odb")
+    if process is not None:
+        try:
+            process.wait(timeout=Config.LCK_WAIT_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
 
-        # 如果ODB存在且.lck不存在，说明计算完成
-        if os.path.exists(odb_file) and not os.path.exists(lck_file):
-            elapsed = time.time() - start_time
-            print(f"✓ 求解完成 (用时: {elapsed/60:.1f}分钟)")
-            break
+    lck_file = os.path.join(job['dir'], f"{job_name}.lck")
+    if os.path.exists(lck_file):
+        try:
+            os.remove(lck_file)
+        except OSError as e:
+            print(f"警告: 无法删除 {lck_file}: {e}")
 
-        # 检查进程是否异常退出
-        if solver_process.poll() is not None and not os.path.exists(odb_file):
-            print(f"✗ 求解器异常退出 (退出码: {solver_process.poll()})")
-            return False
 
+def wait_for_solver_result(job, exit_code, start_time):
+    """求解器进程退出后确认结果：等待.lck释放并检查ODB"""
+    job_name = job['job_name']
+    script_dir = job['dir']
+
+    # 求解器进程退出后.lck可能稍晚才删除
+    lck_file = os.path.join(script_dir, f"{job_name}.lck")
+    odb_file = os.path.join(script_dir, f"{job_name}.odb")
+    if not wait_for_file_removal(lck_file, Config.LCK_WAIT_TIMEOUT):
+        print(f"✗ 求解器已退出但.lck未释放 {job_name} (退出码: {exit_code})")
+        return False
+
+    # 如果ODB存在且.lck不存在，说明计算完成
+    if os.path.exists(odb_file):
         elapsed = time.time() - start_time
-        print(f"  求解中... (已用时: {elapsed/60:.1f}分钟)")
+        print(f"✓ 求解完成 {job_name} (用时: {elapsed/60:.1f}分钟)")
+        return True
+
+    print(f"✗ 求解器异常退出 {job_name} (退出码: {exit_code})")
+    return False
+
 
-    # 立即运行后处理（处理ODB，避免堆积）
-    print(f"\n运行后处理...")
+def run_postprocess(job, cae_semaphore=None, disk=None):
+    """
+    运行后处理脚本（处理ODB），cae_semaphore (CaeSlots) 用于限制同时运行的CAE会话数
+
+    结果有效时删除ODB（生成的后处理脚本通常已自行删除），释放的空间计入 disk
+    """
+    job_name = job['job_name']
+    print(f"运行后处理 {job_name}...")
+    odb_file = os.path.join(job['dir'], f"{job_name}.odb")
+    odb_size = os.path.getsize(odb_file) if os.path.exists(odb_file) else 0
     try:
         postprocess_script = os.path.basename(job['postprocess'])
-        result = subprocess.call(
-            ['abaqus', 'cae', f'noGUI={postprocess_script}'],
-            cwd=script_dir
-        )
+        if cae_semaphore is not None:
+            cae_semaphore.acquire(postprocess=True)
+        try:
+            result = subprocess.call(
+                ['abaqus', 'cae', f'noGUI={postprocess_script}'],
+                cwd=job['dir']
+            )
+            note_exit_code(result)
+        finally:
+            if cae_semaphore is not None:
+                cae_semaphore.release()
 
-        if result == 0:
-            print(f"✓ 后处理完成")
-        else:
-            print(f"✗ 后处理失败 (错误码: {result})")
+        if result != 0:
+            print(f"✗ 后处理失败 {job_name} (错误码: {result})")
             return False
 
+        # 退出码为0不代表结果可用（如求解超时），检查结果文件
+        valid, detail = check_feature_data(os.path.join(job['dir'], "feature_data.txt"))
+        if valid:
+            remove_solver_files(job['dir'], job_name, ('.odb',))
+            if disk is not None and not os.path.exists(odb_file):
+                disk.release(odb_size)
+            print(f"✓ 后处理完成 {job_name} ({detail})")
+            return True
+        print(f"✗ 后处理结果无效 {job_name}: {detail}")
+        return False
+
     except Exception as e:
-        print(f"✗ 后处理出错: {e}")
+        print(f"✗ 后处理出错 {job_name}: {e}")
+        return False
+
+
+def run_solve_step(job, job_index, total_jobs, check_interval=30, ledger=None, monitor=None, disk=None):
+    """Phase 2 求解步骤: 提交求解器 → 等待完成（上次已求解完成的作业直接返回成功）"""
+    job_name = job['job_name']
+    print("\n" + "=" * 80)
+    print(f"[{job_index}/{total_jobs}] 处理任务: {job_name}")
+    print("=" * 80)
+
+    if ledger is not None and ledger.stage(job_name) == SOLVED:
+        print(f"✓ 上次已求解完成，直接后处理 {job_name}")
+    elif run_solver(job, check_interval, monitor, disk):
+        mark_stage(ledger, job_name, SOLVED)
+    else:
+        mark_solve_failure(ledger, monitor, job_name)
+        return False
+    return True
+
+
+def run_postprocess_step(job, start_time, cae_semaphore=None, ledger=None, disk=None):
+    """Phase 2 后处理步骤: 求解成功后立即后处理（处理ODB，避免堆积）"""
+    job_name = job['job_name']
+    if not run_postprocess(job, cae_semaphore, disk):
+        mark_stage(ledger, job_name, FAILED, "后处理失败")
         return False
+    mark_stage(ledger, job_name, POSTPROCESSED)
 
     total_time = time.time() - start_time
-    print(f"✓ 任务完成 (总用时: {total_time/60:.1f}分钟)")
+    print(f"✓ 任务完成 {job_name} (总用时: {total_time/60:.1f}分钟)")
     return True
 
 
+def detect_node_resources():
+    """检测节点资源预算 (CPU核数, 内存GB)，Config.NODE_CPUS / NODE_MEMORY_GB 非0时优先使用"""
+    cpus = Config.NODE_CPUS or os.cpu_count() or 1
+
+    memory_gb = Config.NODE_MEMORY_GB
+    if not memory_gb:
+        # Linux: 优先使用当前可用内存，其次使用总内存；无法检测时不限制内存
+        try:
+            meminfo = {}
+            with open('/proc/meminfo', 'r') as f:
+                for line in f:
+                    key, value = line.split(':', 1)
+                    meminfo[key] = int(value.split()[0])  # kB
+            memory_gb = meminfo.get('MemAvailable', meminfo.get('MemTotal', 0)) / (1024 * 1024)
+        except (OSError, ValueError):
+            memory_gb = 0
+    return cpus, memory_gb or None
+
+
+def job_requirements(job):
+    """
+    作业的资源需求 (CPU数, 内存GB)：find_all_jobs 按结构估计的需求（见 runtime_history.estimate_requirements）；
+    未声明或 Config.SOLVER_SCALE_REQUIREMENTS 关闭时使用 Config.SOLVER_CPUS / SOLVER_MEMORY_GB
+    """
+    if not Config.SOLVER_SCALE_REQUIREMENTS:
+        return Config.SOLVER_CPUS, Config.SOLVER_MEMORY_GB
+    return int(job.get('cpus') or Config.SOLVER_CPUS), float(job.get('memory_gb') or Config.SOLVER_MEMORY_GB)
+
+
+def estimate_solve_slots(node_cpus, node_memory_gb=None):
+    """按默认单作业需求估算节点可同时运行的求解作业数"""
+    slots = node_cpus // max(1, Config.SOLVER_CPUS)
+    if node_memory_gb:
+        slots = min(slots, int(node_memory_gb // Config.SOLVER_MEMORY_GB))
+    return max(1, slots)
+
+
+class SolveDispatcher:
+    """
+    求解阶段资源感知调度器：在节点CPU/内存预算内同时运行尽可能多的求解作业
+
+    按提交顺序启动放得下的作业；排在前面的大作业暂时放不下时，后面较小的作业可回填剩余资源。
+    需求超过整个节点预算的作业会在节点空闲时单独运行。
+    作业可以在 run() 运行期间逐个 submit()，全部提交后调用 close()。
+
+    - max_queued: 等待求解的作业数上限，达到上限时 submit() 阻塞（流水线上游的背压）
+    - max_unprocessed: 已开始求解但尚未后处理的作业数上限（限制ODB堆积），
+      名额在 postprocess_done() 时归还；None 表示求解结束即归还
+    - disk: DiskGovernor，磁盘占用超过高水位时暂停启动新的求解，直到正在进行的作业处理完释放空间
+      （没有正在进行的作业时不再暂停，避免永远等待）
+    """
+
+    def __init__(self, node_cpus, node_memory_gb=None, max_queued=None, max_unprocessed=None, disk=None):
+        self.condition = threading.Condition()
+        self.node_cpus = node_cpus
+        # 内存按整数MB记账，避免浮点累加误差导致占满整个节点的作业永远放不下
+        self.node_memory_mb = int(node_memory_gb * 1024) if node_memory_gb else None
+        self.free_cpus = node_cpus
+        self.free_memory_mb = self.node_memory_mb
+        self.max_queued = max_queued
+        self.max_unprocessed = max_unprocessed
+        self.pending = []
+        self.running = 0
+        self.unprocessed = 0
+        self.peak = 0
+        self.closed = False
+        self.disk = disk
+        self.disk_held = False
+
+    def submit(self, job_index, job):
+        """提交作业；等待队列已满时阻塞"""
+        with self.condition:
+            while self.max_queued and len(self.pending) >= self.max_queued:
+                self.condition.wait()
+            self.pending.append((job_index, job))
+            self.condition.notify_all()
+
+    def close(self):
+        """声明不再提交新作业"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def postprocess_done(self):
+        """归还一个未后处理ODB名额"""
+        with self.condition:
+            self.unprocessed -= 1
+            self.condition.notify_all()
+
+    def _clamp(self, job):
+        # 超出整个节点预算的需求按节点预算占用，等待节点空闲后运行
+        cpus, memory_gb = job_requirements(job)
+        cpus = min(cpus, self.node_cpus)
+        memory_mb = int(memory_gb * 1024)
+        if self.node_memory_mb is not None:
+            memory_mb = min(memory_mb, self.node_memory_mb)
+        return cpus, memory_mb
+
+    def _fits(self, cpus, memory_mb):
+        if cpus > self.free_cpus:
+            return False
+        if self.max_unprocessed and self.unprocessed >= self.max_unprocessed:
+            return False
+        return self.free_memory_mb is None or memory_mb <= self.free_memory_mb
+
+    def run(self, solve, on_solved):
+        """
+        调度循环，直到所有作业求解结束
+
+        - solve(job_index, job) -> bool: 在独立线程中执行
+        - on_solved(job_index, job, success): 释放CPU/内存后调用
+        """
+        threads = []
+
+        def run_job(job_index, job, cpus, memory_mb):
+            try:
+                success = solve(job_index, job)
+            except Exception as e:
+                print(f"✗ 任务出错 {job['job_name']}: {e}")
+                success = False
+            with self.condition:
+                self.free_cpus += cpus
+                if self.free_memory_mb is not None:
+                    self.free_memory_mb += memory_mb
+                self.running -= 1
+                if self.max_unprocessed is None:
+                    self.unprocessed -= 1
+                self.condition.notify_all()
+            on_solved(job_index, job, success)
+
+        with self.condition:
+            while not self.closed or self.pending or self.running:
+                disk_full = bool(self.disk is not None and self.pending and self.unprocessed
+                                 and self.disk.over_high_water())
+                if disk_full and not self.disk_held:
+                    self.disk.holds += 1
+                    print(f"磁盘占用超过高水位，暂停启动新的求解: {self.disk.describe()}")
+                self.disk_held = disk_full
+                for item in ([] if disk_full else list(self.pending)):
+                    job_index, job = item
+                    cpus, memory_mb = self._clamp(job)
+                    if not self._fits(cpus, memory_mb):
+                        continue
+                    self.free_cpus -= cpus
+                    if self.free_memory_mb is not None:
+                        self.free_memory_mb -= memory_mb
+                    self.pending.remove(item)
+                    self.running += 1
+                    self.unprocessed += 1
+                    self.peak = max(self.peak, self.running)
+                    thread = threading.Thread(target=run_job, args=(job_index, job, cpus, memory_mb), daemon=True)
+                    threads.append(thread)
+                    thread.start()
+                    self.condition.notify_all()
+                # 磁盘暂停期间定时重新检查占用
+                self.condition.wait(self.disk.interval if disk_full else None)
+
+        for thread in threads:
+            thread.join()
+        return self.peak
+
+
+def run_parallel_solves(jobs, node_cpus, node_memory_gb=None, cae_slots=1, check_interval=30, ledger=None,
+                        monitor=None, disk=None):
+    """
+    Phase 2 资源感知调度：在节点CPU/内存预算内同时运行尽可能多的"求解 + 后处理"作业
+
+    求解器退出后立即归还CPU/内存，后处理（以及等待CAE名额）不占用求解资源
+
+    Returns:
+        (成功数量, 失败作业名列表, 最大同时运行作业数)
+    """
+    cae_semaphore = CaeSlots(cae_slots)
+    dispatcher = SolveDispatcher(node_cpus, node_memory_gb, disk=disk)
+    results = {}
+    start_times = {}
+
+    for job_index, job in enumerate(jobs, 1):
+        dispatcher.submit(job_index, job)
+    dispatcher.close()
+
+    def solve(job_index, job):
+        start_times[job_index] = time.time()
+        return run_solve_step(job, job_index, len(jobs), check_interval, ledger, monitor, disk)
+
+    def on_solved(job_index, job, success):
+        # 此时 SolveDispatcher 已归还该作业的CPU/内存，后处理在同一线程中继续运行
+        if success:
+            success = run_postprocess_step(job, start_times[job_index], cae_semaphore, ledger, disk)
+        results[job_index] = success
+
+    peak = dispatcher.run(solve, on_solved)
+    failed_jobs = [job['job_name'] for job_index, job in enumerate(jobs, 1) if not results.get(job_index)]
+    return len(jobs) - len(failed_jobs), failed_jobs, peak
+
+
+def run_pipeline(jobs, node_cpus, node_memory_gb=None, cae_slots=1, post_slots=1,
+                 max_pending_odbs=2, check_interval=30, ledger=None, monitor=None, disk=None):
+    """
+    流水线执行：前处理、求解、后处理三个阶段重叠进行
+
+    - 前处理: 最多 cae_slots 个并发，.inp生成后立即进入求解队列（队列有上限，满时前处理暂停）
+    - 求解: 由 SolveDispatcher 按节点CPU/内存预算并发运行
+    - 后处理: 最多 post_slots 个并发，求解完成后立即处理ODB，同时下一个求解已在运行
+    - 前处理与后处理共用 cae_slots 个CAE license，有后处理等待时优先分配给后处理
+    - 设置了磁盘预算（disk）时，占用超过高水位暂停启动新的求解
+    - 已开始求解但尚未后处理的作业不超过 max_pending_odbs 个，避免ODB堆积
+    - 按 ledger 记录跳过上次已完成的前处理/求解
+
+    Returns:
+        (成功数量, 失败作业名列表, 最大同时求解作业数, 累计求解时间秒数)
+    """
+    total = len(jobs)
+    cae_semaphore = CaeSlots(cae_slots)
+    dispatcher = SolveDispatcher(node_cpus, node_memory_gb,
+                                 max_queued=max(1, Config.PIPELINE_QUEUE_SIZE),
+                                 max_unprocessed=max(1, max_pending_odbs), disk=disk)
+    post_queue = queue.Queue()
+    results = {}
+    solve_times = []
+    lock = threading.Lock()
+
+    def record(job_index, job, success, message):
+        with lock:
+            results[job_index] = success
+            print(f"[完成 {len(results)}/{total}] {job['job_name']}: {message}")
+
+    # 阶段1: 前处理
+    def preprocess(job_index, job):
+        if ledger is not None and ledger.stage(job['job_name']) in (PREPROCESSED, SOLVED):
+            dispatcher.submit(job_index, job)
+            return
+        cae_semaphore.acquire()
+        try:
+            success, message, _ = run_preprocess_job(job, log_to_file=True)
+        finally:
+            cae_semaphore.release()
+        mark_stage(ledger, job['job_name'], PREPROCESSED if success else FAILED, message)
+        if success:
+            dispatcher.submit(job_index, job)
+        else:
+            if monitor is not None:
+                monitor.cancel_job()
+            record(job_index, job, False, f"{message}，日志: {job['job_name']}_preprocess.log")
+
+    def run_preprocess_stage():
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, cae_slots)) as executor:
+                for future in [executor.submit(preprocess, job_index, job) for job_index, job in enumerate(jobs, 1)]:
+                    future.result()
+        finally:
+            dispatcher.close()
+
+    # 阶段2: 求解
+    def solve(job_index, job):
+        if ledger is not None and ledger.stage(job['job_name']) == SOLVED:
+            return True
+        start_time = time.time()
+        success = run_solver(job, check_interval, monitor, disk)
+        with lock:
+            solve_times.append(time.time() - start_time)
+        if success:
+            mark_stage(ledger, job['job_name'], SOLVED)
+        else:
+            mark_solve_failure(ledger, monitor, job['job_name'])
+        return success
+
+    def on_solved(job_index, job, success):
+        if success:
+            post_queue.put((job_index, job))
+        else:
+            dispatcher.postprocess_done()
+            record(job_index, job, False, "✗ 求解失败")
+
+    # 阶段3: 后处理
+    def run_postprocess_worker():
+        while True:
+            item = post_queue.get()
+            if item is None:
+                return
+            job_index, job = item
+            success = run_postprocess(job, cae_semaphore, disk)
+            mark_stage(ledger, job['job_name'], POSTPROCESSED if success else FAILED, "后处理失败")
+            dispatcher.postprocess_done()
+            record(job_index, job, success, "✓ 任务完成" if success else "✗ 后处理失败")
+
+    preprocess_thread = threading.Thread(target=run_preprocess_stage, daemon=True)
+    post_threads = [threading.Thread(target=run_postprocess_worker, daemon=True) for _ in range(max(1, post_slots))]
+    preprocess_thread.start()
+    for thread in post_threads:
+        thread.start()
+
+    peak = dispatcher.run(solve, on_solved)
+    preprocess_thread.join()
+    for _ in post_threads:
+        post_queue.put(None)
+    for thread in post_threads:
+        thread.join()
+
+    failed_jobs = [job['job_name'] for job_index, job in enumerate(jobs, 1) if not results.get(job_index)]
+    return total - len(failed_jobs), failed_jobs, peak, sum(solve_times)
+
+
+def print_disk_summary(disk):
+    """打印磁盘预算统计（未设置 Config.DISK_BUDGET_GB 时不打印）"""
+    if disk is not None:
+        print(f"磁盘占用峰值: {disk.peak / 1024 ** 3:.1f}GB，删除求解器文件释放 {disk.freed / 1024 ** 3:.1f}GB，"
+              f"因磁盘暂停求解 {disk.holds} 次")
+
+
 def main():
-    """主函数"""
+    """主函数，返回退出码：全部作业成功为0，有作业失败或出错为1，用户中断为130"""
+    parser = argparse.ArgumentParser(description="Abaqus 批量作业调度器")
+    parser.add_argument('--cae-slots', type=int, default=Config.CAE_SLOTS,
+                        help="同时运行的CAE会话数上限（不要超过可用的CAE license数量）")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="流水线模式：前处理、求解、后处理重叠执行，.inp生成后立即开始求解")
+    parser.add_argument('--post-slots', type=int, default=Config.POSTPROCESS_SLOTS,
+                        help="流水线模式下同时运行的后处理数")
+    parser.add_argument('--max-pending-odbs', type=int, default=Config.MAX_PENDING_ODBS,
+                        help="流水线模式下已开始求解但未后处理的作业数上限")
+    parser.add_argument('--rescan', action='store_true',
+                        help="遍历目录树，把作业清单之外的作业目录补充到清单（默认只读取清单）")
+    parser.add_argument('--retry-failed', action='store_true',
+                        help="只重跑上次失败的作业（默认跳过已完成和上次失败的作业）")
+    args = parser.parse_args()
+
     print("""
 ╔═══════════════════════════════════════════════════════════════╗
 ║   Abaqus 批量作业调度器 - 两阶段执行，避免ODB堆积           ║
@@ -164,59 +766,143 @@ def main():
     if not os.path.exists("generate_script"):
         print("错误: 未找到 generate_script 目录")
         print("请先使用UI生成脚本后再运行此调度器")
-        return
+        return 1
 
     try:
         overall_start = time.time()
 
         # 查找所有作业
-        all_jobs = find_all_jobs()
+        all_jobs = find_all_jobs(rescan=args.rescan)
 
         if not all_jobs:
             print("未找到任何作业脚本！")
-            return
+            return 1
 
         print(f"\n找到 {len(all_jobs)} 个作业")
-        print("执行策略: Phase 1批量前处理 → Phase 2逐个求解并后处理")
 
-        # Phase 1: 批量运行所有前处理
-        successful_jobs = run_batch_preprocessing(all_jobs)
+        # 按进度记录跳过已完成的作业，中断后重新运行时从断点继续
+        ledger = JobLedger("generate_script")
+        all_jobs, completed_count, skipped_failed = ledger.plan(all_jobs, args.retry_failed)
+        print(f"已完成 {completed_count} 个，本次运行 {len(all_jobs)} 个")
+        if skipped_failed:
+            print(f"跳过上次失败或停滞的 {len(skipped_failed)} 个作业（使用 --retry-failed 重跑）")
+        if not all_jobs:
+            print("没有需要运行的作业")
+            return 0
+
+        node_cpus, node_memory_gb = detect_node_resources()
+        memory_text = f"{node_memory_gb:.0f}GB" if node_memory_gb else "不限"
+
+        disk = None
+        if Config.DISK_BUDGET_GB > 0:
+            disk = DiskGovernor(Config.DISK_SCRATCH_DIR or "generate_script")
+            print(f"磁盘占用: {disk.describe()}")
+
+        # 最长作业优先：大作业先开始，避免最后少数大作业单独运行拉长总用时
+        history = RuntimeHistory()
+        all_jobs, estimates, in_seconds = history.order_longest_first(all_jobs)
+        known = sum(1 for job in all_jobs if job['key'] in history.records)
+        print(f"按预计求解用时从长到短排序（{known}/{len(all_jobs)} 个作业有历史记录"
+              f"{'，其余按杆件总长和半径估计' if known < len(all_jobs) else ''}）")
+        predicted = None
+        if in_seconds:
+            to_solve = [estimate for job, estimate in zip(all_jobs, estimates) if ledger.stage(job['job_name']) != SOLVED]
+            slots = estimate_solve_slots(node_cpus, node_memory_gb)
+            predicted = predict_makespan(to_solve, slots)
+            print(f"预计求解总用时: {predicted/60:.1f}分钟（{slots} 个作业并发，"
+                  f"串行合计 {sum(to_solve)/60:.1f}分钟）")
+
+        if args.pipeline:
+            print("执行策略: 流水线（前处理 → 求解 → 后处理 重叠执行）")
+            print(f"节点资源预算: {node_cpus} CPU, 内存 {memory_text}；CAE会话: {args.cae_slots}，"
+                  f"后处理并发: {args.post_slots}，未后处理ODB上限: {args.max_pending_odbs}")
+            print("=" * 80)
+
+            monitor = ProgressMonitor("generate_script", sum(1 for job in all_jobs
+                                                             if ledger.stage(job['job_name']) != SOLVED),
+                                      history=history, on_stall=terminate_solver)
+            monitor.start()
+            try:
+                success_count, failed_jobs, peak, solve_time = run_pipeline(
+                    all_jobs, node_cpus, node_memory_gb, args.cae_slots,
+                    args.post_slots, args.max_pending_odbs, ledger=ledger, monitor=monitor, disk=disk
+                )
+            finally:
+                monitor.stop()
+
+            overall_time = time.time() - overall_start
+            print("\n" + "=" * 80)
+            print(f"所有任务完成！")
+            print(f"成功: {success_count}/{len(all_jobs)}")
+            print(f"最大同时求解作业数: {peak}")
+            print(f"累计求解时间: {solve_time/60:.1f}分钟，总用时: {overall_time/60:.1f}分钟")
+            if predicted is not None:
+                print(f"预计求解总用时: {predicted/60:.1f}分钟，实际总用时: {overall_time/60:.1f}分钟")
+            print_disk_summary(disk)
+            if failed_jobs:
+                print(f"失败任务: {', '.join(failed_jobs)}")
+            print("=" * 80)
+            return 1 if failed_jobs else 0
+
+        print("执行策略: Phase 1批量前处理 → Phase 2按资源预算并发求解并后处理")
+
+        # Phase 1: 批量运行所有前处理（上次已生成.inp的作业跳过）
+        run_batch_preprocessing(
+            [job for job in all_jobs if ledger.stage(job['job_name']) is None], args.cae_slots, ledger
+        )
+        successful_jobs = [job for job in all_jobs if ledger.stage(job['job_name']) in (PREPROCESSED, SOLVED)]
 
         if not successful_jobs:
             print("\n所有前处理均失败，退出")
-            return
+            return 1
 
-        # Phase 2: 逐个提交求解器并后处理
+        # Phase 2: 在节点资源预算内并发求解，每个作业求解完立即后处理
         print("\n" + "=" * 80)
-        print("Phase 2: 逐个求解并后处理（避免ODB堆积）")
+        print("Phase 2: 并发求解并后处理（求解完立即处理ODB，避免堆积）")
+        print(f"节点资源预算: {node_cpus} CPU, 内存 {memory_text}；"
+              f"单作业默认需求: {Config.SOLVER_CPUS} CPU, {Config.SOLVER_MEMORY_GB:g}GB")
         print("=" * 80)
 
-        success_count = 0
-        failed_jobs = []
-
-        for i, job in enumerate(successful_jobs, 1):
-            if run_solve_and_postprocess(job, i, len(successful_jobs)):
-                success_count += 1
-            else:
-                failed_jobs.append(job['job_name'])
+        phase2_start = time.time()
+        monitor = ProgressMonitor("generate_script", sum(1 for job in successful_jobs
+                                                         if ledger.stage(job['job_name']) != SOLVED),
+                                  history=history, on_stall=terminate_solver)
+        monitor.start()
+        try:
+            success_count, failed_jobs, peak = run_parallel_solves(
+                successful_jobs, node_cpus, node_memory_gb, args.cae_slots, ledger=ledger, monitor=monitor,
+                disk=disk
+            )
+        finally:
+            monitor.stop()
+        phase2_time = time.time() - phase2_start
 
         # 总结
         overall_time = time.time() - overall_start
         print("\n" + "=" * 80)
         print(f"所有任务完成！")
         print(f"成功: {success_count}/{len(successful_jobs)}")
+        print(f"Phase 2 最大同时运行作业数: {peak}，用时: {phase2_time/60:.1f}分钟")
+        if predicted is not None:
+            print(f"预计求解总用时: {predicted/60:.1f}分钟，实际 Phase 2 用时: {phase2_time/60:.1f}分钟（含后处理）")
+        print_disk_summary(disk)
         if failed_jobs:
             print(f"失败任务: {', '.join(failed_jobs)}")
         print(f"总用时: {overall_time/60:.1f}分钟")
         print("=" * 80)
+        # 前处理失败的作业不在 Phase 2 中，按全部作业计算
+        return 1 if failed_jobs or len(successful_jobs) < len(all_jobs) else 0
 
     except KeyboardInterrupt:
+        _interrupted.set()
         print("\n\n用户中断，退出...")
+        return 130
     except Exception as e:
         print(f"\n错误: {e}")
         import traceback
         traceback.print_exc()
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -240,11 +240,52 @@ def generate_split_shell_script(preprocess_files: List[str], postprocess_files:
         "echo 'Minimizing CAE License Usage'",
         "echo '========================================'",
         "echo",
-        "",
+        ""
+    ]
+
+    if Config.RUN_ALL_COMPACT:
+        # 固定的驱动脚本 + 作业列表，脚本大小与作业数无关
+        from shell_script_generator import (job_list_driver_header, job_list_two_phase_loop,
+                                            pair_job_scripts, write_job_list)
+        job_list_name = f"run_all_optimized_{timestamp}.jobs"
+        write_job_list(pair_job_scripts(preprocess_files_unix, postprocess_files_unix),
+                       os.path.join(output_dir, job_list_name))
+        content.extend(job_list_driver_header(job_list_name))
+        content.extend(job_list_two_phase_loop())
+    else:
+        content.extend(_unrolled_split_shell_loop(preprocess_files_unix, postprocess_files_unix))
+
+    # 结束
+    content.extend([
+        "echo '========================================'",
+        "echo 'All tasks completed!'",
+        "echo '========================================'",
+        "echo",
+        "read -p 'Press Enter to exit...'"
+    ])
+
+    # 写入文件（使用Unix换行符）
+    with open(script_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(content))
+
+    # 设置执行权限
+    try:
+        import stat
+        os.chmod(script_path, os.stat(script_path).st_mode | stat.S_IEXEC)
+    except Exception as e:
+        print(f"Warning: Could not set execute permission: {e}")
+
+    print(f"Optimized shell script generated: {script_path}")
+    return script_path
+
+
+def _unrolled_split_shell_loop(preprocess_files_unix: List[str], postprocess_files_unix: List[str]) -> List[str]:
+    """逐作业展开的两阶段循环体（RUN_ALL_COMPACT=0 时使用）"""
+    content = [
         "# ========================================",
         "# Phase 1: Submit All Preprocessing Scripts",
         "# ========================================",
-        f"echo 'Phase 1: Submitting {len(preprocess_files)} preprocessing scripts...'",
+        f"echo 'Phase 1: Submitting {len(preprocess_files_unix)} preprocessing scripts...'",
         "echo",
         ""
     ]
@@ -253,7 +294,7 @@ def generate_split_shell_script(preprocess_files: List[str], postprocess_files:
     for i, pf in enumerate(preprocess_files_unix, 1):
         script_name = os.path.basename(pf)
         content.extend([
-            f"echo '[{i}/{len(preprocess_files)}] Submitting: {script_name}'",
+            f"echo '[{i}/{len(preprocess_files_unix)}] Submitting: {script_name}'",
             f"abaqus cae noGUI=\"{pf}\"",
             "if [ $? -ne 0 ]; then",
             f"    echo 'ERROR: Failed to submit {script_name}'",
@@ -286,7 +327,7 @@ def generate_split_shell_script(preprocess_files: List[str], postprocess_files:
 
         content.extend([
             f"echo '========================================'",
-            f"echo '[{i}/{len(preprocess_files)}] Processing: {job_name}'",
+            f"echo '[{i}/{len(preprocess_files_unix)}] Processing: {job_name}'",
             f"echo '========================================'",
             f"cd \"{script_dir}\"",
             "",
@@ -363,25 +404,4 @@ def generate_split_shell_script(preprocess_files: List[str], postprocess_files:
         ""
     ])
 
-    # 结束
-    content.extend([
-        "echo '========================================'",
-        "echo 'All tasks completed!'",
-        "echo '========================================'",
-        "echo",
-        "read -p 'Press Enter to exit...'"
-    ])
-
-    # 写入文件（使用Unix换行符）
-    with open(script_path, 'w', encoding='utf-8', newline='\n') as f:
-        f.write('\n'.join(content))
-
-    # 设置执行权限
-    try:
-        import stat
-        os.chmod(script_path, os.stat(script_path).st_mode | stat.S_IEXEC)
-    except Exception as e:
-        print(f"Warning: Could not set execute permission: {e}")
-
-    print(f"Optimized shell script generated: {script_path}")
-    return script_path
+    return content
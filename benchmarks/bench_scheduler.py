@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+批量调度器吞吐量基准测试 - 用 Abaqus 替身 (fake_abaqus.py) 在本机运行 batch_runner.py
+和生成的 run_all_*.sh / master_control_*.sh，对比不同执行策略的总用时、每小时完成作业数和CPU空闲比例
+
+执行策略:
+    serial          batch_runner.py 原调度方式：节点预算只够一个求解作业，作业逐个求解
+    two-phase       batch_runner.py 先批量前处理，再按节点资源预算并发求解并后处理
+    pipeline        batch_runner.py 前处理、求解、后处理重叠执行 (--pipeline)
+    run_all         生成的 run_all_*.sh：先全部前处理，再逐个求解并后处理
+    run_all-jobs    生成的 run_all_*.sh 并发模式 (RUN_ALL_MAX_JOBS)，CAE会话和求解按 flock 槽位限制
+    master_control  每种晶胞一个 run_all_scripts_*.sh，由 qt_interface 生成的 master_control_*.sh
+                    错峰并行启动（需要能导入 qt_interface，即安装了 PyQt5；否则跳过）
+
+batch_runner 各策略使用统一的 SOLVER_CPUS（SOLVER_SCALE_REQUIREMENTS=0），与 run_all 脚本一致
+
+CPU空闲比例 = 1 - Σ(求解用时 × 求解CPU数) / (节点CPU数 × 总用时)，各策略都按同一个节点CPU数计算
+
+用法:
+    python benchmarks/bench_scheduler.py
+    python benchmarks/bench_scheduler.py --solve 10 --node-cpus 32 --solver-cpus 8 --cae-slots 2
+    python benchmarks/bench_scheduler.py --strategies two-phase pipeline --fail-rate 0.1
+    python benchmarks/bench_scheduler.py --strategies pipeline run_all run_all-jobs --run-all-jobs 6
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from config import Config
+from job_manifest import load_job_records, resolve_job_path
+from script_generator import generate_sweep, parse_mode
+from shell_script_generator import generate_shell_script
+
+RUNNER_STRATEGIES = ('serial', 'two-phase', 'pipeline')
+SCRIPT_STRATEGIES = ('run_all', 'run_all-jobs', 'master_control')
+STRATEGIES = RUNNER_STRATEGIES + SCRIPT_STRATEGIES
+
+
+def build_task_tree(task_dir, args):
+    """用脚本生成器生成基准测试用的任务目录"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = generate_sweep(args.cell_types, args.sizes, args.radii, sliders=[args.slider],
+                                 modes=[parse_mode(mode) for mode in args.modes], workers=1,
+                                 output_dir=task_dir, track_files=False)
+    failed = [result['message'] for result in results if not result['success']]
+    if failed:
+        raise RuntimeError(f"脚本生成失败: {failed[0]}")
+    return len(results)
+
+
+def solve_slots(args):
+    return max(1, args.node_cpus // args.solver_cpus)
+
+
+def strategy_command(strategy, args):
+    """返回 (batch_runner 参数, 节点CPU预算)"""
+    if strategy == 'serial':
+        return ['--cae-slots', '1'], args.solver_cpus
+    command = ['--cae-slots', str(args.cae_slots)]
+    if strategy == 'pipeline':
+        max_pending = args.max_pending_odbs or solve_slots(args) + args.post_slots
+        command += ['--pipeline', '--post-slots', str(args.post_slots), '--max-pending-odbs', str(max_pending)]
+    return command, args.node_cpus
+
+
+def write_run_scripts(strategy, task_dir, args):
+    """
+    在任务目录副本中生成 run_all / master_control 脚本，返回要执行的脚本路径
+
+    master_control 需要 qt_interface，无法导入时抛出 ImportError
+    """
+    records = load_job_records(task_dir)
+    files = [resolve_job_path(task_dir, record[key]) for record in records for key in ('preprocess', 'postprocess')]
+    saved = Config.RUN_ALL_MAX_JOBS, Config.CAE_SLOTS
+    try:
+        Config.CAE_SLOTS = args.cae_slots
+        if strategy == 'run_all':
+            Config.RUN_ALL_MAX_JOBS = 1
+            return generate_shell_script(files, task_dir, "sh", config_name="bench")
+        if strategy == 'run_all-jobs':
+            Config.RUN_ALL_MAX_JOBS = args.run_all_jobs or solve_slots(args) + args.post_slots
+            return generate_shell_script(files, task_dir, "sh", config_name="bench")
+
+        from qt_interface import ModernInterface
+        Config.RUN_ALL_MAX_JOBS = 1
+        for group_number, cell_type in enumerate(args.cell_types, 1):
+            generate_shell_script([path for path in files if os.path.basename(path).startswith(cell_type + "_")],
+                                  task_dir, "sh", group_number=group_number)
+        ModernInterface.generate_master_control_script(SimpleNamespace(current_task_dir=task_dir))
+        scripts = sorted(name for name in os.listdir(task_dir) if name.startswith("master_control_"))
+        return os.path.join(task_dir, scripts[-1]) if scripts else None
+    finally:
+        Config.RUN_ALL_MAX_JOBS, Config.CAE_SLOTS = saved
+
+
+def read_trace(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def run_strategy(strategy, template_dir, work_root, args):
+    """在任务目录的独立副本中运行一次 batch_runner.py 或生成的运行脚本，返回统计结果（无法运行时返回 None）"""
+    run_dir = os.path.join(work_root, strategy)
+    task_dir = os.path.join(run_dir, "generate_script")
+    shutil.copytree(template_dir, task_dir)
+    trace_path = os.path.join(run_dir, "trace.jsonl")
+
+    if strategy in RUNNER_STRATEGIES:
+        flags, node_cpus = strategy_command(strategy, args)
+        command, cwd = [sys.executable, os.path.join(REPO_DIR, "batch_runner.py")] + flags, run_dir
+    else:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                script = write_run_scripts(strategy, task_dir, args)
+        except ImportError as e:
+            print(f"  跳过 {strategy}: 无法导入 qt_interface ({e})")
+            return None
+        if script is None:
+            print(f"  跳过 {strategy}: 未生成运行脚本")
+            return None
+        node_cpus = args.node_cpus
+        command, cwd = ['bash', script], task_dir
+
+    env = dict(os.environ)
+    env.update({
+        'PATH': os.path.join(BENCH_DIR, "fakebin") + os.pathsep + env.get('PATH', ''),
+        'NODE_CPUS': str(node_cpus),
+        'NODE_MEM_GB': str(max(1, node_cpus // args.solver_cpus) * 8),
+        'SOLVER_CPUS': str(args.solver_cpus),
+        'SOLVER_MEM_GB': '8',
+        'SOLVER_SCALE_REQUIREMENTS': '0',
+        # 生成的 run_all 脚本: PBS 工作目录、并发模式的CPU预算
+        'PBS_O_WORKDIR': task_dir,
+        'CPU_BUDGET': str(node_cpus),
+        'CAE_SLOTS': str(args.cae_slots),
+        'FAKE_ABAQUS_PYTHON': sys.executable,
+        'FAKE_ABAQUS_PRE': str(args.pre),
+        'FAKE_ABAQUS_SOLVE': str(args.solve),
+        'FAKE_ABAQUS_POST': str(args.post),
+        'FAKE_ABAQUS_JITTER': str(args.jitter),
+        'FAKE_ABAQUS_FAIL_RATE': str(args.fail_rate),
+        'FAKE_ABAQUS_CPU_BURN': str(args.cpu_burn),
+        'FAKE_ABAQUS_TRACE': trace_path,
+    })
+
+    start = time.time()
+    with open(os.path.join(run_dir, "run.log"), 'w', encoding='utf-8') as log:
+        # 生成的运行脚本结束时等待回车（read -p），输入一个换行
+        returncode = subprocess.run(command, cwd=cwd, env=env, input=b"\n",
+                                    stdout=log, stderr=subprocess.STDOUT).returncode
+    makespan = time.time() - start
+
+    records = read_trace(trace_path)
+    solve_core_seconds = sum((record['end'] - record['start']) * record['cpus']
+                             for record in records if record['stage'] == 'solve')
+    completed = sum(1 for record in records if record['stage'] == 'post' and record['ok'])
+    return {
+        'strategy': strategy,
+        'returncode': returncode,
+        'makespan': makespan,
+        'completed': completed,
+        'jobs_per_hour': completed / makespan * 3600 if makespan else 0.0,
+        'idle_fraction': 1 - solve_core_seconds / (args.node_cpus * makespan) if makespan else 1.0,
+        'log': os.path.join(run_dir, "run.log"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="批量调度器吞吐量基准测试")
+    parser.add_argument('--strategies', nargs='+', choices=STRATEGIES, default=list(STRATEGIES), help="要测试的执行策略")
+    parser.add_argument('--cell-types', nargs='+', default=['BCC', 'FCC', 'Kelvin'], help="晶胞类型")
+    parser.add_argument('--sizes', nargs='+', type=float, default=[4.0], help="晶胞尺寸")
+    parser.add_argument('--radii', nargs='+', type=float, default=[0.3, 0.5], help="杆件半径")
+    parser.add_argument('--slider', type=int, default=4, help="slider值")
+    parser.add_argument('--modes', nargs='+', default=['static', '50'], help="加载模式")
+    parser.add_argument('--pre', type=float, default=0.5, help="替身前处理用时（秒）")
+    parser.add_argument('--solve', type=float, default=6.0, help="替身求解基准用时（秒，按作业大小缩放）")
+    parser.add_argument('--post', type=float, default=0.5, help="替身后处理用时（秒）")
+    parser.add_argument('--jitter', type=float, default=0.2, help="用时随机波动比例")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="求解失败概率")
+    parser.add_argument('--cpu-burn', type=float, default=0.0, help="求解期间每个CPU的占用比例 (0-1)")
+    parser.add_argument('--node-cpus', type=int, default=16, help="节点CPU数")
+    parser.add_argument('--solver-cpus', type=int, default=4, help="每个求解作业的CPU数")
+    parser.add_argument('--cae-slots', type=int, default=2, help="CAE会话数 (serial 策略固定为1)")
+    parser.add_argument('--post-slots', type=int, default=1, help="流水线模式后处理并发数")
+    parser.add_argument('--max-pending-odbs', type=int, default=0,
+                        help="流水线模式未后处理ODB上限，0表示 求解并发数 + 后处理并发数")
+    parser.add_argument('--run-all-jobs', type=int, default=0,
+                        help="run_all-jobs 策略同时运行的作业数，0表示 求解并发数 + 后处理并发数")
+    parser.add_argument('--keep', action='store_true', help="保留运行目录（含运行日志和替身调用记录）")
+    args = parser.parse_args()
+
+    work_root = tempfile.mkdtemp(prefix="bench_scheduler_")
+    try:
+        template_dir = os.path.join(work_root, "template", "generate_script")
+        job_count = build_task_tree(template_dir, args)
+        print(f"{job_count} 个作业，节点 {args.node_cpus} CPU，每个求解 {args.solver_cpus} CPU；"
+              f"替身用时 前处理 {args.pre}s / 求解 {args.solve}s / 后处理 {args.post}s")
+
+        results = []
+        for strategy in args.strategies:
+            print(f"运行 {strategy} ...", flush=True)
+            result = run_strategy(strategy, template_dir, work_root, args)
+            if result is not None:
+                results.append(result)
+
+        print(f"\n{'策略':<16}{'总用时(s)':>12}{'完成':>8}{'作业/小时':>12}{'CPU空闲':>10}")
+        for result in results:
+            print(f"{result['strategy']:<16}{result['makespan']:>12.1f}{result['completed']:>8}"
+                  f"{result['jobs_per_hour']:>12.0f}{result['idle_fraction']:>10.0%}")
+        for result in results:
+            if result['returncode']:
+                print(f"警告: {result['strategy']} 退出码为 {result['returncode']}，见 {result['log']}")
+    finally:
+        if args.keep:
+            print(f"\n运行目录: {work_root}")
+        else:
+            shutil.rmtree(work_root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+结构注册表基准测试 - 对比"每次构建全部结构"与"按需构建 + 缓存"
+覆盖全部 20 种晶胞 × 9 个slider值
+
+用法:
+    python benchmarks/bench_structure_registry.py
+    python benchmarks/bench_structure_registry.py --rounds 20
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import structure_set
+from config import Config
+from structure_set import get_crystal_structure, get_structure_geometry, list_structures
+
+
+def eager_lookup(structure_name, slider):
+    """原实现的等价做法：每次调用都构建全部结构，再取出所需的一个"""
+    structures = {name: builder(slider) for name, builder in structure_set._STRUCTURE_BUILDERS.items()}
+    return structures.get(structure_name)
+
+
+def clear_caches():
+    """清空结构几何缓存"""
+    get_structure_geometry.cache_clear()
+
+
+def timed(func, combos, rounds, before_round=None):
+    """对全部组合执行 rounds 轮，返回平均每次调用耗时（微秒）"""
+    elapsed = 0.0
+    for _ in range(rounds):
+        if before_round:
+            before_round()
+        start = time.perf_counter()
+        for structure_name, slider in combos:
+            func(structure_name, slider)
+        elapsed += time.perf_counter() - start
+    return elapsed / (rounds * len(combos)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="结构注册表基准测试")
+    parser.add_argument('--rounds', type=int, default=10, help="重复轮数")
+    args = parser.parse_args()
+
+    cell_types = [cell_type for _, cell_types in Config.CELL_TYPE_GROUPS for cell_type in cell_types]
+    combos = [(cell_type, slider) for cell_type in cell_types for slider in range(*Config.SLIDER_RANGE)]
+
+    # 列出结构名称不应触发任何构建
+    clear_caches()
+    list_structures()
+    assert get_structure_geometry.cache_info().currsize == 0
+
+    results = [
+        ("全部构建（原实现）", timed(eager_lookup, combos, args.rounds)),
+        ("按需构建（无缓存）", timed(get_crystal_structure, combos, args.rounds, before_round=clear_caches)),
+        ("按需构建（已缓存）", timed(get_crystal_structure, combos, args.rounds)),
+        ("结构几何（已缓存）", timed(get_structure_geometry, combos, args.rounds)),
+    ]
+
+    baseline = results[0][1]
+    print("=" * 60)
+    print(f"组合数量: {len(combos)} ({len(cell_types)} 种晶胞 × {Config.SLIDER_RANGE[1]} 个slider), 轮数: {args.rounds}")
+    for label, per_call in results:
+        print(f"{label}: {per_call:10.1f} µs/次  ({baseline / per_call:8.1f}x)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+模板引擎基准测试 - 对比逐次 re.sub 替换（legacy_renderer.py）与编译模板单次拼接的每秒生成脚本数，
+并将编译模板生成的前处理脚本与 template_baseline.json 中保存的基线输出比对
+
+基线为模板引擎改写之前的生成器对参考网格（全部晶胞 × slider 4 × 尺寸 4/5/10 × 半径 0.3/0.5 × 6种模式）
+生成的脚本内容的 SHA-256。比对前对新输出做两处已知的有意变化的还原：
+    - 坐标/圆柱体连接行的空格统一为 'A = [-2, 2, 2]' 形式（两边都按此规范化）
+    - 尺寸10时，原先的逐次替换把内部切割矩形 (±5.0) 又改写成外部矩形的 (±10.0)，
+      编译模板修正了这一问题；比对时按原行为还原，以确认其余内容不变
+    - 截角立方八面体的顶点原先以4位小数的字符串保存，缩放后（尺寸≠5）末位与完整精度不同；
+      比对时用舍入到4位小数的几何重新生成这些脚本
+
+用法:
+    python benchmarks/bench_template_engine.py
+    python benchmarks/bench_template_engine.py --cells BCC FCC --sizes 5 10 --radii 0.3
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from script_generator import AbaqusScriptGenerator
+from legacy_renderer import render_legacy
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "template_baseline.json")
+
+# (speed, direction) 组合，对应界面上的全部生成模式
+MODES = [(None, None), ("50", None), ("500", None), (None, "X"), (None, "X_50"), (None, "X_500")]
+
+
+def build_jobs(generator, cell_types, sliders, sizes, radii):
+    """预先准备所有作业的输入（结构数据、模板、文件名），不计入计时"""
+    jobs = []
+    templates = {}
+    for cell_type in cell_types:
+        for slider in sliders:
+            structure_data = generator._get_structure_data(cell_type, slider)
+            for cell_size in sizes:
+                for cell_radius in radii:
+                    for speed_value, direction_value in MODES:
+                        key = (speed_value, direction_value)
+                        if key not in templates:
+                            templates[key] = generator._read_template(speed_value, direction_value)
+                        filename = generator._generate_filename(cell_type, cell_size, cell_radius, slider, speed_value, direction_value)
+                        output_dir = generator._build_hierarchical_path('generate_script', cell_type, cell_size, cell_radius, slider, speed_value, direction_value)
+                        jobs.append((templates[key], structure_data, cell_size, cell_radius, slider,
+                                     speed_value, direction_value, output_dir, filename))
+    return jobs
+
+
+def normalize(text):
+    """统一坐标行和圆柱体连接中的空格"""
+    text = re.sub(r'^(\w+)\s*=\s*\[([^\]\n]*)\]$',
+                  lambda m: f"{m.group(1)} = [{', '.join(part.strip() for part in m.group(2).split(','))}]",
+                  text, flags=re.MULTILINE)
+    return re.sub(r'\(\s*(\w+)\s*,\s*(\w+)\s*\)', r'(\1, \2)', text)
+
+
+def as_original(text, cell_size):
+    """还原尺寸10时原先逐次替换对内部切割矩形的二次改写"""
+    if float(cell_size) / 2 == 5.0:
+        outer = float(cell_size)
+        text = re.sub(r'point1=\(-5\.0, -5\.0\)', f'point1=(-{outer}, -{outer})', text)
+        text = re.sub(r'point2=\(5\.0, 5\.0\)', f'point2=({outer}, {outer})', text)
+    return text
+
+
+def with_original_geometry(generator, job, content):
+    """截角立方八面体按原先4位小数的顶点坐标重新生成，其余脚本原样返回"""
+    geometry = job[1]
+    if geometry.name != 'Truncated_Octoctahedron':
+        return content
+    return generator._generate_script_content(job[0], geometry._replace(nodes=np.round(geometry.nodes, 4)), *job[2:])
+
+
+def compare_with_baseline(generator, jobs, results):
+    """返回 (在基线范围内的脚本数, 不一致的文件名列表)"""
+    with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['sha256']
+    checked, mismatches = 0, []
+    for job, content in zip(jobs, results):
+        filename, cell_size = job[-1], job[2]
+        expected = baseline.get(filename)
+        if expected is None:
+            continue
+        checked += 1
+        content = with_original_geometry(generator, job, content)
+        digest = hashlib.sha256(normalize(as_original(content, cell_size)).encode('utf-8')).hexdigest()
+        if digest != expected:
+            mismatches.append(filename)
+    return checked, mismatches
+
+
+def run(render, jobs):
+    """依次生成所有脚本，返回 (结果列表, 耗时秒数)"""
+    start = time.perf_counter()
+    results = [render(*job) for job in jobs]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="模板引擎基准测试")
+    parser.add_argument('--cells', nargs='+', default=[c for _, cells in Config.CELL_TYPE_GROUPS for c in cells],
+                        help="晶胞类型")
+    parser.add_argument('--sliders', nargs='+', type=int, default=list(range(9)), help="滑块值")
+    parser.add_argument('--sizes', nargs='+', type=float, default=[4.0, 5.0, 10.0], help="单元尺寸")
+    parser.add_argument('--radii', nargs='+', type=float, default=[0.3, 0.4, 0.5], help="支柱半径")
+    args = parser.parse_args()
+
+    generator = AbaqusScriptGenerator()
+
+    # 生成过程中的调试输出会严重干扰计时，全部丢弃
+    with contextlib.redirect_stdout(io.StringIO()):
+        jobs = build_jobs(generator, args.cells, args.sliders, args.sizes, args.radii)
+        _, legacy_time = run(lambda *job: render_legacy(generator, *job), jobs)
+        compiled_results, compiled_time = run(generator._generate_script_content, jobs)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        checked, mismatches = compare_with_baseline(generator, jobs, compiled_results)
+
+    total = len(jobs)
+    print("=" * 60)
+    print(f"脚本数量: {total}")
+    print(f"逐次替换: {legacy_time:.2f}s  ({total / legacy_time:.0f} 脚本/秒)")
+    print(f"编译模板: {compiled_time:.2f}s  ({total / compiled_time:.0f} 脚本/秒)")
+    print(f"加速比: {legacy_time / compiled_time:.2f}x")
+    print(f"与基线一致: {checked - len(mismatches)}/{checked}（{total - checked} 个脚本不在基线参考网格内）")
+    print("=" * 60)
+
+    if mismatches:
+        print("与基线不一致的脚本:")
+        for filename in mismatches[:20]:
+            print(f"  {filename}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Abaqus 替身 - 没有 Abaqus license 时用于测试和评测批量调度器（batch_runner.py、生成的 run_all_*.sh 等）
+
+支持的命令（与调度器的调用方式一致）:
+    abaqus cae noGUI=<job>_preprocess.py      生成 <job>.inp
+    abaqus job=<job> input=<job>.inp cpus=N interactive
+                                              生成 .lck/.sta/.odb 及求解器中间文件
+    abaqus cae noGUI=<job>_postprocess.py     读取 .odb，生成 feature_data.txt 并删除 .odb
+    abaqus terminate job=<job>                终止正在运行的求解
+
+用法:
+    将 benchmarks/fakebin 加入 PATH，之后 "abaqus" 命令即由本脚本处理
+    （FAKE_ABAQUS_PYTHON 指定运行本脚本的 Python，需能导入 numpy）
+
+环境变量:
+    FAKE_ABAQUS_PRE / FAKE_ABAQUS_SOLVE / FAKE_ABAQUS_POST
+                            前处理/求解/后处理的基准用时（秒），默认 0.5 / 5 / 0.5
+    FAKE_ABAQUS_JITTER      用时随机波动比例，默认 0.2（按作业名确定，重复运行结果一致）
+    FAKE_ABAQUS_SIZE_SCALE  为 1 时求解用时按 杆件总长×尺寸×半径²/网格尺寸³ 相对 BCC/4/0p3 缩放，默认 1
+    FAKE_ABAQUS_FAIL_RATE   求解失败概率，默认 0
+    FAKE_ABAQUS_CPU_BURN    求解期间每个CPU的占用比例 (0-1)，默认 0（只等待，不占用CPU）
+    FAKE_ABAQUS_ODB_MB      生成的ODB大小（MB），默认 1
+    FAKE_ABAQUS_TRACE       设置后将每次调用的阶段、起止时间、CPU数追加到该JSONL文件
+"""
+import json
+import multiprocessing
+import os
+import random
+import signal
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STA_ROWS = 20
+REFERENCE_KEY = "BCC/4/0p3/0/static"
+
+
+def env_float(name, default):
+    return float(os.environ.get(name, default))
+
+
+def job_rng(job_name, stage):
+    """按作业名和阶段确定的随机数，重复运行时同一作业的用时和失败情况不变"""
+    return random.Random(f"{job_name}:{stage}")
+
+
+def job_mode():
+    """作业目录的最后一层即模式: static / 50 / 500 / X / X_50 / X_500"""
+    return os.path.basename(os.getcwd())
+
+
+def size_factor():
+    """当前作业相对参考作业的计算量（由作业目录层级 cell_type/size/radius/slider/mode 估计）"""
+    if os.environ.get('FAKE_ABAQUS_SIZE_SCALE', '1') != '1':
+        return 1.0
+    from runtime_history import static_estimate
+    key = '/'.join(os.path.normpath(os.getcwd()).split(os.sep)[-5:])
+    estimate, reference = static_estimate(key), static_estimate(REFERENCE_KEY)
+    return estimate / reference if estimate and reference else 1.0
+
+
+def duration(stage, job_name, base):
+    jitter = env_float('FAKE_ABAQUS_JITTER', 0.2)
+    return max(0.0, base * (1 + jitter * job_rng(job_name, stage).uniform(-1, 1)))
+
+
+def trace(stage, job_name, start, ok, cpus=0):
+    path = os.environ.get('FAKE_ABAQUS_TRACE')
+    if not path:
+        return
+    record = {'stage': stage, 'job': job_name, 'start': start, 'end': time.time(), 'cpus': cpus, 'ok': ok}
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+def burn(fraction):
+    """按占用比例循环占用一个CPU"""
+    while True:
+        busy_until = time.perf_counter() + 0.1 * fraction
+        while time.perf_counter() < busy_until:
+            pass
+        time.sleep(0.1 * (1 - fraction))
+
+
+def preprocess(job_name):
+    start = time.time()
+    time.sleep(duration('pre', job_name, env_float('FAKE_ABAQUS_PRE', 0.5)))
+    if '50' in job_mode():
+        step = "*Dynamic, Explicit\n, 0.015\n"
+    else:
+        step = "*Static\n0.01, 1., 1e-05, 0.1\n"
+    with open(f"{job_name}.inp", 'w') as f:
+        f.write(f"*Heading\n** fake abaqus input for {job_name}\n*Step, name=Step-1, nlgeom=YES\n{step}*End Step\n")
+    with open('density_temp.txt', 'w') as f:
+        f.write("0.1")
+    print(f"Preprocessing completed: {job_name}.inp")
+    trace('pre', job_name, start, True)
+    return 0
+
+
+def solve(job_name, cpus):
+    start = time.time()
+    explicit = '50' in job_mode()
+    period = 0.015 if explicit else 1.0
+    total = duration('solve', job_name, env_float('FAKE_ABAQUS_SOLVE', 5)) * size_factor()
+    fail_at = None
+    rng = job_rng(job_name, 'fail')
+    if rng.random() < env_float('FAKE_ABAQUS_FAIL_RATE', 0):
+        fail_at = rng.randint(1, STA_ROWS - 1)
+
+    lck_file = f"{job_name}.lck"
+    open(lck_file, 'w').close()
+    with open(f"{job_name}.fakepid", 'w') as f:
+        f.write(str(os.getpid()))
+
+    burners = []
+    burn_fraction = env_float('FAKE_ABAQUS_CPU_BURN', 0)
+    if burn_fraction > 0:
+        for _ in range(min(cpus, os.cpu_count() or 1)):
+            burner = multiprocessing.Process(target=burn, args=(min(1.0, burn_fraction),), daemon=True)
+            burner.start()
+            burners.append(burner)
+
+    # 被 abaqus terminate 终止时也要清理CPU占用进程和.lck
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    completed = False
+    try:
+        with open(f"{job_name}.sta", 'w') as sta:
+            sta.write(f" Abaqus/{'Explicit' if explicit else 'Standard'} (fake)\n")
+            if explicit:
+                sta.write("  INCREMENT  STEP TIME  TOTAL TIME  CPU TIME  STABLE INC  CRITICAL ELEMENT  KINETIC ENERGY  TOTAL ENERGY\n")
+            else:
+                sta.write(" STEP  INC ATT SEVERE EQUIL TOTAL  TOTAL      STEP       INC OF\n")
+            sta.flush()
+            for row in range(1, STA_ROWS + 1):
+                time.sleep(total / STA_ROWS)
+                if row == fail_at:
+                    break
+                time_value = period * row / STA_ROWS
+                if explicit:
+                    sta.write(f"  {row * 1000:9d}  {time_value:.3E}  {time_value:.3E}  00:00:{row:02d}  "
+                              f"1.000E-07  1  0.000E+00  0.000E+00\n")
+                else:
+                    sta.write(f"    1  {row:4d}   1     0     3     3  {time_value:.4f}  {time_value:.4f}  "
+                              f"{period / STA_ROWS:.4f}\n")
+                sta.flush()
+            completed = fail_at is None
+            if completed:
+                with open(f"{job_name}.odb", 'wb') as f:
+                    f.truncate(int(env_float('FAKE_ABAQUS_ODB_MB', 1) * 1024 * 1024))
+                for extension in ('.stt', '.mdl', '.res', '.prt'):
+                    with open(job_name + extension, 'wb') as f:
+                        f.truncate(64 * 1024)
+                sta.write(" THE ANALYSIS HAS COMPLETED SUCCESSFULLY\n")
+            else:
+                sta.write(" THE ANALYSIS HAS NOT BEEN COMPLETED\n")
+    finally:
+        for burner in burners:
+            burner.terminate()
+        for path in (lck_file, f"{job_name}.fakepid"):
+            if os.path.exists(path):
+                os.remove(path)
+        trace('solve', job_name, start, completed, cpus)
+
+    print(f"Abaqus JOB {job_name} {'COMPLETED' if completed else 'exited with errors'}")
+    return 0 if completed else 1
+
+
+def postprocess(job_name):
+    start = time.time()
+    time.sleep(duration('post', job_name, env_float('FAKE_ABAQUS_POST', 0.5)))
+    odb_file = f"{job_name}.odb"
+    if not os.path.exists(odb_file):
+        print("ERROR: ODB file does not exist!")
+        trace('post', job_name, start, False)
+        return 1
+
+    # 与生成的后处理脚本输出格式一致
+    with open('feature_data.txt', 'w') as f:
+        f.write(f"{job_name}\nstatus: successful\ndensity: 0.1\nU2 RF2\n\n            X               Y\n\n")
+        for i in range(1, 51):
+            displacement = i * 0.02
+            f.write(f"  {displacement:14.6E}  {1000 * displacement * (1.2 - displacement):14.6E}\n")
+    os.remove(odb_file)
+    print("Post-processing completed successfully!")
+    trace('post', job_name, start, True)
+    return 0
+
+
+def terminate(job_name):
+    try:
+        with open(f"{job_name}.fakepid") as f:
+            os.kill(int(f.read().strip()), signal.SIGTERM)
+    except (OSError, ValueError) as e:
+        print(f"terminate: no running job {job_name} ({e})")
+        return 1
+    return 0
+
+
+def main(argv):
+    options = dict(arg.split('=', 1) for arg in argv if '=' in arg)
+    words = [arg for arg in argv if '=' not in arg]
+
+    if 'cae' in words and 'noGUI' in options:
+        script = os.path.basename(options['noGUI'])
+        if script.endswith('_preprocess.py'):
+            return preprocess(script[:-len('_preprocess.py')])
+        if script.endswith('_postprocess.py'):
+            return postprocess(script[:-len('_postprocess.py')])
+        print(f"fake abaqus: unsupported script {script}")
+        return 1
+    if 'terminate' in words and 'job' in options:
+        return terminate(options['job'])
+    if 'job' in options:
+        return solve(options['job'], int(options.get('cpus', 1)))
+
+    print(f"fake abaqus: unsupported command: {' '.join(argv)}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
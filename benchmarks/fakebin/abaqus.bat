@@ -0,0 +1,5 @@
+@echo off
+rem Abaqus 替身启动脚本：将 benchmarks\fakebin 加入 PATH 后，abaqus 命令由 fake_abaqus.py 处理
+rem FAKE_ABAQUS_PYTHON 指定运行替身的 Python（需能导入 numpy），默认 python
+if "%FAKE_ABAQUS_PYTHON%"=="" (set FAKE_ABAQUS_PYTHON=python)
+"%FAKE_ABAQUS_PYTHON%" "%~dp0..\fake_abaqus.py" %*
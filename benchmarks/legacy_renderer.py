@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+逐次 re.sub 替换的脚本渲染器 - 模板引擎改写之前的生成方式，仅供 bench_template_engine.py 计时对比
+
+各段替换文本复用 AbaqusScriptGenerator 的 _build_* / *_slot_values 方法，只保留原先
+"在整份模板上逐个 re.sub" 的执行方式。输出与原实现并不逐字节一致（坐标格式、尺寸10时的内部切割矩形），
+正确性以 template_baseline.json 中的基线输出为准
+"""
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from script_generator import CUTTING_SLOTS, DIRECTION_X_SLOTS, DIRECTION_X_VALUES, STEEL_PLATE_SLOTS
+
+
+def render_legacy(generator, template_content, geometry, cell_size, cell_radius, slider=4, speed_value=None,
+                  direction_value=None, output_dir=None, script_filename=None):
+    """生成最终的脚本内容（参数与 AbaqusScriptGenerator._generate_script_content 相同）"""
+    content = template_content
+
+    # 1. 替换半径参数
+    content = replace_radius(generator, content, cell_radius)
+
+    # 1.5. 替换模板开头的cell_size值
+    content = replace_template_cell_size(generator, content, cell_size)
+
+    # 2. 替换坐标定义
+    content = replace_coordinates(generator, content, geometry, cell_size)
+
+    # 3. 替换cylinders连接
+    content = replace_cylinders(generator, content, geometry)
+
+    # 4. 替换切割参数
+    content = replace_slots(content, CUTTING_SLOTS, generator._cutting_slot_values(cell_size, cell_radius))
+
+    # 5. 替换钢板尺寸和位置
+    content = replace_slots(content, STEEL_PLATE_SLOTS, generator._steel_plate_slot_values(cell_size))
+
+    # 6. 替换velocity2参数（当使用动态模板时）
+    if speed_value is not None:
+        content = replace_velocity_parameters(generator, content, speed_value)
+
+    # 7. Direction X 模式: u2 改为 u1
+    if direction_value == "X":
+        content = replace_slots(content, DIRECTION_X_SLOTS, DIRECTION_X_VALUES)
+
+    # 8. 追加作业设置、提交和等待语句
+    return content.rstrip() + generator._build_job_settings(output_dir, cell_size, speed_value, direction_value,
+                                                            script_filename)
+
+
+def replace_slots(content, slots, values):
+    """按槽位定义依次替换"""
+    for spec in slots:
+        content = re.sub(spec.pattern, values[spec.name], content)
+    return content
+
+
+def replace_radius(generator, content, cell_radius):
+    """替换半径参数并动态调整网格密度"""
+    content = re.sub(r'radius = [\d.]+\s*$', f'radius = {cell_radius}', content, flags=re.MULTILINE)
+
+    # 替换MergedStructure的seedPart size参数（通常是第一个）
+    new_mesh_size = generator._calculate_mesh_size(cell_radius)
+    return re.sub(r'(p\.seedPart\(size=)[\d.]+(\s*,)', rf'\g<1>{new_mesh_size}\g<2>', content, count=1)
+
+
+def replace_template_cell_size(generator, content, cell_size):
+    """替换模板开头的cell_size值"""
+    return re.sub(r'cell_size = [\d.]+\s*$', generator._build_cell_size_line(cell_size), content,
+                  flags=re.MULTILINE)
+
+
+def replace_coordinates(generator, content, geometry, cell_size):
+    """替换坐标定义并进行缩放"""
+    match = re.search(r'# 定义关键点坐标\s*\n(.*?)\n\s*# 定义圆柱体连接', content, re.DOTALL)
+    if match:
+        new_coords_section = generator._build_coordinates_section(geometry, cell_size)
+        content = content[:match.start()] + new_coords_section + content[match.end():]
+    return content
+
+
+def replace_cylinders(generator, content, geometry):
+    """替换cylinders连接定义"""
+    pattern = r'cylinders = \[([^\]]*(?:\[[^\]]*\][^\]]*)*)?\]'
+    return re.sub(pattern, generator._build_cylinders_section(geometry), content, flags=re.DOTALL)
+
+
+def replace_velocity_parameters(generator, content, speed_value):
+    """替换velocity2参数，根据speed_value调整速度值"""
+    replacement = generator._build_velocity_line(speed_value)
+    if replacement is None:
+        return content
+    return re.sub(r'velocity2=-?\d+\.?\d*', replacement, content)
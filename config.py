@@ -2,6 +2,7 @@
 """
 配置文件 - 集中管理所有硬编码的配置参数
 """
+import logging
 import os
 
 
@@ -12,6 +13,11 @@ class Config:
     FEATURE_FILE_MIN_SIZE = int(os.getenv('MIN_FILE_SIZE', 2000))  # 特征文件最小大小(字节)
     GENERATE_SCRIPT_DIR = "generate_script"  # 生成脚本的目录名
     LOG_DIR = os.getenv('LOG_DIR', "logs")  # PBS/SLURM 日志文件目录
+    SCRIPT_MANIFEST_FILE = os.getenv('SCRIPT_MANIFEST_FILE', ".script_manifest.json")  # 增量生成清单文件名(位于每个作业目录)
+    JOB_MANIFEST_FILE = os.getenv('JOB_MANIFEST_FILE', "job_manifest.jsonl")  # 作业清单文件名(位于任务目录，供调度器和数据集构建读取)
+    JOB_LEDGER_FILE = os.getenv('JOB_LEDGER_FILE', "job_ledger.json")  # 作业进度记录文件名(位于任务目录，供调度器断点续跑)
+    SOLVER_STATUS_FILE = os.getenv('SOLVER_STATUS_FILE', "solver_status.json")  # 求解进度状态文件名(位于任务目录，供其他工具显示进度)
+    RUNTIME_HISTORY_FILE = os.getenv('RUNTIME_HISTORY_FILE', "runtime_history.json")  # 求解用时历史记录(跨任务保留，用于最长作业优先排序)
 
     BASE_SCRIPT_PATH = os.getenv('BASE_SCRIPT_PATH', "/home/haoyu.wang/ARTC_Database_final/generate_script")  # 集群上脚本基础路径
 
@@ -24,6 +30,9 @@ class Config:
     PBS_NCPUS = int(os.getenv('PBS_NCPUS', 8))  # CPU核心数
     PBS_MEMORY = os.getenv('PBS_MEM', "64gb")  # 内存大小
     PBS_WALLTIME = os.getenv('PBS_WALLTIME', "168:00:00")  # 作业时间限制
+    SWEEP_SHARDS = int(os.getenv('SWEEP_SHARDS', 1))  # 批量生成时按预计用时均衡拆分成的运行脚本数(每个分片一个PBS/SLURM作业)
+    PBS_ARRAY = os.getenv('PBS_ARRAY', '0') == '1'  # 生成PBS作业数组脚本(#PBS -J)，每个子作业独立完成一个作业的前处理→求解→后处理
+    PBS_ARRAY_WALLTIME = os.getenv('PBS_ARRAY_WALLTIME', "24:00:00")  # 作业数组中每个子作业的时间限制
 
     # ========== SLURM 集群配置 ==========
     SLURM_TIME_LIMIT = os.getenv('SLURM_TIME', "72:00:00")  # 作业时间限制
@@ -32,19 +41,50 @@ class Config:
     SLURM_NTASKS = int(os.getenv('SLURM_NTASKS', 1))  # 任务数
     SLURM_CPUS_PER_TASK = int(os.getenv('SLURM_CPUS', 8))  # 每个任务的CPU数
     SLURM_MEMORY = os.getenv('SLURM_MEM', "64G")  # 内存大小
+    SLURM_SOLVE_TIME_LIMIT = os.getenv('SLURM_SOLVE_TIME', "24:00:00")  # 作业数组中每个求解子作业的时间限制
+    SLURM_CAE_CPUS = int(os.getenv('SLURM_CAE_CPUS', 1))  # 作业数组中前处理/后处理/汇总子作业的CPU数(CAE为单线程)
+    SLURM_CAE_MEMORY = os.getenv('SLURM_CAE_MEM', "8G")  # 作业数组中前处理/后处理/汇总子作业的内存
+    SLURM_CAE_TIME_LIMIT = os.getenv('SLURM_CAE_TIME', "02:00:00")  # 作业数组中前处理/后处理/汇总子作业的时间限制
+    SLURM_CAE_LICENSE = os.getenv('SLURM_CAE_LICENSE', "")  # SLURM中CAE license的名称(如 abaqus_cae)，设置后前/后处理子作业以 --licenses 申请，由SLURM统一限制总数
+    SLURM_GEJSONL_SCRIPT = os.getenv('SLURM_GEJSONL_SCRIPT', "")  # 集群上GeJsonl.py的路径(汇总作业使用)，留空时为 BASE_SCRIPT_PATH 的上级目录下的 GeJsonl.py
 
     # ========== Abaqus 配置 ==========
     ABAQUS_MODULE = os.getenv('ABAQUS_MODULE', "abaqus")  # Abaqus模块名
     ABAQUS_COMMAND = os.getenv('ABAQUS_CMD', "abaqus cae noGUI")  # Abaqus执行命令
+    CAE_SLOTS = int(os.getenv('CAE_SLOTS', 1))  # 批量前处理同时运行的CAE会话数(受CAE license数量限制)
+    RUN_ALL_MAX_JOBS = int(os.getenv('RUN_ALL_MAX_JOBS', 1))  # 生成的run_all.sh同时运行的作业数，1表示按原方式顺序执行
+    RUN_ALL_COMPACT = os.getenv('RUN_ALL_COMPACT', '1') == '1'  # 生成固定的run_all.sh驱动脚本+作业列表(.jobs)，0表示按原方式逐作业展开
+    SOLVER_CPUS = int(os.getenv('SOLVER_CPUS', 8))  # 每个求解作业默认使用的CPU数
+    SOLVER_MEMORY_GB = float(os.getenv('SOLVER_MEM_GB', 8))  # 每个求解作业默认预留的内存(GB)
+    SOLVER_SCALE_REQUIREMENTS = os.getenv('SOLVER_SCALE_REQUIREMENTS', '1') == '1'  # 按估计单元数缩放每个作业的CPU/内存需求，0表示所有作业使用上面的默认值
+    SOLVER_REFERENCE_JOB = os.getenv('SOLVER_REFERENCE_JOB', "BCC/4/0p3/4/static")  # 需求恰为 SOLVER_CPUS / SOLVER_MEM_GB 的参考作业
+    SOLVER_MIN_MEMORY_GB = float(os.getenv('SOLVER_MIN_MEM_GB', 2))  # 按比例缩放后每个求解作业的最小内存(GB)
+    NODE_CPUS = int(os.getenv('NODE_CPUS', 0))  # 节点CPU预算，0表示自动检测(os.cpu_count)
+    NODE_MEMORY_GB = float(os.getenv('NODE_MEM_GB', 0))  # 节点内存预算(GB)，0表示自动检测(/proc/meminfo)
+    POSTPROCESS_SLOTS = int(os.getenv('POSTPROCESS_SLOTS', 1))  # 流水线模式下同时运行的后处理数
+    MAX_PENDING_ODBS = int(os.getenv('MAX_PENDING_ODBS', 2))  # 流水线模式下已开始求解但未后处理的作业数上限(限制ODB堆积)
+    PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', 2))  # 流水线模式下等待求解的作业数上限(满时前处理暂停)
+    LCK_WAIT_TIMEOUT = int(os.getenv('LCK_WAIT_TIMEOUT', 60))  # 求解器进程退出后等待.lck删除的最长时间(秒)
+    PROGRESS_INTERVAL = float(os.getenv('PROGRESS_INTERVAL', 10))  # 刷新求解进度和状态文件的间隔(秒)
+    STALL_WINDOW = float(os.getenv('STALL_WINDOW', 900))  # 求解停滞判断窗口(秒)，0表示不检查
+    STALL_MIN_PROGRESS = float(os.getenv('STALL_MIN_PROGRESS', 0.01))  # 窗口内分析时间至少推进的比例(相对分析步总时长)
+    DISK_SCRATCH_DIR = os.getenv('DISK_SCRATCH_DIR', '')  # 统计磁盘占用的目录，空表示任务目录
+    DISK_BUDGET_GB = float(os.getenv('DISK_BUDGET_GB', 0))  # 磁盘预算(GB)，0表示不按磁盘占用暂停求解
+    DISK_HIGH_WATER = float(os.getenv('DISK_HIGH_WATER', 0.9))  # 磁盘占用高水位(相对预算的比例)，超过时暂停启动新的求解
+    DISK_CHECK_INTERVAL = float(os.getenv('DISK_CHECK_INTERVAL', 5))  # 重新统计磁盘占用的最短间隔(秒)
+    SOLVER_SCRATCH_EXTENSIONS = tuple(ext for ext in os.getenv('SOLVER_SCRATCH_EXT', '.abq,.stt,.mdl,.res,.pac,.sel,.prt').split(',') if ext)  # 求解结束后删除的求解器中间文件
 
     # ========== 脚本生成配置 ==========
     BASE_CELL_SIZE = float(os.getenv('BASE_CELL_SIZE', 5.0))  # 基础晶胞尺寸
     DEFAULT_SLIDER_VALUE = int(os.getenv('DEFAULT_SLIDER', 4))  # 默认滑块值
     SLIDER_RANGE = (0, 9)  # 滑块范围
+    SWEEP_WORKERS = int(os.getenv('SWEEP_WORKERS', 0))  # 并行生成脚本的进程数，0表示使用CPU核心数
+    WRITER_THREADS = int(os.getenv('WRITER_THREADS', 8))  # 两阶段生成时批量写入脚本的线程数
 
     # ========== 数据处理配置 ==========
     INTERPOLATION_POINTS = int(os.getenv('INTERP_POINTS', 100))  # 插值点数
     MIN_DATA_FILE_SIZE = int(os.getenv('MIN_DATA_SIZE', 1000))  # 最小数据文件大小
+    MIN_FEATURE_ROWS = int(os.getenv('MIN_FEATURE_ROWS', 10))  # 有效feature_data.txt的最少数据行数
 
     # ========== UI 配置 ==========
     VISUALIZATION_UPDATE_INTERVAL = int(os.getenv('VIS_UPDATE_MS', 1000))  # 可视化更新间隔(毫秒)
@@ -88,11 +128,23 @@ class Config:
             'memory': cls.SLURM_MEMORY
         }
 
+    @classmethod
+    def setup_logging(cls):
+        """按 LOG_LEVEL 配置根日志记录器（已配置过时不重复添加处理器）"""
+        level = getattr(logging, str(cls.LOG_LEVEL).upper(), logging.INFO)
+        logging.basicConfig(level=level, format='[%(levelname)s] %(name)s: %(message)s')
+        logging.getLogger().setLevel(level)
+
     @classmethod
     def validate(cls):
         """验证配置参数"""
         assert cls.FEATURE_FILE_MIN_SIZE > 0, "FEATURE_FILE_MIN_SIZE must be positive"
         assert cls.BASE_CELL_SIZE > 0, "BASE_CELL_SIZE must be positive"
+        assert cls.CAE_SLOTS > 0, "CAE_SLOTS must be positive"
+        assert cls.MAX_PENDING_ODBS > 0, "MAX_PENDING_ODBS must be positive"
+        assert cls.SWEEP_SHARDS > 0, "SWEEP_SHARDS must be positive"
+        assert cls.RUN_ALL_MAX_JOBS > 0, "RUN_ALL_MAX_JOBS must be positive"
+        assert cls.SOLVER_MIN_MEMORY_GB > 0, "SOLVER_MIN_MEMORY_GB must be positive"
 
         if cls.SCHEDULER_TYPE == "PBS":
             assert cls.PBS_NODES > 0, "PBS_NODES must be positive"
@@ -100,6 +152,7 @@ class Config:
         elif cls.SCHEDULER_TYPE == "SLURM":
             assert cls.SLURM_NODES > 0, "SLURM_NODES must be positive"
             assert cls.SLURM_CPUS_PER_TASK > 0, "SLURM_CPUS_PER_TASK must be positive"
+            assert cls.SLURM_CAE_CPUS > 0, "SLURM_CAE_CPUS must be positive"
 
         return True
 
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+磁盘预算控制 - 批量调度器按任务目录（或指定的scratch目录）的磁盘占用决定是否启动新的求解，
+并在求解、后处理结束后立即删除不再需要的求解器文件，避免ODB和scratch文件堆积
+"""
+import os
+import threading
+import time
+
+from config import Config
+
+
+def directory_size(path):
+    """目录下所有文件的总字节数"""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+def remove_solver_files(job_dir, job_name, extensions):
+    """删除作业目录中指定扩展名的求解器文件，返回释放的字节数"""
+    freed = 0
+    for extension in extensions:
+        path = os.path.join(job_dir, job_name + extension)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            freed += size
+        except OSError:
+            continue
+    return freed
+
+
+class DiskGovernor:
+    """
+    磁盘预算监视：统计 path 下所有文件的字节数，与 budget_gb 比较
+
+    占用达到 high_water（预算的比例）时 over_high_water() 返回 True；
+    统计结果缓存 interval 秒，避免频繁遍历目录，删除求解器文件后调用 release() 使下次查询重新统计
+    """
+
+    def __init__(self, path, budget_gb=None, high_water=None, interval=None):
+        self.path = path
+        budget_gb = Config.DISK_BUDGET_GB if budget_gb is None else budget_gb
+        self.budget = int(budget_gb * 1024 ** 3)
+        self.high_water = Config.DISK_HIGH_WATER if high_water is None else high_water
+        self.interval = Config.DISK_CHECK_INTERVAL if interval is None else interval
+        self.lock = threading.Lock()
+        self.checked_at = 0.0
+        self.used = 0
+        self.limit = 0
+        self.peak = 0
+        self.freed = 0
+        self.holds = 0
+
+    def refresh(self, force=False):
+        """更新磁盘占用，返回 (已用字节, 预算字节)"""
+        with self.lock:
+            if force or time.time() - self.checked_at >= self.interval:
+                self.used, self.limit = directory_size(self.path), self.budget
+                self.peak = max(self.peak, self.used)
+                self.checked_at = time.time()
+            return self.used, self.limit
+
+    def over_high_water(self):
+        used, limit = self.refresh()
+        return limit > 0 and used >= self.high_water * limit
+
+    def release(self, freed):
+        """记录删除文件释放的空间，下次查询时重新统计"""
+        with self.lock:
+            self.freed += freed
+            self.checked_at = 0.0
+
+    def describe(self):
+        used, limit = self.refresh()
+        return f"{used / 1024 ** 3:.1f}GB / 预算 {limit / 1024 ** 3:.1f}GB（高水位 {self.high_water:.0%}）"
+
+
+class CaeSlots:
+    """
+    CAE license 槽位：后处理优先于前处理
+
+    有后处理在等待时，新的前处理不会拿到空出的槽位，已完成的ODB尽快被处理和删除
+    """
+
+    def __init__(self, slots):
+        self.condition = threading.Condition()
+        self.free = max(1, slots)
+        self.waiting_post = 0
+
+    def acquire(self, postprocess=False):
+        with self.condition:
+            if postprocess:
+                self.waiting_post += 1
+                while self.free == 0:
+                    self.condition.wait()
+                self.waiting_post -= 1
+            else:
+                while self.free == 0 or self.waiting_post:
+                    self.condition.wait()
+            self.free -= 1
+
+    def release(self):
+        with self.condition:
+            self.free += 1
+            self.condition.notify_all()
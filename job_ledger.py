@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+作业进度记录 - 批量调度器在任务目录中记录每个作业完成到哪个阶段，
+中断或节点故障后重新运行时跳过已完成的工作，只需 --retry-failed 即可重跑失败的作业
+"""
+import json
+import os
+import re
+import threading
+import time
+
+from config import Config
+
+PREPROCESSED = 'preprocessed'
+SOLVED = 'solved'
+POSTPROCESSED = 'postprocessed'
+FAILED = 'failed'
+STALLED = 'stalled'  # 求解停滞被看门狗终止
+
+_DATA_ROW = re.compile(r'^\s*[-+]?[\d.]+(?:[eE][-+]?\d+)?[\s,]+[-+]?[\d.]+(?:[eE][-+]?\d+)?\s*$')
+
+
+def get_ledger_path(task_dir):
+    """任务目录下的进度记录路径"""
+    return os.path.join(task_dir, Config.JOB_LEDGER_FILE)
+
+
+def check_feature_data(path, min_rows=None):
+    """
+    检查后处理结果是否完整：第二行为 status: successful，且数据行数不少于 min_rows
+
+    Returns:
+        (是否有效, 说明)
+    """
+    min_rows = Config.MIN_FEATURE_ROWS if min_rows is None else min_rows
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return False, "feature_data.txt 不存在"
+
+    status = lines[1].strip() if len(lines) > 1 else ""
+    if status != "status: successful":
+        return False, f"feature_data.txt 状态异常 ({status or '缺失'})"
+
+    rows = sum(1 for line in lines[3:] if _DATA_ROW.match(line))
+    if rows < min_rows:
+        return False, f"feature_data.txt 数据行不足 ({rows} < {min_rows})"
+    return True, f"{rows} 行数据"
+
+
+def detect_stage(job):
+    """
+    根据作业目录中的文件判断作业实际完成到的阶段
+
+    只认可不早于前处理脚本的结果文件，脚本重新生成后旧结果不会被当作已完成
+
+    Returns:
+        str | None: POSTPROCESSED / SOLVED / PREPROCESSED，什么都没完成时返回 None
+    """
+    script_dir = job['dir']
+    job_name = job['job_name']
+    try:
+        script_mtime = os.path.getmtime(job['preprocess'])
+    except OSError:
+        script_mtime = 0
+
+    def is_fresh(filename):
+        path = os.path.join(script_dir, filename)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return stat.st_size > 0 and stat.st_mtime >= script_mtime
+
+    if is_fresh("feature_data.txt") and check_feature_data(os.path.join(script_dir, "feature_data.txt"))[0]:
+        return POSTPROCESSED
+    if is_fresh(f"{job_name}.odb") and not os.path.exists(os.path.join(script_dir, f"{job_name}.lck")):
+        return SOLVED
+    if is_fresh(f"{job_name}.inp"):
+        return PREPROCESSED
+    return None
+
+
+class JobLedger:
+    """
+    任务目录中的作业进度记录 (JSON)
+
+    每次状态变化立即原子写入（临时文件 + os.replace），进程被杀时记录文件保持完整；
+    调度器的多个线程可以同时调用 mark()
+    """
+
+    def __init__(self, task_dir):
+        self.path = get_ledger_path(task_dir)
+        self.lock = threading.Lock()
+        self.records = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.records = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"警告: 作业进度记录无法读取，将重新记录: {e}")
+
+    def stage(self, job_name):
+        """作业记录的阶段，没有记录时返回 None"""
+        record = self.records.get(job_name)
+        return record['stage'] if record else None
+
+    def mark(self, job_name, stage, message=None):
+        """记录作业到达的阶段并立即保存"""
+        with self.lock:
+            self._set(job_name, stage, message)
+            self._save()
+
+    def plan(self, jobs, retry_failed=False):
+        """
+        按记录和实际文件确定本次需要运行的作业，并把每个作业的阶段更新为实际完成到的阶段
+
+        Args:
+            jobs: find_all_jobs() 返回的作业列表
+            retry_failed: True 时只重跑上次失败或停滞的作业（从失败前已完成的阶段继续）
+
+        Returns:
+            (待运行作业列表, 已完成作业数, 跳过的失败作业名列表)
+        """
+        pending, completed, skipped_failed = [], 0, []
+        with self.lock:
+            for job in jobs:
+                job_name = job['job_name']
+                recorded = self.stage(job_name)
+                stage = detect_stage(job)
+
+                if stage == POSTPROCESSED:
+                    completed += 1
+                    if recorded != POSTPROCESSED:
+                        self._set(job_name, POSTPROCESSED)
+                    continue
+
+                failed = recorded in (FAILED, STALLED)
+                if failed and not retry_failed:
+                    skipped_failed.append(job_name)
+                    continue
+                if retry_failed and not failed:
+                    continue
+
+                if recorded == STALLED and stage == SOLVED:
+                    stage = PREPROCESSED  # 停滞作业的ODB不完整，需要重新求解
+                if stage is None:
+                    self.records.pop(job_name, None)
+                elif stage != recorded:
+                    self._set(job_name, stage)
+                pending.append(job)
+            self._save()
+        return pending, completed, skipped_failed
+
+    def _set(self, job_name, stage, message=None):
+        record = {'stage': stage, 'time': time.strftime('%Y-%m-%d %H:%M:%S')}
+        if message:
+            record['message'] = message
+        self.records[job_name] = record
+
+    def _save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.records, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+作业清单 - 生成脚本时为每个作业追加一条 JSONL 记录，
+供批量调度器和数据集构建按生成顺序读取作业及其参数，不需要遍历目录树；
+读取时逐条检查前处理脚本是否存在（跳过已删除的作业），
+只有清单缺失或显式要求重新扫描（清单之外手动添加了作业目录）时才遍历目录树
+"""
+import json
+import os
+
+from config import Config
+
+
+def get_manifest_path(task_dir):
+    """任务目录（层级结构根目录）下的作业清单路径"""
+    return os.path.join(task_dir, Config.JOB_MANIFEST_FILE)
+
+
+def build_job_record(task_dir, job_dir, filename, cell_type, cell_size, cell_radius, slider,
+                     speed_value=None, direction_value=None, hashes=None):
+    """
+    构建一条作业记录，路径均相对于任务目录并使用 '/' 分隔，便于整体拷贝到集群
+
+    Args:
+        task_dir: 任务目录（层级结构根目录）
+        job_dir: 作业所在目录
+        filename: 生成的脚本基础文件名（如 BCC_4_0p3_0_static.py）
+        hashes: {脚本文件名: 内容哈希}
+
+    Returns:
+        dict: 作业记录，cpus / memory_gb 为按结构估计的求解资源需求（供批量调度器在节点预算内排布）
+    """
+    from runtime_history import estimate_requirements
+
+    job_name = os.path.splitext(filename)[0]
+    rel_dir = os.path.relpath(job_dir, task_dir).replace(os.sep, '/')
+    cpus, memory_gb = estimate_requirements(rel_dir)
+    return {
+        'id': job_name,
+        'cell_type': cell_type,
+        'cell_size': cell_size,
+        'cell_radius': cell_radius,
+        'slider': slider,
+        'mode': os.path.basename(job_dir),  # 层级结构最后一层: static / 50 / 500 / X / X_50 / X_500
+        'speed_value': speed_value,
+        'direction_value': direction_value,
+        'dir': rel_dir,
+        'preprocess': f"{rel_dir}/{job_name}_preprocess.py",
+        'postprocess': f"{rel_dir}/{job_name}_postprocess.py",
+        'cpus': cpus,
+        'memory_gb': memory_gb,
+        'hashes': hashes or {},
+    }
+
+
+def append_job_records(task_dir, records):
+    """将作业记录追加到任务目录的作业清单（一次打开，顺序写入）"""
+    if not records:
+        return
+    os.makedirs(task_dir, exist_ok=True)
+    with open(get_manifest_path(task_dir), 'a', encoding='utf-8') as f:
+        f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records))
+
+
+def load_job_records(task_dir):
+    """
+    读取任务目录的作业清单
+
+    同一作业重新生成时会追加新记录，按 id 去重：保留首次出现的顺序，内容以最后一条为准
+
+    Returns:
+        list[dict] | None: 作业记录列表；清单不存在时返回 None（调用方可回退到遍历目录）
+    """
+    manifest_path = get_manifest_path(task_dir)
+    if not os.path.exists(manifest_path):
+        return None
+
+    records = {}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                records[record['id']] = record
+            except (ValueError, KeyError, TypeError):
+                print(f"警告: 作业清单第 {line_number} 行无法解析，已跳过")
+    return list(records.values())
+
+
+def scan_job_dirs(task_dir):
+    """
+    遍历目录树查找作业：前处理脚本和同名后处理脚本都存在的目录
+
+    Returns:
+        dict: {相对任务目录的作业目录 ('/' 分隔): 作业名}
+    """
+    job_dirs = {}
+    for root, dirs, files in os.walk(task_dir):
+        dirs.sort()
+        names = set(files)
+        for file in sorted(files):
+            if file.endswith('_preprocess.py'):
+                job_name = file[:-len('_preprocess.py')]
+                if f"{job_name}_postprocess.py" in names:
+                    rel_dir = os.path.relpath(root, task_dir).replace(os.sep, '/')
+                    job_dirs[rel_dir] = job_name
+    return job_dirs
+
+
+def load_checked_job_records(task_dir, rescan=False):
+    """
+    读取作业清单，丢弃前处理脚本已不存在的作业（每个作业一次 os.path.isfile，不遍历目录树）
+
+    rescan=True 时额外遍历目录树，把目录中存在但清单中没有的作业（如清单出现之前生成的目录、
+    手动拷贝进来的作业）追加到作业清单末尾，只包含 id / dir / preprocess / postprocess 字段
+
+    Returns:
+        list[dict] | None: 作业记录列表；清单不存在时返回 None（调用方可回退到遍历目录）
+    """
+    records = load_job_records(task_dir)
+    if records is None:
+        return None
+
+    checked = [record for record in records
+               if os.path.isfile(resolve_job_path(task_dir, record.get('preprocess', '')))]
+    if len(checked) < len(records):
+        print(f"警告: 作业清单中有 {len(records) - len(checked)} 个作业的脚本已不存在，已跳过")
+
+    if rescan:
+        listed = {record['dir'] for record in checked}
+        extra = [{
+            'id': job_name,
+            'dir': rel_dir,
+            'preprocess': f"{rel_dir}/{job_name}_preprocess.py",
+            'postprocess': f"{rel_dir}/{job_name}_postprocess.py",
+        } for rel_dir, job_name in scan_job_dirs(task_dir).items() if rel_dir not in listed]
+        if extra:
+            append_job_records(task_dir, extra)
+            print(f"目录中有 {len(extra)} 个作业不在作业清单中，已补充到清单")
+        checked += extra
+    return checked
+
+
+def resolve_job_path(task_dir, relative_path):
+    """将清单中的相对路径转换为本地路径"""
+    return os.path.join(task_dir, *relative_path.split('/'))
@@ -6,6 +6,7 @@
 
 import sys
 import os
+import multiprocessing
 
 # 获取当前目录路径，兼容打包环境
 def get_current_dir():
@@ -134,12 +135,14 @@ def generate_batch_on_exit():
 def main():
     """主函数 - 启动Qt应用程序"""
     try:
+        from config import Config
+        Config.setup_logging()
+
         # 清空上次运行的文件追踪列表
         clear_generated_files()
         print("已清空文件追踪列表，开始新会话")
 
         # 创建generate_script文件夹用于存放生成的文件
-        from config import Config
         generate_script_dir = os.path.join(current_dir, Config.GENERATE_SCRIPT_DIR)
         if not os.path.exists(generate_script_dir):
             os.makedirs(generate_script_dir)
@@ -212,4 +215,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 打包后的程序中启动并行生成的工作进程需要此调用
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
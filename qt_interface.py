@@ -3,10 +3,10 @@ import os
 import json
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
                            QWidget, QComboBox, QLabel, QPushButton, QFrame, QGridLayout, QSplitter, QCheckBox, QSlider, QMenuBar, QAction, QLineEdit, QSpinBox, QDoubleSpinBox, QGroupBox)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QIcon, QPixmap
 from visualization_widget import CellVisualizationWidget
-from script_generator import generate_abaqus_script
+from script_generator import generate_abaqus_script, generate_sweep
 from config import Config
 # 导入批量管理器
 try:
@@ -16,6 +16,69 @@ except ImportError:
 # 避免循环导入，在需要时动态导入
 
 
+class SweepWorker(QThread):
+    """
+    批量生成后台线程：按组调用 generate_sweep，避免多进程生成期间阻塞界面
+
+    信号（由Qt排队到主线程处理）:
+        progress(completed, total, message)  每个作业完成时
+        slider_done(slider)                   每个作业完成时，该作业的slider值
+        group_done(group_name, python_files)  每组完成时，python_files 按作业顺序排列（前处理、后处理）
+        failed(message)                       生成出错时，之后的组不再生成
+
+    sweep_options 原样传给 generate_sweep（如 batch_mode、batch_parent_dir），默认不登记文件追踪列表
+    """
+
+    progress = pyqtSignal(int, int, str)
+    slider_done = pyqtSignal(int)
+    group_done = pyqtSignal(str, list)
+    failed = pyqtSignal(str)
+
+    def __init__(self, cell_type_groups, no_slider_types, cell_size, cell_radius, speed_value, direction_value,
+                 parent=None, **sweep_options):
+        super().__init__(parent)
+        self.cell_type_groups = cell_type_groups
+        self.no_slider_types = no_slider_types
+        self.cell_size = cell_size
+        self.cell_radius = cell_radius
+        self.speed_value = speed_value
+        self.direction_value = direction_value
+        self.sweep_options = {'track_files': False, **sweep_options}
+        self.succeeded = False
+
+    def run(self):
+        total_groups = len(self.cell_type_groups)
+        try:
+            for current_group, (group_name, cell_types) in enumerate(self.cell_type_groups, 1):
+                self.progress.emit(0, 0, f"\n=== 处理 {group_name} ({current_group}/{total_groups}) ===")
+                results = generate_sweep(
+                    cell_types, [self.cell_size], [self.cell_radius],
+                    sliders=range(9),
+                    modes=[(self.speed_value, self.direction_value)],
+                    no_slider_types=self.no_slider_types,
+                    progress_callback=self._on_progress,
+                    **self.sweep_options
+                )
+                python_files = []
+                for result in results:
+                    if result['success']:
+                        python_files.extend([result['preprocess'], result['postprocess']])
+                self.group_done.emit(group_name, python_files)
+            self.succeeded = True
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def _on_progress(self, completed, total, result):
+        if result['unchanged']:
+            message = f"  = 未变化，跳过写入: {result['filename']}"
+        elif result['success']:
+            message = f"  ✓ 生成成功: {result['filename']}"
+        else:
+            message = f"  ✗ 生成失败: {result['cell_type']} slider={result['slider']}: {result['message']}"
+        self.progress.emit(completed, total, message)
+        self.slider_done.emit(result['slider'])
+
+
 class ModernInterface(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -41,6 +104,9 @@ class ModernInterface(QMainWindow):
         # 初始化批量管理器
         self.batch_manager = BatchJobManager() if BatchJobManager else None
 
+        # 批量生成（三角按钮）的后台线程
+        self.sweep_worker = None
+
         self.setStyleSheet(self.get_stylesheet())
         self.init_ui()
 
@@ -170,8 +236,8 @@ class ModernInterface(QMainWindow):
         # 连续运行相关变量
         self.is_batch_running = False
         self.current_batch_index = 0
-        self.batch_timer = None
         self.batch_parent_dir = None
+        self.batch_worker = None
 
         for i, (label_text, options) in enumerate(dropdown_configs):
             label = QLabel(label_text)
@@ -434,7 +500,10 @@ class ModernInterface(QMainWindow):
                     self.checkbox_labels[label_text].setStyleSheet("color: #95a5a6; font-size: 27px; font-weight: 600; padding: 8px 0;")
 
     def closeEvent(self, event):
-        """窗口关闭时保存设置"""
+        """窗口关闭时保存设置（等待正在进行的批量生成结束）"""
+        for worker in (self.sweep_worker, self.batch_worker):
+            if worker is not None:
+                worker.wait()
         self.save_settings()
         event.accept()
 
@@ -501,89 +570,72 @@ class ModernInterface(QMainWindow):
 
 
     def generate_batch_step(self):
-        """执行连续运行的单步操作"""
-        if not self.is_batch_running or self.current_batch_index > 8:
-            self.finish_batch_generation()
-            return
-
-        # 设置当前slider值
-        self.slider.setValue(self.current_batch_index)
-
-        # 更新按钮文本显示当前进度
-        self.generate_button.setText(f"running... {self.current_batch_index + 1}/9")
-
-        # 生成当前配置的脚本
-        self.generate_single_config_for_batch()
-
-        # 准备下一步
-        self.current_batch_index += 1
-
-        # 使用定时器延迟执行下一步，给用户看到进度
-        if not self.batch_timer:
-            self.batch_timer = QTimer()
-            self.batch_timer.setSingleShot(True)
-            self.batch_timer.timeout.connect(self.generate_batch_step)
-
-        self.batch_timer.start(500)  # 500ms延迟
-
-    def generate_single_config_for_batch(self):
-        """为连续运行模式生成单个配置的脚本"""
+        """执行连续运行：slider值0-8的脚本由 SweepWorker 在后台线程中生成，完成后恢复按钮"""
         try:
-            # 收集UI配置
-            config = {}
-            for label_text, dropdown in self.dropdowns.items():
-                config[label_text.replace(":", "").strip()] = dropdown.currentText()
-
-            # 收集复选框状态
-            checkbox_config = {}
-            for label_text, checkbox in self.checkboxes.items():
-                checkbox_config[label_text.replace(":", "").strip()] = checkbox.isChecked()
+            config, checkbox_config = self._collect_ui_config()
 
             # 提取关键参数
             cell_type = config.get('Cell type', 'Cubic')
             cell_size = config.get('Cell size', '5')
             cell_radius = config.get('Strut radius', '0.5')
+            speed_value, direction_value = self._get_speed_direction(config, checkbox_config)
 
-            # 使用当前slider值
-            slider_value = self.current_batch_index
-
-            print(f"连续运行第 {self.current_batch_index + 1}/9 步:")
-            print(f"Cell type: {cell_type}, Slider value: {slider_value}")
-
-            # 确定速度和方向设置
-            speed_value = None
-            direction_value = None
-
-            if checkbox_config.get('Speed', False):
-                speed_value = config.get('Speed', 'low')
-            if checkbox_config.get('Directions', False):
-                direction_value = config.get('Directions', 'X')
+            print(f"连续运行: Cell type: {cell_type}, Slider value: 0-8")
 
-            # 生成脚本（批量模式）
-            success, message, filename = generate_abaqus_script(
-                cell_type=cell_type,
-                cell_size=float(cell_size),
-                cell_radius=float(cell_radius),
-                slider=slider_value,
-                speed_value=speed_value,
-                direction_value=direction_value,
-                batch_mode=True,
-                batch_parent_dir=self.batch_parent_dir
+            # 生成脚本（批量模式），生成的文件登记到文件追踪列表
+            self.batch_worker = SweepWorker(
+                [("连续运行", [cell_type])], (), float(cell_size), float(cell_radius),
+                speed_value, direction_value, parent=self,
+                batch_mode=True, batch_parent_dir=self.batch_parent_dir, track_files=True
             )
-
-            if success:
-                print(f"第 {self.current_batch_index + 1} 步生成成功: {filename}")
-            else:
-                print(f"第 {self.current_batch_index + 1} 步生成失败: {message}")
+            self.batch_worker.progress.connect(self._on_batch_progress)
+            self.batch_worker.slider_done.connect(self.slider.setValue)
+            self.batch_worker.failed.connect(self._on_batch_failed)
+            self.batch_worker.finished.connect(self.finish_batch_generation)
+            self.batch_worker.start()
 
         except Exception as e:
-            print(f"连续运行第 {self.current_batch_index + 1} 步出错: {str(e)}")
+            print(f"连续运行出错: {str(e)}")
+            self.finish_batch_generation()
+
+    def _on_batch_progress(self, completed, total, message):
+        """连续运行进度（主线程）：更新按钮文本"""
+        print(message)
+        if total:
+            self.current_batch_index = completed
+            self.generate_button.setText(f"running... {completed}/{total}")
+
+    def _on_batch_failed(self, message):
+        print(f"连续运行出错: {message}")
+
+    def _collect_ui_config(self):
+        """收集下拉框和复选框的当前配置"""
+        config = {}
+        for label_text, dropdown in self.dropdowns.items():
+            config[label_text.replace(":", "").strip()] = dropdown.currentText()
+
+        checkbox_config = {}
+        for label_text, checkbox in self.checkboxes.items():
+            checkbox_config[label_text.replace(":", "").strip()] = checkbox.isChecked()
+
+        return config, checkbox_config
+
+    def _get_speed_direction(self, config, checkbox_config):
+        """根据复选框状态确定 (speed_value, direction_value)"""
+        speed_value = None
+        direction_value = None
+        if checkbox_config.get('Speed', False):
+            speed_value = config.get('Speed', '10')
+        if checkbox_config.get('Directions', False):
+            direction_value = config.get('Directions', 'X')
+        return speed_value, direction_value
 
     def finish_batch_generation(self):
         """完成连续运行"""
         self.is_batch_running = False
         self.current_batch_index = 0
         self.batch_parent_dir = None
+        self.batch_worker = None
 
         # 显示完成状态
         self.generate_button.setText("Down!")
@@ -663,19 +715,15 @@ class ModernInterface(QMainWindow):
             self.generate_button.setEnabled(True)
 
     def on_triangle_button_clicked(self):
-        """红色三角按钮点击事件处理 - 批量生成脚本"""
+        """红色三角按钮点击事件处理 - 批量生成脚本
+
+        各组脚本由 SweepWorker 在后台线程中生成，界面保持响应；
+        每组生成完成后在主线程中写入该组的运行脚本，全部完成后生成主控制脚本和PBS/SLURM脚本
+        """
         print("开始批量生成脚本...")
 
-        # 动态导入避免循环依赖
-        try:
-            import main
-            clear_generated_files = main.clear_generated_files
-            get_generated_files = main.get_generated_files
-            from shell_script_generator import generate_shell_script
-            from config import Config
-            from datetime import datetime
-        except ImportError as e:
-            print(f"无法导入必要模块: {e}")
+        if self.sweep_worker is not None and self.sweep_worker.isRunning():
+            print("批量生成正在进行中")
             return
 
         # 使用配置文件中的分组和设置
@@ -683,6 +731,8 @@ class ModernInterface(QMainWindow):
         no_slider_types = Config.NO_SLIDER_CELL_TYPES
 
         try:
+            from datetime import datetime
+
             # 禁用按钮防止重复点击，并设置运行状态样式
             self.triangle_button.setEnabled(False)
             # 设置深红色运行状态
@@ -745,155 +795,129 @@ class ModernInterface(QMainWindow):
             # 保存任务目录供后续使用
             self.current_task_dir = task_dir
 
-            total_groups = len(cell_type_groups)
-            current_group = 0
+            self.current_shard_scripts = []
+            # 本次生成的全部脚本，供PBS/SLURM作业数组使用
+            self.current_sweep_files = []
+
+            config, checkbox_config = self._collect_ui_config()
+            speed_value, direction_value = self._get_speed_direction(config, checkbox_config)
+            # 任务参数：作业清单（generate_script 根目录）中属于本任务的作业按这些字段筛选
+            self.current_sweep_params = {
+                'cell_size': float(config.get('Cell size', '5')),
+                'cell_radius': float(config.get('Strut radius', '0.5')),
+                'speed_value': speed_value,
+                'direction_value': direction_value,
+            }
+            self.sweep_worker = SweepWorker(
+                cell_type_groups, no_slider_types,
+                self.current_sweep_params['cell_size'], self.current_sweep_params['cell_radius'],
+                speed_value, direction_value, parent=self
+            )
+            self.sweep_worker.progress.connect(self._on_sweep_progress)
+            self.sweep_worker.group_done.connect(self._on_sweep_group_done)
+            self.sweep_worker.failed.connect(self._on_sweep_failed)
+            self.sweep_worker.finished.connect(self._on_sweep_finished)
+            self.sweep_worker.start()
 
-            for group_name, cell_types in cell_type_groups:
-                current_group += 1
-                print(f"\n=== 处理 {group_name} ({current_group}/{total_groups}) ===")
+        except Exception as e:
+            print(f"批量生成脚本时出错: {str(e)}")
+            self.show_completion_star()
+            self.triangle_button.setEnabled(True)
 
-                # 清空文件追踪列表
-                clear_generated_files()
+    def _on_sweep_progress(self, completed, total, message):
+        """SweepWorker 进度（主线程）"""
+        print(message)
+        if total:
+            self.triangle_button.setToolTip(f"批量生成中 {completed}/{total}")
 
-                for cell_type in cell_types:
-                    print(f"正在处理 Cell Type: {cell_type}")
+    def _on_sweep_group_done(self, group_name, python_files):
+        """一组脚本生成完成（主线程）：生成该组的批处理脚本到task文件夹"""
+        try:
+            from shell_script_generator import generate_shell_script
 
-                    # 设置当前cell type
-                    if "Cell type :" in self.dropdowns:
-                        dropdown = self.dropdowns["Cell type :"]
-                        index = dropdown.findText(cell_type)
-                        if index >= 0:
-                            dropdown.setCurrentIndex(index)
+            if not python_files:
+                print(f"警告: {group_name} 没有生成任何脚本文件")
+                return
 
-                    if cell_type in no_slider_types:
-                        # 只生成1个脚本
-                        self._generate_single_script(cell_type, 4)  # 使用默认slider值4
-                    else:
-                        # 生成3个脚本 (slider值 0-2)
-                        for slider_value in range(9):
-                            self._generate_single_script(cell_type, slider_value)
-
-                # 生成当前组的批处理脚本到task文件夹
-                python_files = get_generated_files()
-                if python_files:
-                    print(f"{group_name} 共生成 {len(python_files)} 个脚本文件")
-
-                    # 获取配置参数用于命名
-                    cell_size = self.dropdowns.get("Cell size:", None)
-                    strut_radius = self.dropdowns.get("Strut radius:", None)
-                    speed_checkbox = self.checkboxes.get("Speed:", None)
-                    direction_checkbox = self.checkboxes.get("Directions:", None)
-                    speed_dropdown = self.dropdowns.get("Speed:", None)
-                    direction_dropdown = self.dropdowns.get("Directions:", None)
-
-                    config_parts = []
-                    if cell_size:
-                        config_parts.append(cell_size.currentText())
-                    if strut_radius:
-                        config_parts.append(strut_radius.currentText())
-
-                    # 使用实际的 speed_value 或 direction_value
-                    # 注意：Speed 和 Directions 是互斥的
-                    if direction_checkbox and direction_checkbox.isChecked():
-                        # direction模式：使用direction的实际值（如 X, X_50, X_500等）
-                        if direction_dropdown:
-                            direction_val = direction_dropdown.currentText()
-                            config_parts.append(direction_val)
-                        else:
-                            config_parts.append("dir")
-                    elif speed_checkbox and speed_checkbox.isChecked():
-                        # speed模式：使用speed的实际值（如 50, 500等）
-                        if speed_dropdown:
-                            speed_val = speed_dropdown.currentText()
-                            config_parts.append(speed_val)
-                        else:
-                            config_parts.append("speed")
-                    else:
-                        config_parts.append("static")
+            print(f"{group_name} 共生成 {len(python_files)} 个脚本文件")
+            self.current_sweep_files.extend(python_files)
 
-                    config_name = "_".join(config_parts)
+            # 获取配置参数用于命名
+            cell_size = self.dropdowns.get("Cell size:", None)
+            strut_radius = self.dropdowns.get("Strut radius:", None)
+            speed_checkbox = self.checkboxes.get("Speed:", None)
+            direction_checkbox = self.checkboxes.get("Directions:", None)
+            speed_dropdown = self.dropdowns.get("Speed:", None)
+            direction_dropdown = self.dropdowns.get("Directions:", None)
 
-                    # 使用task文件夹作为输出目录
-                    import platform
-                    if platform.system() == "Windows":
-                        generate_shell_script(python_files, task_dir, "bat", config_name=config_name)
-                    else:
-                        # Linux系统只生成.sh文件，不生成.bat文件
-                        generate_shell_script(python_files, task_dir, "sh", config_name=config_name)
+            config_parts = []
+            if cell_size:
+                config_parts.append(cell_size.currentText())
+            if strut_radius:
+                config_parts.append(strut_radius.currentText())
 
-                    print(f"{group_name} 批处理脚本生成完成")
+            # 使用实际的 speed_value 或 direction_value
+            # 注意：Speed 和 Directions 是互斥的
+            if direction_checkbox and direction_checkbox.isChecked():
+                # direction模式：使用direction的实际值（如 X, X_50, X_500等）
+                if direction_dropdown:
+                    direction_val = direction_dropdown.currentText()
+                    config_parts.append(direction_val)
+                else:
+                    config_parts.append("dir")
+            elif speed_checkbox and speed_checkbox.isChecked():
+                # speed模式：使用speed的实际值（如 50, 500等）
+                if speed_dropdown:
+                    speed_val = speed_dropdown.currentText()
+                    config_parts.append(speed_val)
                 else:
-                    print(f"警告: {group_name} 未生成任何脚本文件")
+                    config_parts.append("speed")
+            else:
+                config_parts.append("static")
+
+            config_name = "_".join(config_parts)
+            self.current_config_name = config_name
+
+            # 使用task文件夹作为输出目录
+            import platform
+            # Linux系统只生成.sh文件，不生成.bat文件
+            script_type = "bat" if platform.system() == "Windows" else "sh"
+            if Config.SWEEP_SHARDS > 1:
+                self._generate_sharded_scripts(python_files, self.current_task_dir, script_type, config_name)
+            else:
+                generate_shell_script(python_files, self.current_task_dir, script_type, config_name=config_name)
 
-            print("\n=== 所有批处理脚本生成完成! ===")
+            print(f"{group_name} 批处理脚本生成完成")
+        except Exception as e:
+            print(f"生成 {group_name} 批处理脚本时出错: {str(e)}")
+
+    def _on_sweep_failed(self, message):
+        print(f"批量生成脚本时出错: {message}")
 
-            # 生成主控制脚本到task文件夹
-            self.generate_master_control_script()
+    def _on_sweep_finished(self):
+        """全部组生成完成（主线程）：生成主控制脚本和PBS/SLURM脚本，恢复按钮"""
+        try:
+            if self.sweep_worker.succeeded:
+                print("\n=== 所有批处理脚本生成完成! ===")
 
-            # 生成PBS脚本到task文件夹
-            self.generate_pbs_script()
+                # 生成主控制脚本到task文件夹
+                self.generate_master_control_script()
 
-            # 清理历史文件追踪
-            clear_generated_files()
-            print("已清理文件追踪历史")
+                # 生成PBS脚本到task文件夹
+                self.generate_pbs_script()
 
+                # SLURM集群：生成分阶段作业数组（前处理 → 求解 → 后处理 → 数据集汇总）
+                if Config.SCHEDULER_TYPE == "SLURM":
+                    self.generate_slurm_array_scripts()
         except Exception as e:
             print(f"批量生成脚本时出错: {str(e)}")
         finally:
+            self.triangle_button.setToolTip("批量生成脚本")
             # 显示完成星星特效
             self.show_completion_star()
             # 重新启用按钮
             self.triangle_button.setEnabled(True)
 
-    def _generate_single_script(self, cell_type, slider_value):
-        """生成单个脚本的辅助函数"""
-        try:
-            # 收集当前配置
-            config = {}
-            for label_text, dropdown in self.dropdowns.items():
-                config[label_text.replace(":", "").strip()] = dropdown.currentText()
-
-            # 收集复选框状态
-            checkbox_config = {}
-            for label_text, checkbox in self.checkboxes.items():
-                checkbox_config[label_text.replace(":", "").strip()] = checkbox.isChecked()
-
-            # 使用传入的参数覆盖cell_type
-            config['Cell type'] = cell_type
-
-            # 提取参数
-            cell_size = config.get('Cell size', '5')
-            cell_radius = config.get('Strut radius', '0.5')
-
-            # 确定速度和方向设置
-            speed_value = None
-            direction_value = None
-            if checkbox_config.get('Speed', False):
-                speed_value = config.get('Speed', '10')
-            if checkbox_config.get('Directions', False):
-                direction_value = config.get('Directions', 'X')
-
-            # 生成脚本
-            success, message, filename = generate_abaqus_script(
-                cell_type=cell_type,
-                cell_size=float(cell_size),
-                cell_radius=float(cell_radius),
-                slider=slider_value,
-                speed_value=speed_value,
-                direction_value=direction_value
-            )
-
-            if success:
-                print(f"  ✓ 生成成功: {filename}")
-            else:
-                print(f"  ✗ 生成失败: {message}")
-
-            return success
-
-        except Exception as e:
-            print(f"  ✗ 生成脚本时出错: {str(e)}")
-            return False
-
     def on_speed_direction_checkbox_changed(self, checked, label):
         """Handle mutual exclusion between Speed and Directions checkboxes and update label colors"""
         if checked:
@@ -1445,15 +1469,13 @@ class ModernInterface(QMainWindow):
                 print("未找到run_all脚本文件，无法生成PBS脚本")
                 return
 
-            # 选择最新的run_all脚本
+            # 选择最新的run_all脚本；分片时为每个分片的run_all脚本各生成一个PBS脚本
             run_all_scripts.sort()
-            latest_run_all_script = run_all_scripts[-1]
-            run_all_script_name = os.path.basename(latest_run_all_script)
-
-            # 生成PBS脚本名称 (使用run_all脚本的配置名称)
-            config_name = run_all_script_name.replace("run_all_", "").replace(".sh", "")
-            pbs_script_name = f"pbs_submit_{config_name}.pbs"
-            pbs_script_path = os.path.join(output_dir, pbs_script_name)
+            shard_scripts = getattr(self, 'current_shard_scripts', [])
+            if shard_scripts:
+                run_all_script_names = [os.path.basename(path) for path in shard_scripts if path.endswith('.sh')]
+            else:
+                run_all_script_names = [os.path.basename(run_all_scripts[-1])]
 
             # 获取task文件夹的名称(例如: task_20250930_123456)
             task_folder_name = os.path.basename(output_dir)
@@ -1467,44 +1489,205 @@ class ModernInterface(QMainWindow):
                 os.makedirs(logs_dir)
                 print(f"已创建日志目录: {logs_dir}")
 
-            # 创建PBS脚本内容
-            pbs_content = [
-                "#!/bin/bash",
-                f"#PBS -N abaqus_{config_name}",
-                "#PBS -P as_mae_kzhou",
-                "#PBS -q qintel_wfly",
-                "#PBS -l walltime=168:00:00",
-                "#PBS -l select=1:ncpus=8:mem=64gb",
-                "#PBS -j oe",
-                f"#PBS -o {Config.BASE_SCRIPT_PATH}/{task_folder_name}/logs/run_all_{config_name}.log",
-                "",
-                "cd $PBS_O_WORKDIR",
-                "",
-                "# Setup real-time logging",
-                f"LOGDIR=\"{Config.BASE_SCRIPT_PATH}/{task_folder_name}/logs\"",
-                "mkdir -p $LOGDIR",
-                f"REALTIME_LOG=\"$LOGDIR/realtime_{config_name}_$PBS_JOBID.log\"",
-                "",
-                "# Execute with real-time output",
-                f'bash "{Config.BASE_SCRIPT_PATH}/{task_folder_name}/{run_all_script_name}" 2>&1 | tee "$REALTIME_LOG" &',
-                "wait",
-                'echo "Abaqus tasks finished."'
-            ]
+            if Config.PBS_ARRAY:
+                config_name = run_all_script_names[-1].replace("run_all_", "").replace(".sh", "")
+                if self._generate_pbs_array_script(output_dir, getattr(self, 'current_config_name', config_name)):
+                    return
+                # 只有一个作业时不需要作业数组，使用普通的PBS脚本
 
-            # 写入PBS脚本文件
-            with open(pbs_script_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(pbs_content))
+            for run_all_script_name in run_all_script_names:
+                self._write_pbs_submit_script(output_dir, task_folder_name, run_all_script_name)
 
-            # 设置执行权限
-            import stat
-            os.chmod(pbs_script_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IROTH)
+        except Exception as e:
+            print(f"生成PBS脚本时出错: {str(e)}")
+
+    def _write_pbs_submit_script(self, output_dir, task_folder_name, run_all_script_name):
+        """生成在单个节点上执行一个run_all脚本的PBS脚本"""
+        import stat
+
+        # 生成PBS脚本名称 (使用run_all脚本的配置名称)
+        config_name = run_all_script_name.replace("run_all_", "").replace(".sh", "")
+        pbs_script_name = f"pbs_submit_{config_name}.pbs"
+        pbs_script_path = os.path.join(output_dir, pbs_script_name)
+
+        # 创建PBS脚本内容
+        pbs_content = [
+            "#!/bin/bash",
+            f"#PBS -N abaqus_{config_name}",
+            "#PBS -P as_mae_kzhou",
+            "#PBS -q qintel_wfly",
+            "#PBS -l walltime=168:00:00",
+            "#PBS -l select=1:ncpus=8:mem=64gb",
+            "#PBS -j oe",
+            f"#PBS -o {Config.BASE_SCRIPT_PATH}/{task_folder_name}/logs/run_all_{config_name}.log",
+            "",
+            "cd $PBS_O_WORKDIR",
+            "",
+            "# Setup real-time logging",
+            f"LOGDIR=\"{Config.BASE_SCRIPT_PATH}/{task_folder_name}/logs\"",
+            "mkdir -p $LOGDIR",
+            f"REALTIME_LOG=\"$LOGDIR/realtime_{config_name}_$PBS_JOBID.log\"",
+            "",
+            "# Execute with real-time output",
+            f'bash "{Config.BASE_SCRIPT_PATH}/{task_folder_name}/{run_all_script_name}" 2>&1 | tee "$REALTIME_LOG" &',
+            "wait",
+            'echo "Abaqus tasks finished."'
+        ]
+
+        # 写入PBS脚本文件
+        with open(pbs_script_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(pbs_content))
 
-            print(f"PBS脚本已生成: {pbs_script_path}")
-            print(f"关联的run_all脚本: {run_all_script_name}")
-            print(f"提交命令: qsub {pbs_script_name}")
+        # 设置执行权限
+        os.chmod(pbs_script_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IROTH)
+
+        print(f"PBS脚本已生成: {pbs_script_path}")
+        print(f"关联的run_all脚本: {run_all_script_name}")
+        print(f"提交命令: qsub {pbs_script_name}")
+
+    def _generate_sharded_scripts(self, python_files, task_dir, script_type, config_name):
+        """
+        按预计求解用时把本组作业均衡地分成 Config.SWEEP_SHARDS 份，每份生成一个run_all脚本，
+        各分片提交到不同节点后大致同时完成
+        """
+        from shell_script_generator import generate_shell_script, shard_python_files
+        from runtime_history import RuntimeHistory
+
+        # 运行时间记录位于 generate_script 的上一级（batch_runner 的工作目录）
+        generate_script_root = os.path.dirname(task_dir)
+        history = RuntimeHistory(os.path.join(os.path.dirname(generate_script_root), Config.RUNTIME_HISTORY_FILE))
+        shards = shard_python_files(python_files, Config.SWEEP_SHARDS, history)
+        overall = sum(total for _, total in shards) or 1.0
+
+        for index, (shard_files, total) in enumerate(shards, 1):
+            shard_name = f"{config_name}_shard{index}of{len(shards)}"
+            script_path = generate_shell_script(shard_files, task_dir, script_type, config_name=shard_name)
+            if script_path:
+                self.current_shard_scripts.append(script_path)
+            estimate = f"{total / 60:.1f}分钟" if history.records else f"占全部的 {total / overall:.0%}"
+            print(f"分片 {index}/{len(shards)}: {len(shard_files) // 2} 个作业，预计求解用时 {estimate}")
+
+    def generate_slurm_array_scripts(self):
+        """生成SLURM分阶段作业数组脚本和提交脚本"""
+        try:
+            from shell_script_generator import generate_slurm_arrays, task_job_files
+
+            if not hasattr(self, 'current_task_dir'):
+                print("错误: 未找到任务文件夹")
+                return
+
+            python_files = task_job_files(os.path.dirname(self.current_task_dir),
+                                          getattr(self, 'current_sweep_params', None),
+                                          getattr(self, 'current_sweep_files', []))
+            submit_script = generate_slurm_arrays(python_files, self.current_task_dir,
+                                                  getattr(self, 'current_config_name', None))
+            if submit_script:
+                print(f"提交命令: bash {os.path.basename(submit_script)}")
+                print("各阶段单独申请资源：前处理/后处理 "
+                      f"{Config.SLURM_CAE_CPUS} 核，求解 {Config.SLURM_CPUS_PER_TASK} 核")
 
         except Exception as e:
-            print(f"生成PBS脚本时出错: {str(e)}")
+            print(f"生成SLURM作业数组脚本时出错: {str(e)}")
+
+    def _generate_pbs_array_script(self, output_dir, config_name):
+        """
+        生成PBS作业数组脚本 (#PBS -J 1-N)
+
+        作业清单（generate_script 根目录）中属于本任务（尺寸、半径、速度/方向相同）的全部作业
+        （没有清单时为本次生成的作业）按顺序写入作业列表 sweep_<config>.txt
+        （相对 generate_script 的前处理脚本路径），第 i 个子作业按 $PBS_ARRAY_INDEX 读取第 i 行，
+        独立完成前处理 → 求解 → 后处理，日志写入 logs/array_<i>_<作业名>.log；整个扫描可以分散到多个节点同时运行
+
+        Returns:
+            bool: 是否生成了作业数组脚本；作业不足两个时不生成，由调用方改用普通的PBS脚本
+        """
+        import stat
+        from shell_script_generator import task_job_files, write_sweep_list
+
+        python_files = task_job_files(os.path.dirname(output_dir), getattr(self, 'current_sweep_params', None),
+                                      getattr(self, 'current_sweep_files', []))
+        job_count = sum(1 for path in python_files if path.endswith('_preprocess.py'))
+        if job_count < 2:
+            print(f"任务中只有 {job_count} 个作业，不生成PBS作业数组脚本")
+            return False
+        sweep_list_name, job_count = write_sweep_list(python_files, output_dir, config_name)
+
+        task_folder_name = os.path.basename(output_dir)
+        task_path = f"{Config.BASE_SCRIPT_PATH}/{task_folder_name}"
+
+        pbs_config = Config.get_pbs_header()
+        pbs_content = [
+            "#!/bin/bash",
+            f"#PBS -N abaqus_{config_name}",
+            "#PBS -P as_mae_kzhou",
+            f"#PBS -q {pbs_config['queue']}",
+            f"#PBS -l walltime={Config.PBS_ARRAY_WALLTIME}",
+            f"#PBS -l select=1:ncpus={pbs_config['ncpus']}:mem={pbs_config['memory']}",
+            f"#PBS -J 1-{job_count}",
+            "#PBS -j oe",
+            f"#PBS -o {task_path}/logs/array_{config_name}.^array_index^.log",
+            "",
+            f"BASE_DIR=\"{Config.BASE_SCRIPT_PATH}\"",
+            f"LOGDIR=\"{task_path}/logs\"",
+            "mkdir -p \"$LOGDIR\"",
+            "",
+            "# Resolve this sub-job's sample from the sweep list",
+            f"PREPROCESS=$(sed -n \"${{PBS_ARRAY_INDEX}}p\" \"{task_path}/{sweep_list_name}\")",
+            "if [ -z \"$PREPROCESS\" ]; then",
+            "    echo \"ERROR: no job for array index $PBS_ARRAY_INDEX\"",
+            "    exit 1",
+            "fi",
+            "JOB_DIR=\"$BASE_DIR/$(dirname \"$PREPROCESS\")\"",
+            "JOB_NAME=$(basename \"$PREPROCESS\" _preprocess.py)",
+            "",
+            "# Setup real-time logging",
+            "REALTIME_LOG=\"$LOGDIR/array_${PBS_ARRAY_INDEX}_${JOB_NAME}.log\"",
+            "exec > >(tee -a \"$REALTIME_LOG\") 2>&1",
+            "echo \"[$PBS_ARRAY_INDEX] $JOB_NAME on $(hostname), job $PBS_JOBID\"",
+            "",
+            f"module load {Config.ABAQUS_MODULE}",
+            "cd \"$JOB_DIR\" || exit 1",
+            "",
+            "if [ feature_data.txt -nt \"$(basename \"$PREPROCESS\")\" ] && grep -q \"status: successful\" feature_data.txt; then",
+            "    echo \"Already completed: $JOB_NAME\"",
+            "    exit 0",
+            "fi",
+            "rm -f \"$JOB_NAME.lck\"",
+            "",
+            "# Preprocess",
+            f"{Config.ABAQUS_COMMAND}=\"${{JOB_NAME}}_preprocess.py\"",
+            "if [ ! -f \"$JOB_NAME.inp\" ]; then",
+            "    echo \"ERROR: preprocessing failed for $JOB_NAME\"",
+            "    exit 1",
+            "fi",
+            "",
+            "# Solve",
+            f"echo y | abaqus job=$JOB_NAME input=$JOB_NAME.inp cpus={pbs_config['ncpus']} interactive",
+            "if [ ! -f \"$JOB_NAME.odb\" ]; then",
+            "    echo \"ERROR: solver produced no ODB for $JOB_NAME\"",
+            "    exit 1",
+            "fi",
+            "",
+            "# Postprocess, then remove the ODB and scratch files",
+            f"{Config.ABAQUS_COMMAND}=\"${{JOB_NAME}}_postprocess.py\"",
+            "rm -rf \"$JOB_NAME.odb\" " + " ".join(f"\"$JOB_NAME{ext}\"" for ext in Config.SOLVER_SCRATCH_EXTENSIONS),
+            "if ! grep -q \"status: successful\" feature_data.txt 2>/dev/null; then",
+            "    echo \"ERROR: postprocessing failed for $JOB_NAME\"",
+            "    exit 1",
+            "fi",
+            "echo \"Abaqus task finished: $JOB_NAME\"",
+        ]
+
+        pbs_script_name = f"pbs_array_{config_name}.pbs"
+        pbs_script_path = os.path.join(output_dir, pbs_script_name)
+        with open(pbs_script_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write('\n'.join(pbs_content) + '\n')
+        os.chmod(pbs_script_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IROTH)
+
+        print(f"PBS作业数组脚本已生成: {pbs_script_path}")
+        print(f"作业列表: {sweep_list_name}（{job_count} 个子作业）")
+        print(f"提交命令: qsub {pbs_script_name}")
+        return True
 
 
 
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+作业运行时间记录 - 按 (cell_type, size, radius, slider, mode) 记录每次求解的用时，
+批量调度器据此按"最长作业优先"排序，避免少数大作业最后才开始而拉长总用时
+"""
+import heapq
+import json
+import math
+import os
+import threading
+
+import numpy as np
+
+from config import Config
+from script_generator import calculate_mesh_size
+from structure_set import get_structure_geometry
+
+
+def parse_job_key(key):
+    """
+    解析作业键（层级目录 cell_type/size/radius/slider/mode，如 BCC/4/0p3/0/static）
+
+    Returns:
+        (cell_type, cell_size, cell_radius, slider, mode)，格式不符时返回 None
+    """
+    parts = key.split('/')
+    if len(parts) != 5:
+        return None
+    try:
+        return parts[0], float(parts[1]), float(parts[2].replace('p', '.')), int(parts[3]), parts[4]
+    except ValueError:
+        return None
+
+
+def static_estimate(key):
+    """
+    无历史记录时的相对计算量估计：杆件总长 × 晶胞尺寸 × 半径² / 网格尺寸³
+
+    杆件总长 × 晶胞尺寸 × 半径² 正比于实体体积，除以生成脚本所用网格尺寸（随半径变化，
+    见 script_generator.calculate_mesh_size）的立方后正比于实体单元数
+
+    Returns:
+        float | None: 相对计算量（无量纲），无法估计时返回 None
+    """
+    params = parse_job_key(key)
+    if params is None:
+        return None
+    cell_type, cell_size, cell_radius, slider, _ = params
+    geometry = get_structure_geometry(cell_type, slider)
+    if geometry is None or not len(geometry.edges):
+        return None
+    strut_length = np.linalg.norm(geometry.nodes[geometry.edges[:, 0]] - geometry.nodes[geometry.edges[:, 1]], axis=1).sum()
+    return float(strut_length) * cell_size * cell_radius ** 2 / calculate_mesh_size(cell_radius) ** 3
+
+
+def estimate_requirements(key):
+    """
+    按相对计算量估计作业的资源需求 (CPU数, 内存GB)
+
+    参考作业 Config.SOLVER_REFERENCE_JOB 的需求为 Config.SOLVER_CPUS / SOLVER_MEMORY_GB：
+    内存按 static_estimate 之比缩放（不低于 Config.SOLVER_MIN_MEMORY_GB）；
+    比参考作业小的作业按比例减少CPU数（至少1个），更大的作业不超过 SOLVER_CPUS。
+    Config.SOLVER_SCALE_REQUIREMENTS 关闭或无法估计时返回默认值
+    """
+    cpus, memory_gb = Config.SOLVER_CPUS, Config.SOLVER_MEMORY_GB
+    if not Config.SOLVER_SCALE_REQUIREMENTS:
+        return cpus, memory_gb
+    estimate, reference = static_estimate(key), static_estimate(Config.SOLVER_REFERENCE_JOB)
+    if not estimate or not reference:
+        return cpus, memory_gb
+    ratio = estimate / reference
+    return (min(cpus, max(1, math.ceil(cpus * ratio))),
+            max(Config.SOLVER_MIN_MEMORY_GB, round(memory_gb * ratio, 1)))
+
+
+def predict_makespan(durations, slots):
+    """按给定顺序把作业依次分配给最先空闲的槽位（列表调度），返回预计总用时"""
+    finish_times = [0.0] * max(1, slots)
+    for duration in durations:
+        heapq.heappush(finish_times, heapq.heappop(finish_times) + duration)
+    return max(finish_times)
+
+
+def partition_longest_first(durations, shards):
+    """
+    贪心LPT分片：按用时从长到短，依次放入当前总用时最小的分片
+
+    Returns:
+        (每个作业所属的分片号列表, 各分片的预计总用时列表)
+    """
+    loads = [(0.0, shard) for shard in range(max(1, shards))]
+    assignment = [0] * len(durations)
+    for index in sorted(range(len(durations)), key=lambda i: -durations[i]):
+        load, shard = heapq.heappop(loads)
+        assignment[index] = shard
+        heapq.heappush(loads, (load + durations[index], shard))
+    totals = [0.0] * len(loads)
+    for load, shard in loads:
+        totals[shard] = load
+    return assignment, totals
+
+
+class RuntimeHistory:
+    """
+    求解用时历史记录 (JSON)：{作业键: {"solve_seconds": 平均用时, "runs": 次数}}
+
+    静态估计通过已有记录换算为秒（按 mode 分别求 用时/估计值 的中位数），
+    有记录与无记录的作业可以放在一起排序
+    """
+
+    def __init__(self, path=None):
+        self.path = path or Config.RUNTIME_HISTORY_FILE
+        self.lock = threading.Lock()
+        self.records = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.records = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"警告: 运行时间记录无法读取，将重新记录: {e}")
+        self._scales = None
+
+    def record(self, key, seconds):
+        """记录一次求解用时并立即保存"""
+        if not key:
+            return
+        with self.lock:
+            entry = self.records.get(key, {'solve_seconds': 0.0, 'runs': 0})
+            runs = entry['runs'] + 1
+            entry = {'solve_seconds': entry['solve_seconds'] + (seconds - entry['solve_seconds']) / runs, 'runs': runs}
+            self.records[key] = entry
+            self._scales = None
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.records, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.path)
+
+    def _calibration(self):
+        """各 mode 及全部作业的 用时/静态估计 中位数"""
+        if self._scales is None:
+            ratios = {}
+            for key, entry in self.records.items():
+                estimate = static_estimate(key)
+                if estimate:
+                    mode = key.rsplit('/', 1)[-1]
+                    ratios.setdefault(mode, []).append(entry['solve_seconds'] / estimate)
+                    ratios.setdefault(None, []).append(entry['solve_seconds'] / estimate)
+            self._scales = {mode: float(np.median(values)) for mode, values in ratios.items()}
+        return self._scales
+
+    def estimate(self, key):
+        """
+        预计求解用时
+
+        Returns:
+            (预计值, 来源)：来源为 'history'（秒）、'calibrated'（由静态估计换算的秒）
+            或 'static'（无任何记录，仅可用于相对排序）；无法估计时为 (None, None)
+        """
+        entry = self.records.get(key) if key else None
+        if entry:
+            return entry['solve_seconds'], 'history'
+        estimate = static_estimate(key) if key else None
+        if estimate is None:
+            return None, None
+        scales = self._calibration()
+        scale = scales.get(key.rsplit('/', 1)[-1], scales.get(None))
+        if scale is None:
+            return estimate, 'static'
+        return estimate * scale, 'calibrated'
+
+    def order_longest_first(self, jobs):
+        """
+        按预计用时从长到短排序（无法估计的作业放在最后，保持原有顺序）
+
+        Returns:
+            (排序后的作业列表, 按相同顺序的预计用时列表, 预计值是否都以秒为单位)
+        """
+        estimates = [self.estimate(job.get('key')) for job in jobs]
+        order = sorted(range(len(jobs)), key=lambda i: (estimates[i][0] is None, -(estimates[i][0] or 0)))
+        in_seconds = all(source in ('history', 'calibrated') for _, source in estimates)
+        return [jobs[i] for i in order], [estimates[i][0] for i in order], in_seconds
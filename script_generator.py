@@ -6,13 +6,187 @@ Abaqus Script Generator
 import os
 import sys
 import re
+import json
+import hashlib
+import logging
+import time
 import platform
-from structure_set import get_crystal_structure
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from config import Config
+from structure_set import get_structure_geometry
+from template_engine import SlotSpec, compile_template
+from job_manifest import append_job_records, build_job_record, get_manifest_path
+
+logger = logging.getLogger(__name__)
 
 
 # from macro_integration import MacroIntegrator
 
 
+# ========== 模板槽位定义 ==========
+# 顺序与原先逐次 re.sub 的替换顺序一致，重叠时排在前面的槽位优先
+CUTTING_SLOTS = [
+    SlotSpec('cut_offset', r'offset=3(?=\))'),
+    SlotSpec('cut_depth', r'depth=6(?=,)'),
+    SlotSpec('cut_origin_top', r'origin=\(0\.0, 0\.0, 2\.5\)'),
+    SlotSpec('cut_origin_side', r'origin=\(0\.0, 2\.5, 0\.0\)'),
+    SlotSpec('cut_inner_point1', r'point1=\(-2\.5, -2\.5\)'),
+    SlotSpec('cut_inner_point2', r'point2=\(2\.5, 2\.5\)'),
+    SlotSpec('cut_outer_point1', r'point1=\(-5\.0, -5\.0\)'),
+    SlotSpec('cut_outer_point2', r'point2=\(5\.0, 5\.0\)'),
+]
+
+STEEL_PLATE_SLOTS = [
+    SlotSpec('plate_point1', r'point1=\(-3\.0, 0\.0\)'),
+    SlotSpec('plate_point2', r'point2=\(3\.0, 0\.0\)'),
+    SlotSpec('plate_depth', r'depth=6\.0(?=\))'),
+    SlotSpec('plate_vector_bottom', r'vector=\(0\.0, -2\.5, -3\.0\)'),
+    SlotSpec('plate_vector_top', r'vector=\(0\.0, 2\.5, -3\.0\)'),
+]
+
+DIRECTION_X_SLOTS = [
+    SlotSpec('direction_x_displacement', r'u2=-0\.4\*cell_size'),
+    SlotSpec('direction_x_bc', r'u1=0\.0, u2=u2,'),
+    SlotSpec('direction_x_step', r'u2=u2,'),
+]
+
+DIRECTION_X_VALUES = {
+    'direction_x_displacement': 'u1=-0.4*cell_size',
+    'direction_x_bc': 'u1=u1, u2=0.0,',
+    'direction_x_step': 'u1=u1,',
+}
+
+TEMPLATE_SLOTS = [
+    SlotSpec('radius', r'radius = [\d.]+\s*$', re.MULTILINE),
+    SlotSpec('mesh_size', r'p\.seedPart\(size=([\d.]+)\s*,', count=1, group=1),
+    SlotSpec('cell_size', r'cell_size = [\d.]+\s*$', re.MULTILINE),
+    SlotSpec('coordinates', r'# 定义关键点坐标\s*\n.*?\n\s*# 定义圆柱体连接', re.DOTALL, count=1),
+    SlotSpec('cylinders', r'cylinders = \[([^\]]*(?:\[[^\]]*\][^\]]*)*)?\]', re.DOTALL),
+] + CUTTING_SLOTS + STEEL_PLATE_SLOTS + [
+    SlotSpec('velocity2', r'velocity2=-?\d+\.?\d*'),
+] + DIRECTION_X_SLOTS
+
+
+def calculate_mesh_size(cell_radius):
+    """
+    根据radius计算网格密度（seedPart 的 size）
+
+    基准: radius=0.3 对应 mesh_size=0.2；
+    mesh_size = base_mesh_size * (radius / base_radius)^0.5，
+    使用平方根使网格密度增长速度比radius慢，避免网格过粗；结果保留两位小数
+    """
+    base_radius = 0.3
+    base_mesh_size = 0.2
+    radius_ratio = float(cell_radius) / base_radius
+    return round(base_mesh_size * (radius_ratio ** 0.5), 2)
+
+
+# ========== 模板文件缓存 ==========
+# 解析后的模板路径 -> ((mtime_ns, size), 模板内容)
+# 同一进程内的整批生成只读一次磁盘；模板被修改后（mtime/size变化）自动重新读取
+_template_cache = {}
+
+
+def _load_template_file(template_path):
+    """
+    读取模板文件（带缓存）
+
+    Args:
+        template_path: 模板文件路径（开发环境或 PyInstaller 解包目录）
+
+    Returns:
+        str: 模板内容
+
+    Raises:
+        FileNotFoundError: 模板文件不存在
+    """
+    resolved_path = os.path.realpath(template_path)
+    stat = os.stat(resolved_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _template_cache.get(resolved_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(resolved_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    _template_cache[resolved_path] = (signature, content)
+    return content
+
+
+def clear_template_cache():
+    """清空模板文件缓存"""
+    _template_cache.clear()
+
+
+# ========== 增量生成清单 ==========
+# 每个作业目录下的清单文件记录: 脚本文件名 -> {'hash': 内容哈希, 'size': 文件大小}
+# 哈希覆盖生成器版本与渲染后的内容（作业参数已按统一格式写入脚本，界面传入的 '5' 与命令行的 5.0 得到相同哈希）；
+# 修改脚本生成逻辑时递增 GENERATOR_VERSION
+GENERATOR_VERSION = 1
+
+
+def _content_hash(content):
+    """计算渲染后的脚本内容 + 生成器版本的哈希"""
+    digest = hashlib.sha256()
+    digest.update(f"{GENERATOR_VERSION}\0".encode('utf-8'))
+    digest.update(content.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _load_manifest(directory):
+    """读取目录下的生成清单，不存在或损坏时返回空字典"""
+    manifest_path = os.path.join(directory, Config.SCRIPT_MANIFEST_FILE)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(directory, manifest):
+    """写入目录下的生成清单（先写临时文件再替换，避免中断时留下半个文件）"""
+    manifest_path = os.path.join(directory, Config.SCRIPT_MANIFEST_FILE)
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+
+def _manifest_matches(manifest, directory, hashes):
+    """清单中所有脚本的哈希一致，且磁盘上的文件存在、大小未变时返回True"""
+    for name, content_hash in hashes.items():
+        entry = manifest.get(name)
+        if not isinstance(entry, dict) or entry.get('hash') != content_hash:
+            return False
+        try:
+            if os.path.getsize(os.path.join(directory, name)) != entry.get('size'):
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _write_script_files(directory, contents, manifest, force=False):
+    """
+    将一个作业的脚本写入已存在的目录，并更新内存中的清单（由调用方负责保存）
+
+    返回:
+    - (written: bool, hashes: dict): 是否实际写入（内容未变化且未指定 force 时为False），以及 {脚本文件名: 内容哈希}
+    """
+    hashes = {name: _content_hash(content) for name, content in contents.items()}
+    if not force and _manifest_matches(manifest, directory, hashes):
+        return False, hashes
+
+    # 使用UTF-8编码并添加BOM以确保兼容性
+    for name, content in contents.items():
+        filepath = os.path.join(directory, name)
+        with open(filepath, 'w', encoding='utf-8-sig') as f:
+            f.write(content)
+        manifest[name] = {'hash': hashes[name], 'size': os.path.getsize(filepath)}
+    return True, hashes
+
 
 class AbaqusScriptGenerator:
     def __init__(self):
@@ -28,7 +202,7 @@ class AbaqusScriptGenerator:
         self._file_tracker_callback = callback
 
 
-    def generate_script(self, cell_type, cell_size, cell_radius, slider=4, output_dir=None, speed_value=None, direction_value=None, batch_mode=False, batch_parent_dir=None):
+    def generate_script(self, cell_type, cell_size, cell_radius, slider=4, output_dir=None, speed_value=None, direction_value=None, batch_mode=False, batch_parent_dir=None, force=False):
         """
         生成定制化的Abaqus脚本
 
@@ -42,107 +216,125 @@ class AbaqusScriptGenerator:
         - direction_value: 方向值 (当Direction复选框选中时)
         - batch_mode: 是否为批量模式
         - batch_parent_dir: 批量模式的父文件夹路径
+        - force: 忽略生成清单，强制重写脚本（默认内容未变化时跳过写入）
 
         返回:
         - (success: bool, message: str, filename: str)
         """
-
+        success, message, filename, written, hashes = self._generate_script(
+            cell_type, cell_size, cell_radius, slider, output_dir, speed_value, direction_value, batch_mode, batch_parent_dir, force
+        )
+        if success:
+            # 将作业登记到任务目录的作业清单（内容未变化且清单已存在时无需重复登记）
+            try:
+                task_dir = self._resolve_base_output_dir(batch_mode, batch_parent_dir, output_dir)
+                if written or not os.path.exists(get_manifest_path(task_dir)):
+                    job_dir = self._build_hierarchical_path(task_dir, cell_type, cell_size, cell_radius, slider, speed_value, direction_value)
+                    append_job_records(task_dir, [build_job_record(
+                        task_dir, job_dir, filename, cell_type, cell_size, cell_radius, slider, speed_value, direction_value, hashes
+                    )])
+            except OSError as e:
+                logger.warning("无法写入作业清单: %s", e)
+        return success, message, filename
+
+    def _generate_script(self, cell_type, cell_size, cell_radius, slider=4, output_dir=None, speed_value=None, direction_value=None, batch_mode=False, batch_parent_dir=None, force=False):
+        """generate_script 的实现，额外返回是否实际写入了文件及脚本内容哈希: (success, message, filename, written, hashes)"""
         try:
-            # 统一的文件夹创建逻辑
-            output_dir = self._create_output_directory(cell_type, cell_size, cell_radius, slider, speed_value, direction_value, batch_mode, batch_parent_dir, output_dir)
-
-            # 设置当前结构名称，用于结构感知检测
-            self._current_structure_name = cell_type
-
-            # 1. 验证参数
-            if not self._validate_parameters(cell_type, cell_size, cell_radius):
-                return False, "参数验证失败", ""
-
-            # 2. 读取基础模板
-            template_content = self._read_template(speed_value, direction_value)
-            if not template_content:
-                return False, "无法读取模板文件", ""
-
-            # 3. 获取结构几何定义
-            structure_data = self._get_structure_data(cell_type, slider)
-            if not structure_data:
-                return False, f"不支持的结构类型: {cell_type}", ""
-
-            # 4. 生成文件名
-            filename = self._generate_filename(cell_type, cell_size, cell_radius, slider, speed_value, direction_value)
-
-            # 5. 生成脚本内容
-            script_content = self._generate_script_content(
-                template_content, structure_data, cell_size, cell_radius, slider, speed_value, direction_value, output_dir, filename
+            success, message, filename, output_dir, contents = self._render_script(
+                cell_type, cell_size, cell_radius, slider, output_dir, speed_value, direction_value, batch_mode, batch_parent_dir
             )
+            if not success:
+                return False, message, "", False, {}
 
+            os.makedirs(output_dir, exist_ok=True)
 
+            # 增量生成：内容和生成器版本均未变化且文件完好时跳过写入，保持文件mtime不变
+            manifest = _load_manifest(output_dir)
+            names = ' 和 '.join(contents)
+            written, hashes = _write_script_files(output_dir, contents, manifest, force)
+            if written:
+                _save_manifest(output_dir, manifest)
 
-            # 6. 保存前处理脚本
-            preprocess_filename = filename.replace('.py', '_preprocess.py')
-            preprocess_filepath = os.path.join(output_dir, preprocess_filename)
-
-            # 使用UTF-8编码并添加BOM以确保兼容性
-            with open(preprocess_filepath, 'w', encoding='utf-8-sig') as f:
-                f.write(script_content)
-
-            # 将生成的文件添加到追踪列表
-            if hasattr(self, '_file_tracker_callback') and self._file_tracker_callback:
-                try:
-                    self._file_tracker_callback(preprocess_filepath)
-                except Exception as e:
-                    print(f"Warning: 无法添加文件到追踪列表: {e}")
-
-            # 7. 生成并保存后处理脚本
-            postprocess_content = self._generate_postprocess_script(
-                output_dir, cell_size, speed_value, direction_value, filename
-            )
-            postprocess_filename = filename.replace('.py', '_postprocess.py')
-            postprocess_filepath = os.path.join(output_dir, postprocess_filename)
-
-            with open(postprocess_filepath, 'w', encoding='utf-8-sig') as f:
-                f.write(postprocess_content)
-
-            # 将后处理文件也添加到追踪列表
+            # 将生成的文件添加到追踪列表（内容未变化的脚本只跳过写入，仍需调度；已完成的作业由运行脚本跳过）
             if hasattr(self, '_file_tracker_callback') and self._file_tracker_callback:
-                try:
-                    self._file_tracker_callback(postprocess_filepath)
-                except Exception as e:
-                    print(f"Warning: 无法添加文件到追踪列表: {e}")
+                for name in contents:
+                    try:
+                        self._file_tracker_callback(os.path.join(output_dir, name))
+                    except Exception as e:
+                        logger.warning("无法添加文件到追踪列表: %s", e)
 
-            return True, f"脚本生成成功: {preprocess_filename} 和 {postprocess_filename}", filename
+            if not written:
+                return True, f"脚本未变化，跳过写入: {names}", filename, False, hashes
+            return True, f"脚本生成成功: {names}", filename, True, hashes
 
         except Exception as e:
-            return False, f"生成脚本时出错: {str(e)}", ""
+            return False, f"生成脚本时出错: {str(e)}", "", False, {}
 
-    def _create_output_directory(self, cell_type, cell_size, cell_radius, slider, speed_value, direction_value, batch_mode, batch_parent_dir, output_dir):
+    def _render_script(self, cell_type, cell_size, cell_radius, slider=4, output_dir=None, speed_value=None, direction_value=None, batch_mode=False, batch_parent_dir=None):
         """
-        统一的文件夹创建逻辑 - 层级结构
-        创建层级结构: clean_cell_type -> clean_cell_type_suffix -> clean_cell_type_size_suffix -> clean_cell_type_size_radius_suffix -> clean_cell_type_size_radius_slider_suffix
+        在内存中生成前处理与后处理脚本，不创建目录也不写入文件
+
+        返回:
+        - (success: bool, message: str, filename: str, output_dir: str, contents: dict)
+          output_dir 为层级结构中的目标目录，contents 为 {脚本文件名: 内容}（前处理在前）
         """
-        # 获取基础目录
+        # 界面传入字符串、命令行传入浮点数：统一为浮点数，相同参数生成逐字节相同的脚本（内容哈希一致）
+        try:
+            cell_size, cell_radius = float(cell_size), float(cell_radius)
+        except (ValueError, TypeError):
+            pass  # 由参数验证报告
+
+        # 层级结构: clean_cell_type -> size -> radius -> slider -> suffix
+        base_output_dir = self._resolve_base_output_dir(batch_mode, batch_parent_dir, output_dir)
+        output_dir = self._build_hierarchical_path(base_output_dir, cell_type, cell_size, cell_radius, slider, speed_value, direction_value)
+
+        # 设置当前结构名称，用于结构感知检测
+        self._current_structure_name = cell_type
+
+        # 1. 验证参数
+        if not self._validate_parameters(cell_type, cell_size, cell_radius):
+            return False, "参数验证失败", "", output_dir, {}
+
+        # 2. 读取基础模板
+        template_content = self._read_template(speed_value, direction_value)
+        if not template_content:
+            return False, "无法读取模板文件", "", output_dir, {}
+
+        # 3. 获取结构几何定义
+        geometry = self._get_structure_data(cell_type, slider)
+        if geometry is None:
+            return False, f"不支持的结构类型: {cell_type}", "", output_dir, {}
+
+        # 4. 生成文件名
+        filename = self._generate_filename(cell_type, cell_size, cell_radius, slider, speed_value, direction_value)
+
+        # 5. 生成前处理与后处理脚本内容
+        script_content = self._generate_script_content(
+            template_content, geometry, cell_size, cell_radius, slider, speed_value, direction_value, output_dir, filename
+        )
+        postprocess_content = self._generate_postprocess_script(
+            output_dir, cell_size, speed_value, direction_value, filename
+        )
+
+        contents = {
+            filename.replace('.py', '_preprocess.py'): script_content,
+            filename.replace('.py', '_postprocess.py'): postprocess_content,
+        }
+        return True, "", filename, output_dir, contents
+
+    def _resolve_base_output_dir(self, batch_mode, batch_parent_dir, output_dir):
+        """确定层级目录结构的根目录"""
         if batch_mode and batch_parent_dir:
-            base_output_dir = batch_parent_dir
+            return batch_parent_dir
+        if output_dir is not None:
+            return output_dir
+        if getattr(sys, 'frozen', False):
+            # 打包环境：获取可执行文件所在目录
+            current_dir = os.path.dirname(sys.executable)
         else:
-            if output_dir is None:
-                if getattr(sys, 'frozen', False):
-                    # 打包环境：获取可执行文件所在目录
-                    current_dir = os.path.dirname(sys.executable)
-                else:
-                    # 开发环境：获取脚本文件所在目录
-                    current_dir = os.path.dirname(os.path.abspath(__file__))
-                base_output_dir = os.path.join(current_dir, "generate_script")
-            else:
-                base_output_dir = output_dir
-
-        # 构建层级路径
-        target_output_dir = self._build_hierarchical_path(base_output_dir, cell_type, cell_size, cell_radius, slider, speed_value, direction_value)
-
-        # 确保目录存在
-        if not os.path.exists(target_output_dir):
-            os.makedirs(target_output_dir)
-
-        return target_output_dir
+            # 开发环境：获取脚本文件所在目录
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+        return os.path.join(current_dir, "generate_script")
 
     def _build_hierarchical_path(self, base_dir, cell_type, cell_size, cell_radius, slider, speed_value, direction_value):
         """
@@ -212,9 +404,7 @@ class AbaqusScriptGenerator:
     def _read_template(self, speed_value=None, direction_value=None):
         """读取基础模板文件，只有在对应功能被选中时才使用特定模板"""
         try:
-            print(f"=== 模板选择调试信息 ===")
-            print(f"speed_value: {speed_value}")
-            print(f"direction_value: {direction_value}")
+            logger.debug("模板选择: speed_value=%s, direction_value=%s", speed_value, direction_value)
 
             # 根据复选框是否被选中来选择模板文件
             if direction_value is not None:
@@ -224,15 +414,15 @@ class AbaqusScriptGenerator:
                     template_file = self.base_template_file_static
                 else:
                     template_file = self.base_template_file_dynamic
-                print(f"Direction复选框已选中，使用方向模板: {template_file}")
+                logger.debug("Direction复选框已选中，使用方向模板: %s", template_file)
             elif speed_value is not None:
                 # Speed复选框被选中
                 template_file = self.base_template_file_dynamic
-                print(f"Speed复选框已选中，使用动态模板: {template_file}")
+                logger.debug("Speed复选框已选中，使用动态模板: %s", template_file)
             else:
                 # 没有复选框被选中，使用默认静态模板
                 template_file = self.base_template_file_static
-                print(f"使用默认静态模板: {template_file}")
+                logger.debug("使用默认静态模板: %s", template_file)
 
             # 处理 PyInstaller 打包后的资源文件路径
             if getattr(sys, 'frozen', False):
@@ -243,110 +433,54 @@ class AbaqusScriptGenerator:
                 # 开发环境
                 template_path = os.path.join(os.path.dirname(__file__), template_file)
 
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _load_template_file(template_path)
         except FileNotFoundError as e:
-            print(f"模板文件未找到: {template_path}")
-            print(f"错误详情: {e}")
+            logger.error("模板文件未找到: %s (%s)", template_path, e)
             return None
         except Exception as e:
-            print(f"读取模板文件出错: {e}")
-            print(f"模板路径: {template_path}")
+            logger.error("读取模板文件出错: %s, 模板路径: %s", e, template_path)
             return None
 
     def _get_structure_data(self, cell_type, slider=4):
-        """获取结构几何数据"""
+        """获取结构几何数据（StructureGeometry），结构不存在时返回None"""
         try:
-            # 使用structure_set.py中的函数获取结构定义，传递slider参数
-            structure_output = get_crystal_structure(cell_type, slider)
-
-            # 检查是否是错误消息
-            if isinstance(structure_output, str) and "不存在" in structure_output:
-                return None
-
-            # 解析字符串格式的输出
-            return self._parse_structure_output(structure_output)
+            # 使用structure_set.py中的结构几何接口，按 (cell_type, slider) 缓存
+            return get_structure_geometry(cell_type, slider)
         except Exception as e:
-            print(f"Error in _get_structure_data: {e}")
+            logger.error("获取结构数据出错: %s", e)
             return None
 
-    def _parse_structure_output(self, structure_output):
-        """解析结构输出，提取坐标和连接定义"""
-        lines = structure_output.split('\n')
-        coords = []
-        cylinders = []
-
-        in_cylinders_section = False
-
-        for line in lines:
-            line = line.strip()
-
-            # 跳过注释和空行
-            if not line or line.startswith('#'):
-                continue
-
-            # 检测cylinders部分开始
-            if 'cylinders = [' in line:
-                in_cylinders_section = True
-                continue
-
-            # cylinders部分结束
-            if in_cylinders_section and line == ']':
-                in_cylinders_section = False
-                continue
-
-            # 处理坐标定义
-            if '=' in line and not in_cylinders_section and 'cylinders' not in line:
-                coords.append(line)
-
-            # 处理cylinders连接
-            elif in_cylinders_section:
-                # 移除末尾的逗号并添加到列表
-                cylinder_line = line.rstrip(',').strip()
-                if cylinder_line:
-                    cylinders.append(cylinder_line)
-
-        return {'coords': coords, 'cylinders': cylinders}
-
-    def _generate_script_content(self, template_content, structure_data, cell_size, cell_radius, slider=4, speed_value=None, direction_value=None, output_dir=None, script_filename=None):
-        """生成最终的脚本内容"""
-        content = template_content
-
-        # 1. 替换半径参数
-        content = self._replace_radius(content, cell_radius)
-
-        # 1.5. 替换模板开头的cell_size值
-        content = self._replace_template_cell_size(content, cell_size)
-
-        # 2. 替换坐标定义
-        content = self._replace_coordinates(content, structure_data['coords'], cell_size)
-
-        # 3. 替换cylinders连接
-        content = self._replace_cylinders(content, structure_data['cylinders'])
-
-        # 4. 替换切割参数（新增）
-        content = self._replace_cutting_parameters(content, cell_size, cell_radius)
-
-        # 5. 替换钢板尺寸和位置（新增）
-        content = self._replace_steel_plate_dimensions(content, cell_size)
-
-        # # 6. 生成上下刚体识别代码
-        # rigid_body_code = self._generate_rigid_body_detection(structure_data, cell_size)
-        # content = self._insert_rigid_body_detection(content, rigid_body_code)
-
-
-        # 8. 替换velocity2参数（当使用动态模板时）
+    def _generate_script_content(self, template_content, geometry, cell_size, cell_radius, slider=4, speed_value=None, direction_value=None, output_dir=None, script_filename=None):
+        """生成最终的脚本内容（模板编译后按槽位单次拼接）"""
+        # 模板只在首次使用时解析一次，之后每个作业只做一次拼接
+        template = compile_template(template_content, TEMPLATE_SLOTS)
+        values = self._build_slot_values(geometry, cell_size, cell_radius, speed_value, direction_value)
+        job_settings = self._build_job_settings(output_dir, cell_size, speed_value, direction_value, script_filename)
+        return template.render(values, job_settings)
+
+    def _build_slot_values(self, geometry, cell_size, cell_radius, speed_value=None, direction_value=None):
+        """计算所有模板槽位的替换文本"""
+        values = {
+            'radius': f'radius = {cell_radius}',
+            'mesh_size': str(self._calculate_mesh_size(cell_radius)),
+            'cell_size': self._build_cell_size_line(cell_size),
+            'coordinates': self._build_coordinates_section(geometry, cell_size),
+            'cylinders': self._build_cylinders_section(geometry),
+        }
+        values.update(self._cutting_slot_values(cell_size, cell_radius))
+        values.update(self._steel_plate_slot_values(cell_size))
+
+        # 替换velocity2参数（当使用动态模板时）
         if speed_value is not None:
-            content = self._replace_velocity_parameters(content, speed_value)
-
+            velocity_line = self._build_velocity_line(speed_value)
+            if velocity_line is not None:
+                values['velocity2'] = velocity_line
 
-        # 10. 设置作业文件保存路径到脚本文件同级目录
-        # content = self._set_job_directory(content, output_dir)
-
-        # 11. 追加作业设置、提交和等待语句
-        content = self._append_job_settings(content, output_dir, cell_size, speed_value, direction_value, script_filename)
+        # Direction X 模式: u2 改为 u1
+        if direction_value == "X":
+            values.update(DIRECTION_X_VALUES)
 
-        return content
+        return values
 
     # def _determine_script_type(self, speed_value, direction_value):
     #     """确定脚本类型"""
@@ -358,8 +492,8 @@ class AbaqusScriptGenerator:
     #         return "static"
 
     
-    def _append_job_settings(self, content, output_dir, cell_size, speed_value=None, direction_value=None, script_filename=None):
-        """在 content 末尾追加 Job 设置和提交语句（前处理脚本）"""
+    def _build_job_settings(self, output_dir, cell_size, speed_value=None, direction_value=None, script_filename=None):
+        """生成追加在前处理脚本末尾的 Job 设置和提交语句"""
         import os
         # 使用脚本文件名（去掉.py扩展名）作为job_name
         if script_filename:
@@ -443,15 +577,6 @@ if top_faces:
         else:
             disp_var_name = "U2"  # 默认使用U2
 
-        # 如果是Direction X模式，需要替换模板中的u2变量定义
-        if direction_value == "X":
-            # 替换 u2=-0.4*cell_size 为 u1=-0.4*cell_size
-            content = re.sub(r'u2=-0\.4\*cell_size', 'u1=-0.4*cell_size', content)
-            # 替换边界条件中的 u2=u2 为 u1=u1 (在DisplacementBC中)
-            content = re.sub(r'u1=0\.0, u2=u2,', 'u1=u1, u2=0.0,', content)
-            # 替换setValuesInStep中的 u2=u2 为 u1=u1
-            content = re.sub(r'u2=u2,', 'u1=u1,', content)
-
         addition = f"""
 {velocity_bc_code}
 {tie_constraint_code}
@@ -497,7 +622,7 @@ print("CAE will exit after script completion to release license.")
 # 注意：不要使用 sys.exit()，它会导致批处理脚本也退出
 
 """
-        return content.rstrip() + addition
+        return addition
 
     def _generate_postprocess_script(self, output_dir, cell_size, speed_value=None, direction_value=None, script_filename=None):
         """生成后处理脚本内容"""
@@ -545,6 +670,15 @@ print("Waiting for job completion...")
 timeout = 3600  # 1小时超时
 start_time = time.time()
 job_status = "unknown"  # 记录作业状态: completed, timeout, no_odb
+# 由批量调度器在求解结束后调用时作业已完成，无需任何等待
+already_completed = os.path.exists(odb_filename) and not os.path.exists(lck_filename)
+poll_interval = 0.5  # 轮询间隔从0.5秒逐步增加到10秒，短作业完成后能尽快开始后处理
+
+
+def wait_poll_interval():
+    global poll_interval
+    time.sleep(poll_interval)
+    poll_interval = min(poll_interval * 2, 10)
 
 try:
     while not os.path.exists(odb_filename):
@@ -552,7 +686,7 @@ try:
             print("WARNING: Timeout - ODB file not created after 1 hour")
             job_status = "no_odb"
             break
-        time.sleep(10)
+        wait_poll_interval()
         print("Waiting for ODB to be created...")
 
     if job_status == "unknown":
@@ -564,14 +698,15 @@ try:
                 print("WARNING: Timeout - Job still running after 1 hour, will attempt data extraction anyway")
                 job_status = "timeout"
                 break
-            time.sleep(10)
+            wait_poll_interval()
             print("Analysis running (lck file exists)...")
 
         if job_status == "unknown":
             print("Analysis completed (lck file removed). Starting post-processing...")
             job_status = "successful"
 
-        time.sleep(2)  # 短暂等待确保文件写入完成
+        if not already_completed:
+            time.sleep(2)  # 短暂等待确保文件写入完成
 
 except Exception as e:
     print("ERROR during job monitoring: " + str(e))
@@ -801,11 +936,8 @@ print("CAE will exit after script completion to release license.")
             cell_size_float = float(cell_size)
             amp_value = base_amp * (cell_size_float / base_size)
 
-            print(f"\n=== Amp-1参数替换调试信息 ===")
-            print(f"单元尺寸: {cell_size_float}")
-            print(f"基础尺寸: {base_size}")
-            print(f"基础Amp值: {base_amp}")
-            print(f"计算的Amp值: {amp_value}")
+            logger.debug("Amp-1参数: 单元尺寸=%s, 基础尺寸=%s, 基础Amp值=%s, 计算的Amp值=%s",
+                         cell_size_float, base_size, base_amp, amp_value)
 
             # 格式化数值，保持4位小数精度，然后移除尾随零
             formatted_amp = f"{amp_value:.4f}".rstrip('0').rstrip('.')
@@ -824,164 +956,69 @@ print("CAE will exit after script completion to release license.")
             size_replacement = f'size={formatted_amp}'
             content = re.sub(size_pattern, size_replacement, content)
 
-            print(f"已将Amp-1参数替换为: {formatted_amp}")
-            print(f"已将seedPart size参数替换为: {formatted_amp}")
+            logger.debug("已将Amp-1参数和seedPart size参数替换为: %s", formatted_amp)
 
             return content
 
         except (ValueError, TypeError) as e:
-            print(f"Warning: 无法转换cell_size到数值: {cell_size}, 错误: {e}")
+            logger.warning("无法转换cell_size到数值: %s, 错误: %s", cell_size, e)
             return content
 
-    def _replace_velocity_parameters(self, content, speed_value):
-        """替换velocity2参数，根据speed_value调整速度值"""
+    def _build_velocity_line(self, speed_value):
+        """根据speed_value生成velocity2参数文本，无法转换时返回None"""
         try:
             # 将speed_value转换为数值，然后取负值作为velocity2
             speed_num = float(speed_value)
             velocity2_value = -speed_num
 
-            print(f"\n=== 速度参数替换调试信息 ===")
-            print(f"Speed值: {speed_value}")
-            print(f"Velocity2值: {velocity2_value}")
+            logger.debug("速度参数: Speed值=%s, Velocity2值=%s", speed_value, velocity2_value)
 
-            # 替换velocity2参数
-            # 匹配模式：velocity2=-10.0, 或 velocity2=-10.0,  # 注释
-            pattern = r'velocity2=-?\d+\.?\d*'
-            replacement = f'velocity2={velocity2_value}'
-
-            content = re.sub(pattern, replacement, content)
-
-            print(f"已将velocity2替换为: {velocity2_value}")
-
-            return content
+            return f'velocity2={velocity2_value}'
 
         except (ValueError, TypeError) as e:
-            print(f"Warning: 无法转换speed_value到数值: {speed_value}, 错误: {e}")
-            return content
-
-
-    def _replace_radius(self, content, cell_radius):
-        """替换半径参数并动态调整网格密度"""
-        # 1. 查找并替换radius = xxx这一行
-        pattern = r'radius = [\d.]+\s*$'
-        replacement = f'radius = {cell_radius}'
-        content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-
-        # 2. 根据radius动态调整网格密度
-        # 基准: radius=0.3 对应 mesh_size=0.2
-        # 当radius增大时，网格密度按比例的1/2增大（保持合理的网格数量）
-        base_radius = 0.3
-        base_mesh_size = 0.2
-
-        # 计算新的网格密度: mesh_size = base_mesh_size * (radius / base_radius)^0.5
-        # 使用平方根使网格密度增长速度比radius慢，避免网格过粗
-        radius_ratio = float(cell_radius) / base_radius
-        new_mesh_size = base_mesh_size * (radius_ratio ** 0.5)
-
-        # 格式化为两位小数
-        new_mesh_size = round(new_mesh_size, 2)
-
-        # 3. 替换MergedStructure的seedPart size参数（通常是第一个）
-        # 匹配模式: p.seedPart(size=0.2, ...
-        mesh_pattern = r'(p\.seedPart\(size=)[\d.]+(\s*,)'
-        mesh_replacement = rf'\g<1>{new_mesh_size}\g<2>'
-        content = re.sub(mesh_pattern, mesh_replacement, content, count=1)
-
-        print(f"\n=== 网格密度动态调整 ===")
-        print(f"Radius: {cell_radius}")
-        print(f"Radius比例: {radius_ratio:.3f}")
-        print(f"调整后网格密度: {new_mesh_size}")
+            logger.warning("无法转换speed_value到数值: %s, 错误: %s", speed_value, e)
+            return None
 
-        return content
 
-    def _replace_template_cell_size(self, content, cell_size):
-        """替换模板开头的cell_size值"""
-        # 查找并替换cell_size = xxx这一行
-        pattern = r'cell_size = [\d.]+\s*$'
+    def _calculate_mesh_size(self, cell_radius):
+        """根据radius计算网格密度"""
+        new_mesh_size = calculate_mesh_size(cell_radius)
+        logger.debug("网格密度动态调整: Radius=%s, 调整后网格密度=%s", cell_radius, new_mesh_size)
+        return new_mesh_size
 
+    def _build_cell_size_line(self, cell_size):
+        """生成模板开头的cell_size赋值语句"""
         # 处理数值，移除不必要的小数点
         size_str = str(int(float(cell_size))) if float(cell_size).is_integer() else str(cell_size)
         replacement = f'cell_size = {size_str}'
 
-        content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-
-        print(f"\n=== Cell Size模板替换调试信息 ===")
-        print(f"原始cell_size: 5")
-        print(f"新cell_size: {size_str}")
-        print(f"替换模式: {pattern}")
-        print(f"替换内容: {replacement}")
+        logger.debug("Cell Size模板替换: 5 -> %s", size_str)
 
-        return content
+        return replacement
 
-    def _replace_coordinates(self, content, coords, cell_size):
-        """替换坐标定义并进行缩放"""
+    def _build_coordinates_section(self, geometry, cell_size):
+        """生成缩放后的坐标定义段（含结尾的圆柱体连接标记）"""
         # 计算缩放因子
         scale_factor = float(cell_size) / self.base_cell_size
 
-        print(f"\n=== 坐标缩放调试信息 ===")
-        print(f"目标单元尺寸: {cell_size}")
-        print(f"基础单元尺寸: {self.base_cell_size}")
-        print(f"缩放因子: {scale_factor}")
-        print(f"原始坐标数量: {len(coords)}")
-
-        # 找到坐标定义的开始和结束位置
-        start_pattern = r'# 定义关键点坐标\s*\n'
-        end_pattern = r'\n\s*# 定义圆柱体连接'
-
-        # 生成缩放后的坐标
-        scaled_coords = []
-        for i, coord in enumerate(coords):
-            scaled_coord = self._scale_coordinate_line(coord, scale_factor)
-            scaled_coords.append(scaled_coord)
-            # 只打印前几个坐标以避免过多输出
-            if i < 5:
-                print(f"坐标{i+1}: {coord.strip()} -> {scaled_coord.strip()}")
+        logger.debug("坐标缩放: 目标单元尺寸=%s, 基础单元尺寸=%s, 缩放因子=%s, 坐标数量=%d",
+                     cell_size, self.base_cell_size, scale_factor, len(geometry.labels))
+
+        # 一次性缩放所有节点坐标并生成坐标定义行
+        scaled_coords = geometry.coordinate_lines(scale_factor)
+
+        # 只输出前几个坐标以避免过多输出；未启用DEBUG时跳过格式化
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, scaled_coord in enumerate(scaled_coords[:5]):
+                logger.debug("坐标%d: %s -> %s", i + 1, geometry.nodes[i].tolist(), scaled_coord)
 
         # 构建新的坐标部分
         new_coords_section = "# 定义关键点坐标\n" + '\n'.join(scaled_coords) + '\n'
+        return new_coords_section + '\n# 定义圆柱体连接'
 
-        # 替换内容
-        match = re.search(start_pattern + r'(.*?)' + end_pattern, content, re.DOTALL)
-        if match:
-            content = content[:match.start()] + new_coords_section + '\n# 定义圆柱体连接' + content[match.end():]
-
-        return content
-
-    def _scale_coordinate_line(self, coord_line, scale_factor):
-        """缩放单个坐标行"""
-        # 使用正则表达式找到坐标数组中的数字并缩放
-        def scale_number(match):
-            number = float(match.group())
-            scaled = number * scale_factor
-            # 改进的数值格式化，保持精度
-            # 使用4位小数精度，然后移除尾随零
-            formatted = f"{scaled:.4f}".rstrip('0').rstrip('.')
-            # 如果结果为空（如0.0000），返回'0'
-            return formatted if formatted else '0'
-
-        # 匹配方括号内的数字（包括负数），但不匹配变量名中的数字
-        # 使用更精确的正则表达式，只匹配 = [ 和 ] 之间的数字
-        pattern = r'(=\s*\[)([^\]]+)(\])'
-
-        def replace_coordinates(match):
-            prefix = match.group(1)  # '= ['
-            coords_str = match.group(2)  # 坐标字符串
-            suffix = match.group(3)  # ']'
-
-            # 在坐标字符串中替换数字
-            number_pattern = r'-?\d+\.?\d*'
-            scaled_coords = re.sub(number_pattern, scale_number, coords_str)
-
-            return prefix + scaled_coords + suffix
-
-        scaled_line = re.sub(pattern, replace_coordinates, coord_line)
-        return scaled_line
-
-    def _replace_cylinders(self, content, cylinders):
-        """替换cylinders连接定义"""
-        # 找到cylinders定义的开始和结束位置
-        start_pattern = r'cylinders = \['
-        end_pattern = r'\]'
+    def _build_cylinders_section(self, geometry):
+        """生成cylinders连接定义段"""
+        cylinders = [f"({start}, {end})" for start, end in geometry.edge_labels()]
 
         # 构建新的cylinders部分
         cylinders_lines = []
@@ -991,17 +1028,10 @@ print("CAE will exit after script completion to release license.")
             else:
                 cylinders_lines.append(f'    {cylinder},')
 
-        new_cylinders_section = 'cylinders = [\n' + '\n'.join(cylinders_lines) + '\n]'
-
-        # 查找并替换cylinders部分
-        # 使用更精确的正则表达式匹配整个cylinders数组
-        pattern = r'cylinders = \[([^\]]*(?:\[[^\]]*\][^\]]*)*)?\]'
-        content = re.sub(pattern, new_cylinders_section, content, flags=re.DOTALL)
+        return 'cylinders = [\n' + '\n'.join(cylinders_lines) + '\n]'
 
-        return content
-
-    def _replace_cutting_parameters(self, content, cell_size, cell_radius):
-        """替换切割相关的参数，使用新的位置计算方式"""
+    def _cutting_slot_values(self, cell_size, cell_radius):
+        """计算切割相关槽位的替换文本"""
         cell_size_float = float(cell_size)
         cell_radius_float = float(cell_radius)
 
@@ -1018,47 +1048,32 @@ print("CAE will exit after script completion to release license.")
         # 半尺寸用于设置矩形和变换原点
         half_size = cell_size_float / 2
 
-        print(f"\n=== 切割参数新计算方式调试信息 ===")
-        print(f"单元尺寸: {cell_size_float}")
-        print(f"圆柱半径: {cell_radius_float}")
-        print(f"切割开始位置: {cutting_start_position} (size/2 + 2*radius)")
-        print(f"切割结束位置: {cutting_end_position} (-size)")
-        print(f"切割深度: {cutting_depth}")
-        print(f"半尺寸: {half_size}")
-
-        # 替换切割平面offset值（使用新的切割开始位置）
-        content = re.sub(r'offset=3(?=\))', f'offset={cutting_start_position}', content)
-
-        # 替换切割深度值（使用新计算的深度）
-        content = re.sub(r'depth=6(?=,)', f'depth={cutting_depth}', content)
-
-        # 替换变换原点中的坐标值
-        # 顶部切割的origin坐标（使用半尺寸）
-        content = re.sub(r'origin=\(0\.0, 0\.0, 2\.5\)',
-                        f'origin=(0.0, 0.0, {half_size})', content)
-
-        # 侧面切割的origin坐标（使用半尺寸）
-        content = re.sub(r'origin=\(0\.0, 2\.5, 0\.0\)',
-                        f'origin=(0.0, {half_size}, 0.0)', content)
-
-        # 替换切割矩形的尺寸
-        # 内部矩形 (-2.5, -2.5) to (2.5, 2.5) 使用半尺寸
-        content = re.sub(r'point1=\(-2\.5, -2\.5\)',
-                        f'point1=(-{half_size}, -{half_size})', content)
-        content = re.sub(r'point2=\(2\.5, 2\.5\)',
-                        f'point2=({half_size}, {half_size})', content)
+        logger.debug("切割参数: 单元尺寸=%s, 圆柱半径=%s, 开始位置=%s (size/2 + 2*radius), "
+                     "结束位置=%s (-size), 深度=%s, 半尺寸=%s",
+                     cell_size_float, cell_radius_float, cutting_start_position,
+                     cutting_end_position, cutting_depth, half_size)
 
         # 外部矩形 (-5.0, -5.0) to (5.0, 5.0) - 使用双倍尺寸
         outer_size = cell_size_float
-        content = re.sub(r'point1=\(-5\.0, -5\.0\)',
-                        f'point1=(-{outer_size}, -{outer_size})', content)
-        content = re.sub(r'point2=\(5\.0, 5\.0\)',
-                        f'point2=({outer_size}, {outer_size})', content)
-
-        return content
 
-    def _replace_steel_plate_dimensions(self, content, cell_size):
-        """替换钢板尺寸和位置，使其与cell_size成比例缩放"""
+        return {
+            # 切割平面offset值（使用新的切割开始位置）
+            'cut_offset': f'offset={cutting_start_position}',
+            # 切割深度值（使用新计算的深度）
+            'cut_depth': f'depth={cutting_depth}',
+            # 顶部/侧面切割的origin坐标（使用半尺寸）
+            'cut_origin_top': f'origin=(0.0, 0.0, {half_size})',
+            'cut_origin_side': f'origin=(0.0, {half_size}, 0.0)',
+            # 内部矩形 (-2.5, -2.5) to (2.5, 2.5) 使用半尺寸
+            # （槽位在模板原文中定位，尺寸10时内部矩形的新值 ±5.0 不会再被外部矩形的替换改写成 ±10.0）
+            'cut_inner_point1': f'point1=(-{half_size}, -{half_size})',
+            'cut_inner_point2': f'point2=({half_size}, {half_size})',
+            'cut_outer_point1': f'point1=(-{outer_size}, -{outer_size})',
+            'cut_outer_point2': f'point2=({outer_size}, {outer_size})',
+        }
+
+    def _steel_plate_slot_values(self, cell_size):
+        """计算钢板相关槽位的替换文本"""
         # 计算缩放因子
         scale_factor = float(cell_size) / self.base_cell_size
 
@@ -1074,30 +1089,21 @@ print("CAE will exit after script completion to release license.")
         scaled_half_size = base_half_size * scale_factor
         scaled_offset = base_offset * scale_factor
 
-        print(f"\n=== 钢板参数缩放调试信息 ===")
-        print(f"刚性板长度: {base_plate_length} -> {scaled_plate_length}")
-        print(f"刚性板宽度: {base_plate_width} -> {scaled_plate_width}")
-        print(f"板位置偏移: {base_offset} -> {scaled_offset}")
-
-        # 替换刚性板的线段长度 (-3.0, 0.0) to (3.0, 0.0)
-        content = re.sub(r'point1=\(-3\.0, 0\.0\)',
-                        f'point1=(-{scaled_offset}, 0.0)', content)
-        content = re.sub(r'point2=\(3\.0, 0\.0\)',
-                        f'point2=({scaled_offset}, 0.0)', content)
-
-        # 替换刚性板的挤出深度
-        content = re.sub(r'depth=6\.0(?=\))', f'depth={scaled_plate_width}', content)
-
-        # 替换刚性板的位置 vector
-        # RigidPlate-1: (0.0, -2.5, -3.0)
-        content = re.sub(r'vector=\(0\.0, -2\.5, -3\.0\)',
-                        f'vector=(0.0, -{scaled_half_size}, -{scaled_offset})', content)
-
-        # RigidPlate-2: (0.0, 2.5, -3.0)
-        content = re.sub(r'vector=\(0\.0, 2\.5, -3\.0\)',
-                        f'vector=(0.0, {scaled_half_size}, -{scaled_offset})', content)
-
-        return content
+        logger.debug("钢板参数缩放: 长度 %s -> %s, 宽度 %s -> %s, 偏移 %s -> %s",
+                     base_plate_length, scaled_plate_length, base_plate_width, scaled_plate_width,
+                     base_offset, scaled_offset)
+
+        return {
+            # 刚性板的线段长度 (-3.0, 0.0) to (3.0, 0.0)
+            'plate_point1': f'point1=(-{scaled_offset}, 0.0)',
+            'plate_point2': f'point2=({scaled_offset}, 0.0)',
+            # 刚性板的挤出深度
+            'plate_depth': f'depth={scaled_plate_width}',
+            # RigidPlate-1: (0.0, -2.5, -3.0)
+            'plate_vector_bottom': f'vector=(0.0, -{scaled_half_size}, -{scaled_offset})',
+            # RigidPlate-2: (0.0, 2.5, -3.0)
+            'plate_vector_top': f'vector=(0.0, {scaled_half_size}, -{scaled_offset})',
+        }
 
     # def _generate_rigid_body_detection(self, structure_data, cell_size):
     #     """生成上下刚体识别代码（已禁用）"""
@@ -1157,7 +1163,7 @@ print("CAE will exit after script completion to release license.")
 
 
 
-def generate_abaqus_script(cell_type, cell_size, cell_radius, slider=4, output_dir=None, speed_value=None, direction_value=None, batch_mode=False, batch_parent_dir=None):
+def generate_abaqus_script(cell_type, cell_size, cell_radius, slider=4, output_dir=None, speed_value=None, direction_value=None, batch_mode=False, batch_parent_dir=None, force=False):
     """
     便捷函数：生成Abaqus脚本
 
@@ -1171,6 +1177,7 @@ def generate_abaqus_script(cell_type, cell_size, cell_radius, slider=4, output_d
     - direction_value: 方向值 (当Direction复选框选中时)
     - batch_mode: 是否为批量模式
     - batch_parent_dir: 批量模式的父文件夹路径
+    - force: 强制重写脚本，忽略增量生成清单
 
     返回:
     - (success: bool, message: str, filename: str)
@@ -1178,21 +1185,332 @@ def generate_abaqus_script(cell_type, cell_size, cell_radius, slider=4, output_d
     generator = AbaqusScriptGenerator()
 
     # 尝试设置文件追踪回调
+    file_tracker_callback = _find_file_tracker_callback()
+    if file_tracker_callback:
+        generator.set_file_tracker_callback(file_tracker_callback)
+
+    return generator.generate_script(cell_type, cell_size, cell_radius, slider, output_dir, speed_value, direction_value, batch_mode, batch_parent_dir, force)
+
+
+def _find_file_tracker_callback():
+    """查找主程序提供的文件追踪函数 add_generated_file，找不到时返回None"""
     try:
-        import sys
         # 尝试多种可能的模块名称
-        main_module = None
         for module_name in ['main', '__main__']:
             if module_name in sys.modules:
                 main_module = sys.modules[module_name]
                 if hasattr(main_module, 'add_generated_file'):
-                    generator.set_file_tracker_callback(main_module.add_generated_file)
-                    break
+                    return main_module.add_generated_file
     except Exception:
         pass  # 静默失败，不影响脚本生成
+    return None
+
+
+# ========== 并行批量生成 ==========
+# 所有测试模式 (speed_value, direction_value)
+ALL_MODES = [(None, None), ("50", None), ("500", None), (None, "X"), (None, "X_50"), (None, "X_500")]
+
+# 工作进程内复用的生成器实例（模板缓存、编译模板在进程内共享）
+_worker_generator = None
+
+
+def parse_mode(mode):
+    """
+    将模式名称转换为 (speed_value, direction_value)
 
-    return generator.generate_script(cell_type, cell_size, cell_radius, slider, output_dir, speed_value, direction_value, batch_mode, batch_parent_dir)
+    - "static"            -> (None, None)
+    - "50" / "500"        -> ("50", None) / ("500", None)
+    - "X" / "X_50" / ...  -> (None, "X") / (None, "X_50") / ...
+    """
+    mode = str(mode).strip()
+    if mode.lower() == "static":
+        return None, None
+    if mode.upper().startswith("X"):
+        return None, mode
+    return mode, None
+
+
+def _run_sweep_chunk(jobs, output_dir=None, batch_mode=False, batch_parent_dir=None, force=False, dry_run=False):
+    """在工作进程中依次生成一组作业的脚本，返回结构化结果列表；dry_run 时只在内存中生成，不写入磁盘"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = AbaqusScriptGenerator()
+    generator = _worker_generator
+
+    results = []
+    for job in jobs:
+        start_time = time.perf_counter()
+        args = (job['cell_type'], job['cell_size'], job['cell_radius'], job['slider'], output_dir,
+                job['speed_value'], job['direction_value'], batch_mode, batch_parent_dir)
+        contents = None
+        hashes = {}
+        if dry_run:
+            try:
+                success, message, filename, _, contents = generator._render_script(*args)
+            except Exception as e:
+                success, message, filename = False, f"生成脚本时出错: {str(e)}", ""
+            written = False
+        else:
+            success, message, filename, written, hashes = generator._generate_script(*args, force)
+
+        result = dict(job)
+        result.update({
+            'success': success,
+            'message': message,
+            'filename': filename,
+            'unchanged': success and not dry_run and not written,
+            'contents': contents if success else None,
+            'hashes': hashes,
+            'output_dir': None,
+            'preprocess': None,
+            'postprocess': None,
+        })
+        if success:
+            base_dir = generator._resolve_base_output_dir(batch_mode, batch_parent_dir, output_dir)
+            target_dir = generator._build_hierarchical_path(
+                base_dir, job['cell_type'], job['cell_size'], job['cell_radius'], job['slider'],
+                job['speed_value'], job['direction_value']
+            )
+            result['output_dir'] = target_dir
+            result['preprocess'] = os.path.join(target_dir, filename.replace('.py', '_preprocess.py'))
+            result['postprocess'] = os.path.join(target_dir, filename.replace('.py', '_postprocess.py'))
+        result['elapsed'] = time.perf_counter() - start_time
+        results.append(result)
+    return results
+
+
+def _make_directories(directories):
+    """
+    创建一组作业目录：按父目录分组，每个新的父目录调用一次 os.makedirs，
+    叶目录直接 os.mkdir，省去 os.makedirs 对每个叶目录的父目录存在性检查
+
+    返回:
+    - 元数据操作数（makedirs 调用数 + mkdir 调用数）
+    """
+    parents = set()
+    operations = 0
+    for directory in sorted(set(directories)):
+        parent = os.path.dirname(directory)
+        if parent not in parents:
+            os.makedirs(parent, exist_ok=True)
+            parents.add(parent)
+            operations += 1
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
+        operations += 1
+    return operations
+
+
+def write_rendered_scripts(results, force=False, threads=None):
+    """
+    两阶段生成的第二阶段：将 generate_sweep(dry_run=True) 在内存中生成的脚本批量写入磁盘
+
+    先按父目录批量创建去重后的目录集合（见 _make_directories），再按目录分组
+    （同一目录共用一个清单）提交到线程池写入，减少并行文件系统上的目录检查和创建。
+    会就地更新每个结果的 unchanged / success / message 字段，并释放 contents。
+
+    参数:
+    - results: generate_sweep(dry_run=True) 的返回值
+    - force: 强制重写所有脚本，忽略增量生成清单
+    - threads: 写入线程数，None/0 表示使用 Config.WRITER_THREADS
+
+    返回:
+    - results（同一列表）
+    """
+    rendered = [result for result in results if result['success'] and result.get('contents')]
+
+    by_directory = {}
+    for result in rendered:
+        by_directory.setdefault(result['output_dir'], []).append(result)
+
+    # 1. 按父目录批量创建所有目标目录
+    _make_directories(by_directory)
+
+    # 2. 按目录写入脚本和清单
+    def write_directory(directory, directory_results):
+        manifest = _load_manifest(directory)
+        changed = False
+        for result in directory_results:
+            try:
+                written, result['hashes'] = _write_script_files(directory, result['contents'], manifest, force)
+                result['unchanged'] = not written
+                changed = changed or written
+            except OSError as e:
+                result['success'] = False
+                result['message'] = f"写入脚本时出错: {str(e)}"
+            result['contents'] = None
+        if changed:
+            _save_manifest(directory, manifest)
+
+    threads = threads or Config.WRITER_THREADS or 1
+    with ThreadPoolExecutor(max_workers=max(1, min(threads, len(by_directory) or 1))) as executor:
+        for future in [executor.submit(write_directory, directory, directory_results)
+                       for directory, directory_results in by_directory.items()]:
+            future.result()
+
+    for result in rendered:
+        if result['success']:
+            names = f"{os.path.basename(result['preprocess'])} 和 {os.path.basename(result['postprocess'])}"
+            if result['unchanged']:
+                result['message'] = f"脚本未变化，跳过写入: {names}"
+            else:
+                result['message'] = f"脚本生成成功: {names}"
+    return results
+
+
+def generate_sweep(cell_types, sizes, radii, sliders=range(9), modes=((None, None),), workers=None,
+                   output_dir=None, batch_mode=False, batch_parent_dir=None,
+                   no_slider_types=(), progress_callback=None, track_files=True, force=False,
+                   dry_run=False, bulk_write=False):
+    """
+    并行批量生成脚本：按 cell_types × sliders × sizes × radii × modes 展开作业，
+    分块提交到 ProcessPoolExecutor
+
+    参数:
+    - cell_types: 晶体结构类型列表
+    - sizes: 单元尺寸列表
+    - radii: 杆件半径列表
+    - sliders: 滑块值列表
+    - modes: (speed_value, direction_value) 列表，可用 parse_mode 从名称转换
+    - workers: 进程数，None/0 表示使用 Config.SWEEP_WORKERS 或 CPU 核心数；1 表示在当前进程内串行生成
+    - output_dir / batch_mode / batch_parent_dir: 与 generate_abaqus_script 相同
+    - no_slider_types: 不使用slider的结构类型，只生成默认slider值的脚本
+    - progress_callback: 进度回调 progress_callback(completed, total, result)，在调用进程中执行
+    - track_files: 是否将生成的文件按作业顺序登记到主程序的文件追踪列表（包括内容未变化、跳过写入的脚本）
+    - force: 强制重写所有脚本，忽略增量生成清单
+    - dry_run: 只在内存中生成，不创建目录、不写入文件；结果的 contents 为 {脚本文件名: 内容}
+    - bulk_write: 两阶段生成：先在内存中生成全部作业，再由 write_rendered_scripts
+      一次性创建目录并通过线程池写入（适合 Lustre/NFS 等元数据操作昂贵的文件系统）；
+      此时 progress_callback 在生成阶段调用
+
+    返回:
+    - list[dict]: 按作业展开顺序排列的结果，包含作业参数以及
+      success, message, filename, unchanged, contents, hashes, output_dir, preprocess, postprocess, elapsed
+    - 非 dry_run 时，新写入的作业会追加到任务目录的作业清单 (Config.JOB_MANIFEST_FILE)
+    """
+    jobs = []
+    for cell_type in cell_types:
+        cell_sliders = [Config.DEFAULT_SLIDER_VALUE] if cell_type in no_slider_types else sliders
+        for slider in cell_sliders:
+            for cell_size in sizes:
+                for cell_radius in radii:
+                    for speed_value, direction_value in modes:
+                        jobs.append({
+                            'index': len(jobs),
+                            'cell_type': cell_type,
+                            'cell_size': float(cell_size),
+                            'cell_radius': float(cell_radius),
+                            'slider': slider,
+                            'speed_value': speed_value,
+                            'direction_value': direction_value,
+                        })
+
+    total = len(jobs)
+    if not workers:
+        workers = Config.SWEEP_WORKERS or os.cpu_count() or 1
+    workers = max(1, min(workers, total or 1))
+
+    # 分块提交，摊薄进程间通信开销；每个进程至少分到几块以便负载均衡和进度更新
+    chunk_size = max(1, min(64, -(-total // (workers * 4))))
+    chunks = [jobs[i:i + chunk_size] for i in range(0, total, chunk_size)]
+
+    results = [None] * total
+    completed = 0
+
+    def collect(chunk_results):
+        nonlocal completed
+        for result in chunk_results:
+            results[result['index']] = result
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, result)
+
+    render_only = dry_run or bulk_write
+    if workers == 1:
+        for chunk in chunks:
+            collect(_run_sweep_chunk(chunk, output_dir, batch_mode, batch_parent_dir, force, render_only))
+    else:
+        # 工作进程按 Config.LOG_LEVEL 配置日志（spawn 方式启动时不会继承主进程的配置）
+        with ProcessPoolExecutor(max_workers=workers, initializer=Config.setup_logging) as executor:
+            futures = [executor.submit(_run_sweep_chunk, chunk, output_dir, batch_mode, batch_parent_dir, force, render_only)
+                       for chunk in chunks]
+            for future in as_completed(futures):
+                collect(future.result())
+
+    if dry_run:
+        return results
+    if bulk_write:
+        write_rendered_scripts(results, force)
+
+    # 按作业顺序将新写入的作业登记到任务目录的作业清单（清单不存在时登记全部成功的作业）
+    task_dir = AbaqusScriptGenerator()._resolve_base_output_dir(batch_mode, batch_parent_dir, output_dir)
+    record_all = not os.path.exists(get_manifest_path(task_dir))
+    append_job_records(task_dir, [
+        build_job_record(task_dir, result['output_dir'], result['filename'], result['cell_type'], result['cell_size'],
+                         result['cell_radius'], result['slider'], result['speed_value'], result['direction_value'],
+                         result['hashes'])
+        for result in results if result['success'] and (record_all or not result['unchanged'])
+    ])
+
+    # 工作进程中无法访问主程序的文件追踪列表，在此按作业顺序统一登记
+    # 内容未变化的脚本只是跳过写入，仍登记以便重新生成运行脚本；已完成的作业由运行脚本跳过
+    if track_files:
+        file_tracker_callback = _find_file_tracker_callback()
+        if file_tracker_callback:
+            for result in results:
+                if result['success']:
+                    file_tracker_callback(result['preprocess'])
+                    file_tracker_callback(result['postprocess'])
+
+    return results
+
+
+def main():
+    """命令行入口：并行批量生成脚本"""
+    import argparse
+
+    all_cell_types = [cell_type for _, cell_types in Config.CELL_TYPE_GROUPS for cell_type in cell_types]
+
+    parser = argparse.ArgumentParser(description="并行批量生成Abaqus脚本")
+    parser.add_argument('--cells', nargs='+', default=all_cell_types, help="晶胞类型（默认全部）")
+    parser.add_argument('--sizes', nargs='+', type=float, default=[5.0], help="单元尺寸")
+    parser.add_argument('--radii', nargs='+', type=float, default=[0.3], help="杆件半径")
+    parser.add_argument('--sliders', nargs='+', type=int, default=list(range(*Config.SLIDER_RANGE)), help="滑块值")
+    parser.add_argument('--modes', nargs='+', default=['static'],
+                        help="测试模式: static, 50, 500, X, X_50, X_500 或 all")
+    parser.add_argument('--workers', type=int, default=None, help="进程数（默认CPU核心数）")
+    parser.add_argument('--output-dir', default=None, help="输出根目录（默认 generate_script）")
+    parser.add_argument('--force', action='store_true', help="强制重写所有脚本，忽略增量生成清单")
+    parser.add_argument('--bulk-write', action='store_true',
+                        help="两阶段生成：先在内存中生成全部脚本，再批量创建目录并多线程写入")
+    args = parser.parse_args()
+
+    Config.setup_logging()
+    modes = ALL_MODES if 'all' in args.modes else [parse_mode(mode) for mode in args.modes]
+
+    def report(completed, total, result):
+        if not result['success']:
+            print(f"  ✗ {result['cell_type']} slider={result['slider']}: {result['message']}")
+        if completed == total or completed % 100 == 0:
+            print(f"进度: {completed}/{total}")
+
+    start_time = time.perf_counter()
+    results = generate_sweep(args.cells, args.sizes, args.radii, args.sliders, modes,
+                             workers=args.workers, output_dir=args.output_dir,
+                             no_slider_types=Config.NO_SLIDER_CELL_TYPES, progress_callback=report,
+                             force=args.force, bulk_write=args.bulk_write)
+    elapsed = time.perf_counter() - start_time
+
+    succeeded = sum(1 for result in results if result['success'])
+    unchanged = sum(1 for result in results if result['unchanged'])
+    print("=" * 60)
+    print(f"生成完成: {succeeded}/{len(results)} 成功 (其中 {unchanged} 个未变化跳过写入), 用时 {elapsed:.2f}s"
+          f" ({len(results) / elapsed if elapsed else 0:.0f} 作业/秒)")
+    print("=" * 60)
+    return 0 if succeeded == len(results) else 1
 
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    sys.exit(main())
@@ -4,10 +4,12 @@ Shell脚本生成器 - 重构后的模块化设计
 消除sh和bat脚本生成的重复代码
 """
 import os
+import posixpath
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Optional
 from config import Config
+from job_manifest import load_checked_job_records, resolve_job_path
 
 
 class BaseScriptGenerator(ABC):
@@ -100,9 +102,17 @@ class BaseScriptGenerator(ABC):
 class LinuxShellGenerator(BaseScriptGenerator):
     """Linux Shell脚本生成器"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.jobs = None  # 作业列表模式下的 (前处理脚本, 后处理脚本) 列表
+
     def get_file_extension(self) -> str:
         return "sh"
 
+    def get_job_list_filename(self) -> str:
+        """作业列表文件名：与脚本同名，扩展名为 .jobs"""
+        return self.get_script_filename()[:-3] + ".jobs"
+
     def _normalize_paths(self) -> List[str]:
         """将Windows路径转换为Unix路径"""
         return [pf.replace('\\', '/') for pf in self.python_files]
@@ -183,6 +193,17 @@ class LinuxShellGenerator(BaseScriptGenerator):
         preprocess_files = [f for f in unix_files if '_preprocess.py' in f]
         postprocess_files = [f for f in unix_files if '_postprocess.py' in f]
 
+        if Config.RUN_ALL_COMPACT and preprocess_files:
+            # 固定的驱动脚本 + 作业列表，脚本大小与作业数无关
+            self.jobs = pair_job_scripts(preprocess_files, postprocess_files)
+            content = job_list_driver_header(self.get_job_list_filename())
+            if Config.RUN_ALL_MAX_JOBS > 1:
+                return content + self._generate_parallel_loop(preprocess_files, postprocess_files)
+            return content + job_list_two_phase_loop()
+
+        if Config.RUN_ALL_MAX_JOBS > 1 and preprocess_files:
+            return self._generate_parallel_loop(preprocess_files, postprocess_files)
+
         content = []
 
         # ========================================
@@ -297,6 +318,134 @@ class LinuxShellGenerator(BaseScriptGenerator):
 
         return content
 
+    def _generate_parallel_loop(self, preprocess_files: List[str], postprocess_files: List[str]) -> List[str]:
+        """
+        生成并发执行的循环体：最多 Config.RUN_ALL_MAX_JOBS 个作业同时运行，
+        每个作业在后台依次完成 前处理 → 求解 → 后处理
+
+        - CAE会话（前处理/后处理）用 flock 计数信号量限制为 Config.CAE_SLOTS 个，
+          锁文件位于运行目录，共享该目录的多个脚本（如各分片）共同遵守license上限
+        - 求解按节点CPU预算限制：同时求解数 = CPU_BUDGET / SOLVER_CPUS，
+          CPU_BUDGET 默认取 SLURM/PBS 分配的CPU数，否则为 nproc
+        - 作业列表模式下逐行读取作业列表启动作业，否则每个作业展开一行 start_job
+        """
+        total = "$TOTAL" if self.jobs is not None else len(preprocess_files)
+        content = [
+            "# ========================================",
+            f"# Run up to {Config.RUN_ALL_MAX_JOBS} jobs concurrently: preprocess -> solve -> postprocess per job",
+            "# ========================================",
+            "RUN_DIR=$(pwd)",
+            f"MAX_JOBS=${{MAX_JOBS:-{Config.RUN_ALL_MAX_JOBS}}}",
+            f"CAE_SLOTS=${{CAE_SLOTS:-{Config.CAE_SLOTS}}}",
+            f"SOLVER_CPUS=${{SOLVER_CPUS:-{Config.SOLVER_CPUS}}}",
+            "CPU_BUDGET=${CPU_BUDGET:-${SLURM_CPUS_PER_TASK:-${NCPUS:-$(nproc)}}}",
+            "SOLVER_SLOTS=$(( CPU_BUDGET / SOLVER_CPUS ))",
+            "[ \"$SOLVER_SLOTS\" -ge 1 ] || SOLVER_SLOTS=1",
+            "CAE_LOCK_DIR=\"$RUN_DIR/.cae_locks\"",
+            "SOLVER_LOCK_DIR=$(mktemp -d \"${TMPDIR:-/tmp}/solver_locks.XXXXXX\")",
+            "JOB_LOG_DIR=\"$RUN_DIR/logs/jobs\"",
+            "mkdir -p \"$CAE_LOCK_DIR\" \"$JOB_LOG_DIR\"",
+            "trap 'rm -rf \"$SOLVER_LOCK_DIR\"' EXIT",
+            "echo \"Concurrency: $MAX_JOBS jobs, $CAE_SLOTS CAE sessions, $SOLVER_SLOTS solvers x $SOLVER_CPUS CPUs\"",
+            "echo",
+            "",
+            "# Counting semaphore: run a command while holding one of N flock slots in a directory",
+            "with_slot() {",
+            "    local lock_dir=\"$1\" slots=\"$2\" slot fd rc",
+            "    shift 2",
+            "    while true; do",
+            "        for slot in $(seq 1 \"$slots\"); do",
+            "            exec {fd}>\"$lock_dir/slot.$slot\"",
+            "            if flock -n \"$fd\"; then",
+            "                \"$@\" {fd}>&-",
+            "                rc=$?",
+            "                exec {fd}>&-",
+            "                return $rc",
+            "            fi",
+            "            exec {fd}>&-",
+            "        done",
+            "        sleep 2",
+            "    done",
+            "}",
+            "",
+            "run_job() {",
+            "    local script_dir=\"$1\" job_name=\"$2\" preprocess=\"$3\" postprocess=\"$4\"",
+            "    cd \"$script_dir\" || return 1",
+            "    rm -f *.lck 2>/dev/null",
+            "",
+            f"    if ! with_slot \"$CAE_LOCK_DIR\" \"$CAE_SLOTS\" {Config.ABAQUS_COMMAND}=\"$preprocess\"; then",
+            "        echo \"ERROR: Failed to submit $(basename \"$preprocess\")\"",
+            "        echo \"$(basename \"$preprocess\")\" >> \"$RUN_DIR/failed_submissions.log\"",
+            "    fi",
+            "    if [ ! -f \"$job_name.inp\" ]; then",
+            "        echo \"ERROR: Input file not found: $script_dir/$job_name.inp\"",
+            "        echo \"$job_name\" >> \"$RUN_DIR/failed_submissions.log\"",
+            "        return 1",
+            "    fi",
+            "",
+            "    echo \"Submitting solver job: $job_name\"",
+            "    echo y | with_slot \"$SOLVER_LOCK_DIR\" \"$SOLVER_SLOTS\" abaqus job=$job_name input=$job_name.inp cpus=$SOLVER_CPUS interactive",
+            "    echo \"Solver completed for $job_name\"",
+            "",
+            "    if [ -n \"$postprocess\" ]; then",
+            "        echo \"Running postprocessing: $(basename \"$postprocess\")\"",
+            f"        if ! with_slot \"$CAE_LOCK_DIR\" \"$CAE_SLOTS\" {Config.ABAQUS_COMMAND}=\"$postprocess\"; then",
+            "            echo \"ERROR: Postprocessing failed for $(basename \"$postprocess\")\"",
+            "            echo \"$(basename \"$postprocess\")\" >> \"$RUN_DIR/failed_postprocess.log\"",
+            "        else",
+            "            echo \"Postprocessing completed for $job_name\"",
+            "        fi",
+            "        rm -f \"$job_name.odb\"",
+            "        rm -rf \"$job_name.abq\"",
+            "        echo \"Cleanup completed for $job_name\"",
+            "    fi",
+            "}",
+            "",
+            "start_job() {",
+            "    while [ \"$(jobs -rp | wc -l)\" -ge \"$MAX_JOBS\" ]; do",
+            "        wait -n",
+            "    done",
+            f"    echo \"[$1/{total}] Started: $3 (log: logs/jobs/$3.log)\"",
+            "    shift",
+            "    ( run_job \"$@\"; echo \"Finished: $2 (exit $?)\" ) > \"$JOB_LOG_DIR/$2.log\" 2>&1 &",
+            "}",
+            "",
+        ]
+
+        if self.jobs is not None:
+            content.extend([
+                "n=0",
+                "while IFS=$'\\t' read -r preprocess postprocess <&3; do",
+                "    n=$((n + 1))",
+                "    [ -n \"$preprocess\" ] && [ \"$n\" -ge \"$START\" ] || continue",
+                "    job_name=$(basename \"$preprocess\" _preprocess.py)",
+                "    if job_done \"$preprocess\"; then",
+                "        echo \"[$n/$TOTAL] Already completed: $job_name\"",
+                "        continue",
+                "    fi",
+                "    start_job \"$n\" \"$(dirname \"$preprocess\")\" \"$job_name\" \"$preprocess\" \"$postprocess\" 3<&-",
+                "done 3< \"$JOB_LIST\"",
+            ])
+        else:
+            for i, pf in enumerate(preprocess_files, 1):
+                script_dir = os.path.dirname(pf)
+                job_name = os.path.basename(pf).replace('_preprocess.py', '')
+                postprocess_script = postprocess_files[i-1] if i <= len(postprocess_files) else ""
+                content.append(f"start_job {i} \"{script_dir}\" \"{job_name}\" \"{pf}\" \"{postprocess_script}\"")
+
+        content.extend([
+            "",
+            "# Wait for the job subshells only: a bare wait also waits for the tee process substitutions",
+            "# that capture this script's output, which never exit",
+            "for pid in $(jobs -p); do",
+            "    wait \"$pid\"",
+            "done",
+            "echo 'All jobs completed!'",
+            "echo",
+            ""
+        ])
+        return content
+
     def generate_footer(self) -> List[str]:
         """生成Shell脚本尾部"""
         return [
@@ -304,7 +453,8 @@ class LinuxShellGenerator(BaseScriptGenerator):
             "echo 'All tasks completed!'",
             "echo '========================================'",
             "echo",
-            "read -p 'Press Enter to exit...'"
+            "read -p 'Press Enter to exit...'",
+            "exit ${RUN_STATUS:-0}"
         ]
 
     def write_file(self, content: str, file_path: str):
@@ -312,6 +462,10 @@ class LinuxShellGenerator(BaseScriptGenerator):
         # 使用Unix换行符
         with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
             f.write(content)
+        if self.jobs is not None:
+            job_list_path = os.path.join(os.path.dirname(file_path), self.get_job_list_filename())
+            write_job_list(self.jobs, job_list_path)
+            print(f"作业列表已生成: {self.get_job_list_filename()} ({len(self.jobs)} 个作业)")
 
         # 设置执行权限
         try:
@@ -541,6 +695,485 @@ class WindowsBatchGenerator(BaseScriptGenerator):
         print("可在Abaqus Command中执行此批处理文件")
 
 
+def shard_python_files(python_files: List[str], shards: int, history) -> List[tuple]:
+    """
+    按预计求解用时把作业均衡地分成 shards 份（贪心LPT），各分片分别生成运行脚本提交到不同节点
+
+    Args:
+        python_files: 生成的脚本文件列表（每个作业目录一对前处理/后处理脚本）
+        shards: 分片数
+        history: RuntimeHistory，有实测记录的作业用实测用时，其余按 杆件总长×尺寸×半径²/网格尺寸³ 估计
+
+    Returns:
+        list[tuple]: 每个分片的 (脚本文件列表, 预计总用时)，分片内保持原有顺序，省略空分片；
+        没有任何实测记录时预计总用时仅可用于相对比较
+    """
+    from runtime_history import partition_longest_first
+
+    job_dirs = list(dict.fromkeys(os.path.dirname(path) for path in python_files))
+    estimates = [history.estimate('/'.join(os.path.normpath(job_dir).split(os.sep)[-5:]))[0]
+                 for job_dir in job_dirs]
+    # 无法估计的作业按已知作业的中位数计
+    known = sorted(estimate for estimate in estimates if estimate)
+    fallback = known[len(known) // 2] if known else 1.0
+    estimates = [estimate or fallback for estimate in estimates]
+
+    assignment, totals = partition_longest_first(estimates, shards)
+    shard_of = dict(zip(job_dirs, assignment))
+    return [
+        ([path for path in python_files if shard_of[os.path.dirname(path)] == shard], totals[shard])
+        for shard in range(len(totals)) if shard in assignment
+    ]
+
+
+def task_job_files(manifest_dir: str, params: Optional[dict] = None, fallback: List[str] = ()) -> List[str]:
+    """
+    从作业清单中取出一个任务的全部作业的前处理/后处理脚本路径（按清单顺序，跳过脚本已删除的作业），
+    供作业数组覆盖整个任务
+
+    Args:
+        manifest_dir: 作业清单所在目录（generate_sweep 的层级结构根目录，界面生成时为 generate_script）
+        params: 任务参数，如 {'cell_size': 4.0, 'cell_radius': 0.3, 'speed_value': None, 'direction_value': None}；
+            同一根目录下的清单包含所有任务的作业，只保留这些字段都相等的记录
+        fallback: 没有作业清单时返回的脚本列表（如本次生成的脚本）
+    """
+    records = load_checked_job_records(manifest_dir)
+    if records is None:
+        return list(fallback)
+    params = params or {}
+    return [resolve_job_path(manifest_dir, record[key]) for record in records
+            if all(record.get(name) == value for name, value in params.items())
+            for key in ('preprocess', 'postprocess')]
+
+
+def write_sweep_list(python_files: List[str], output_dir: str, config_name: str):
+    """
+    将本次生成的作业写入作业列表 sweep_<config>.txt，供集群作业数组按下标取用
+
+    每行一个前处理脚本路径，相对于 generate_script 根目录（任务目录的上一级），
+    在集群上与 Config.BASE_SCRIPT_PATH 拼接得到实际路径
+
+    Returns:
+        tuple: (作业列表文件名, 作业数)，没有作业时不写文件，作业数为0
+    """
+    generate_script_dir = os.path.dirname(os.path.abspath(output_dir))
+    preprocess_files = list(dict.fromkeys(
+        os.path.relpath(os.path.abspath(path), generate_script_dir).replace(os.sep, '/')
+        for path in python_files if path.endswith('_preprocess.py')
+    ))
+    sweep_list_name = f"sweep_{config_name}.txt"
+    if preprocess_files:
+        with open(os.path.join(output_dir, sweep_list_name), 'w', encoding='utf-8', newline='\n') as f:
+            f.write('\n'.join(preprocess_files) + '\n')
+    return sweep_list_name, len(preprocess_files)
+
+
+def pair_job_scripts(preprocess_files: List[str], postprocess_files: List[str]) -> List[tuple]:
+    """按作业目录配对前处理/后处理脚本，返回 (前处理脚本, 后处理脚本或空字符串) 列表"""
+    postprocess_of = {posixpath.dirname(path): path for path in postprocess_files}
+    return [(path, postprocess_of.get(posixpath.dirname(path), "")) for path in preprocess_files]
+
+
+def write_job_list(jobs: List[tuple], list_path: str):
+    """
+    写入 run_all 驱动脚本读取的作业列表：每行一个作业，"前处理脚本<TAB>后处理脚本"
+
+    Args:
+        jobs: pair_job_scripts() 返回的 (前处理脚本, 后处理脚本) 列表
+        list_path: 作业列表文件路径
+    """
+    with open(list_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.writelines(f"{preprocess}\t{postprocess}\n" for preprocess, postprocess in jobs)
+
+
+def job_list_driver_header(job_list_name: str) -> List[str]:
+    """
+    作业列表驱动脚本的公共部分：定位作业列表、读取起始作业号、定义 job_done
+
+    - 作业列表默认为运行目录（找不到时为脚本所在目录）下的 job_list_name，可用 JOB_LIST 环境变量指定；
+      作业列表所在目录为任务目录 TASK_DIR
+    - 起始作业号取脚本第一个参数或 START 环境变量（qsub -v START=N），默认 1
+    - feature_data.txt 比前处理脚本新且状态为 successful 的作业视为已完成，直接跳过
+    """
+    return [
+        "# ========================================",
+        "# Job list: one \"preprocess<TAB>postprocess\" line per job",
+        "# Usage: ./script.sh [first_job_number]  (or START=N in the environment)",
+        "# ========================================",
+        f"JOB_LIST=${{JOB_LIST:-{job_list_name}}}",
+        "if [ ! -f \"$JOB_LIST\" ] && [ -f \"$(dirname \"$0\")/$JOB_LIST\" ]; then",
+        "    JOB_LIST=\"$(dirname \"$0\")/$JOB_LIST\"  # started from another directory: use the list next to the script",
+        "fi",
+        "case \"$JOB_LIST\" in /*) ;; *) JOB_LIST=\"$(pwd)/$JOB_LIST\" ;; esac",
+        "TASK_DIR=$(dirname \"$JOB_LIST\")",
+        "START=${1:-${START:-1}}",
+        f"SOLVER_CPUS=${{SOLVER_CPUS:-{Config.SOLVER_CPUS}}}",
+        "if [ ! -f \"$JOB_LIST\" ]; then",
+        "    echo \"ERROR: Job list not found: $JOB_LIST\"",
+        "    exit 1",
+        "fi",
+        "TOTAL=$(grep -c . \"$JOB_LIST\")",
+        "echo \"Job list: $JOB_LIST ($TOTAL jobs, starting at job $START)\"",
+        "echo",
+        "",
+        "# A job is done when its feature_data.txt is newer than the preprocess script and reports success",
+        "job_done() {",
+        "    local feature_data=\"$(dirname \"$1\")/feature_data.txt\"",
+        "    [ \"$feature_data\" -nt \"$1\" ] && [ \"$(sed -n 2p \"$feature_data\")\" = \"status: successful\" ]",
+        "}",
+        "",
+    ]
+
+
+def job_list_two_phase_loop() -> List[str]:
+    """
+    按作业列表两阶段执行的循环体（与逐作业展开的脚本行为一致）：
+    Phase 1 依次前处理（.inp 比前处理脚本新时跳过），Phase 2 逐个求解并立即后处理
+
+    两个阶段的失败都记录到任务目录下的 failed_submissions.log / failed_postprocess.log（绝对路径，
+    不受 Phase 2 进入作业目录的影响）；本次运行有新的失败记录时脚本以状态1退出
+    """
+    read_jobs = [
+        "n=0",
+        "while IFS=$'\\t' read -r preprocess postprocess <&3; do",
+        "    n=$((n + 1))",
+        "    [ -n \"$preprocess\" ] && [ \"$n\" -ge \"$START\" ] || continue",
+        "    job_name=$(basename \"$preprocess\" _preprocess.py)",
+        "    script_dir=$(dirname \"$preprocess\")",
+        "    if job_done \"$preprocess\"; then",
+        "        echo \"[$n/$TOTAL] Already completed: $job_name\"",
+        "        continue",
+        "    fi",
+    ]
+    return [
+        "FAILED_LOG=\"$TASK_DIR/failed_submissions.log\"",
+        "POSTPROCESS_FAILED_LOG=\"$TASK_DIR/failed_postprocess.log\"",
+        "failures_logged() {",
+        "    cat \"$FAILED_LOG\" \"$POSTPROCESS_FAILED_LOG\" 2>/dev/null | wc -l",
+        "}",
+        "FAILURES_BEFORE=$(failures_logged)",
+        "",
+        "# ========================================",
+        "# Phase 1: Submit All Preprocessing Scripts",
+        "# ========================================",
+        "echo 'Phase 1: Submitting preprocessing scripts...'",
+        "echo",
+        *read_jobs,
+        "    if [ \"$script_dir/$job_name.inp\" -nt \"$preprocess\" ]; then",
+        "        echo \"[$n/$TOTAL] Input file up to date: $job_name.inp\"",
+        "        continue",
+        "    fi",
+        "    echo \"[$n/$TOTAL] Submitting: $(basename \"$preprocess\")\"",
+        f"    if ! (cd \"$script_dir\" && {Config.ABAQUS_COMMAND}=\"$preprocess\"); then",
+        "        echo \"ERROR: Failed to submit $(basename \"$preprocess\")\"",
+        "        echo \"$(basename \"$preprocess\")\" >> \"$FAILED_LOG\"",
+        "    fi",
+        "    echo",
+        "done 3< \"$JOB_LIST\"",
+        "",
+        "# ========================================",
+        "# Phase 2: Submit Solver and Postprocess (Sequential)",
+        "# ========================================",
+        "echo 'Phase 2: Processing jobs sequentially to avoid ODB accumulation...'",
+        "echo",
+        *read_jobs,
+        "    echo '========================================'",
+        "    echo \"[$n/$TOTAL] Processing: $job_name\"",
+        "    echo '========================================'",
+        "    (",
+        "        cd \"$script_dir\" || exit 1",
+        "        # Clean up lock files first",
+        "        rm -f *.lck 2>/dev/null",
+        "        if [ ! -f \"$job_name.inp\" ]; then",
+        "            echo \"ERROR: Input file not found: $script_dir/$job_name.inp\"",
+        "            echo \"$job_name\" >> \"$FAILED_LOG\"",
+        "            exit 1",
+        "        fi",
+        "        echo \"Submitting solver job: $job_name\"",
+        "        echo y | abaqus job=$job_name input=$job_name.inp cpus=$SOLVER_CPUS interactive",
+        "        echo \"Solver completed for $job_name\"",
+        "",
+        "        if [ -n \"$postprocess\" ]; then",
+        "            echo \"Running postprocessing: $(basename \"$postprocess\")\"",
+        f"            {Config.ABAQUS_COMMAND}=\"$postprocess\"",
+        "            if [ $? -ne 0 ]; then",
+        "                echo \"ERROR: Postprocessing failed for $(basename \"$postprocess\")\"",
+        "                echo \"$(basename \"$postprocess\")\" >> \"$POSTPROCESS_FAILED_LOG\"",
+        "            else",
+        "                echo \"Postprocessing completed for $job_name\"",
+        "            fi",
+        "            # Cleanup files after postprocessing",
+        "            rm -f \"$job_name.odb\"",
+        "            rm -rf \"$job_name.abq\"",
+        "            echo \"Cleanup completed for $job_name\"",
+        "        fi",
+        "    )",
+        "    echo",
+        "done 3< \"$JOB_LIST\"",
+        "",
+        "echo 'All jobs completed!'",
+        "NEW_FAILURES=$(( $(failures_logged) - FAILURES_BEFORE ))",
+        "if [ \"$NEW_FAILURES\" -gt 0 ]; then",
+        "    echo \"WARNING: $NEW_FAILURES failures recorded in $FAILED_LOG / $POSTPROCESS_FAILED_LOG\"",
+        "    RUN_STATUS=1",
+        "fi",
+        "echo",
+        "",
+    ]
+
+
+class SlurmArrayGenerator(BaseScriptGenerator):
+    """
+    SLURM分阶段作业数组生成器
+
+    作业列表中的每个作业依次经过 前处理(CAE) → 求解 → 后处理(CAE) 三个作业数组，
+    相邻数组用 --dependency=aftercorr 按下标串联（第i个作业的前处理成功后才开始第i个求解），
+    全部后处理结束后运行 GeJsonl 汇总数据集；每个阶段单独申请资源，CAE阶段只申请
+    Config.SLURM_CAE_CPUS 个核，不会在单线程的前后处理期间占用求解所需的多个核
+
+    前处理和后处理数组同时在运行，两者合计的CAE会话数不超过 Config.CAE_SLOTS：
+    设置 Config.SLURM_CAE_LICENSE 时每个CAE子作业以 --licenses 申请一个license，由SLURM统一限制；
+    否则把 CAE_SLOTS 拆分为两个数组的并发上限（见 cae_array_limits）；CAE_SLOTS=1 时无法拆分，
+    后处理数组改为等前处理数组全部结束后再开始，两个CAE阶段依次运行
+
+    生成的文件（位于任务目录）:
+        sweep_<config>.txt                作业列表
+        slurm_<stage>_<config>.sh         各阶段的 sbatch 脚本
+        submit_slurm_<config>.sh          依次提交各阶段并串联依赖
+    """
+
+    STAGES = ("preprocess", "solve", "postprocess", "aggregate")
+
+    def __init__(self, python_files: List[str], output_dir: str, config_name: Optional[str] = None):
+        super().__init__(python_files, output_dir, config_name=config_name)
+        self.name = config_name or self.timestamp
+        self.task_path = posixpath.join(Config.BASE_SCRIPT_PATH, os.path.basename(os.path.abspath(output_dir)))
+        self.sweep_list_name = f"sweep_{self.name}.txt"
+        self.job_count = 0
+
+    def get_file_extension(self) -> str:
+        return "sh"
+
+    def get_script_filename(self) -> str:
+        return f"submit_slurm_{self.name}.sh"
+
+    def get_stage_filename(self, stage: str) -> str:
+        return f"slurm_{stage}_{self.name}.sh"
+
+    def generate(self) -> Optional[str]:
+        """写入作业列表和各阶段脚本，再生成提交脚本"""
+        self.sweep_list_name, self.job_count = write_sweep_list(self.python_files, self.output_dir, self.name)
+        if not self.job_count:
+            print("本次没有生成任何作业，未生成SLURM作业数组脚本")
+            return None
+
+        try:
+            for stage in self.STAGES:
+                content = '\n'.join(self.generate_stage_script(stage)) + '\n'
+                self.write_file(content, os.path.join(self.output_dir, self.get_stage_filename(stage)))
+        except Exception as e:
+            print(f"生成SLURM阶段脚本时出错: {e}")
+            return None
+        return super().generate()
+
+    @staticmethod
+    def cae_array_limits() -> tuple:
+        """
+        前处理、后处理数组的并发上限 (前处理, 后处理, 是否依次运行)
+
+        后处理最多占一半（不超过 POSTPROCESS_SLOTS），其余给前处理，两者之和为 Config.CAE_SLOTS；
+        CAE_SLOTS=1 时两个数组各用1个会话，但必须依次运行（后处理数组等待前处理数组全部结束）
+        """
+        if Config.CAE_SLOTS < 2:
+            return 1, 1, True
+        post = min(Config.POSTPROCESS_SLOTS, Config.CAE_SLOTS // 2)
+        return Config.CAE_SLOTS - post, post, False
+
+    @staticmethod
+    def gejsonl_script() -> str:
+        """集群上 GeJsonl.py 的路径：Config.SLURM_GEJSONL_SCRIPT，留空时位于 BASE_SCRIPT_PATH 的上级目录"""
+        return Config.SLURM_GEJSONL_SCRIPT or posixpath.join(posixpath.dirname(Config.BASE_SCRIPT_PATH), "GeJsonl.py")
+
+    def _stage_header(self, stage: str, cpus: int, memory: str, time_limit: str) -> List[str]:
+        """阶段脚本的 #SBATCH 头部（数组范围和依赖在提交脚本中指定）"""
+        output = "%j" if stage == "aggregate" else "%A_%a"
+        licenses = ([f"#SBATCH --licenses={Config.SLURM_CAE_LICENSE}:1"]
+                    if Config.SLURM_CAE_LICENSE and stage in ("preprocess", "postprocess") else [])
+        return [
+            "#!/bin/bash",
+            f"#SBATCH --job-name={self.name}_{stage}",
+            f"#SBATCH --output={self.task_path}/logs/{stage}_{output}.log",
+            f"#SBATCH --time={time_limit}",
+            f"#SBATCH --partition={Config.SLURM_PARTITION}",
+            "#SBATCH --nodes=1",
+            "#SBATCH --ntasks=1",
+            f"#SBATCH --cpus-per-task={cpus}",
+            f"#SBATCH --mem={memory}",
+        ] + licenses + [
+            "",
+        ]
+
+    def _resolve_job(self, stage: str) -> List[str]:
+        """按 $SLURM_ARRAY_TASK_ID 从作业列表取出作业并进入作业目录；已后处理完成的作业直接退出"""
+        return [
+            f"BASE_DIR=\"{Config.BASE_SCRIPT_PATH}\"",
+            f"PREPROCESS=$(sed -n \"${{SLURM_ARRAY_TASK_ID}}p\" \"{self.task_path}/{self.sweep_list_name}\")",
+            "if [ -z \"$PREPROCESS\" ]; then",
+            "    echo \"ERROR: no job for array index $SLURM_ARRAY_TASK_ID\"",
+            "    exit 1",
+            "fi",
+            "JOB_DIR=\"$BASE_DIR/$(dirname \"$PREPROCESS\")\"",
+            "JOB_NAME=$(basename \"$PREPROCESS\" _preprocess.py)",
+            f"echo \"[$SLURM_ARRAY_TASK_ID] {stage} $JOB_NAME on $(hostname), job $SLURM_JOB_ID\"",
+            "",
+            f"module load {Config.ABAQUS_MODULE}",
+            "cd \"$JOB_DIR\" || exit 1",
+            "",
+            "if [ feature_data.txt -nt \"${JOB_NAME}_preprocess.py\" ] && grep -q \"status: successful\" feature_data.txt; then",
+            "    echo \"Already completed: $JOB_NAME\"",
+            "    exit 0",
+            "fi",
+            "",
+        ]
+
+    def generate_stage_script(self, stage: str) -> List[str]:
+        """生成单个阶段的 sbatch 脚本"""
+        if stage == "aggregate":
+            content = self._stage_header(stage, Config.SLURM_CAE_CPUS, Config.SLURM_CAE_MEMORY,
+                                         Config.SLURM_CAE_TIME_LIMIT)
+            # GeJsonl.py 从当前目录下的 generate_script 收集数据，因此在 BASE_SCRIPT_PATH 的上级目录运行
+            content.extend([
+                "# Build the dataset from every finished sample",
+                f"GEJSONL=\"{self.gejsonl_script()}\"",
+                "if [ ! -f \"$GEJSONL\" ]; then",
+                "    echo \"ERROR: $GEJSONL not found; deploy GeJsonl.py there or set SLURM_GEJSONL_SCRIPT when generating\"",
+                "    exit 1",
+                "fi",
+                f"cd \"{posixpath.dirname(Config.BASE_SCRIPT_PATH)}\" || exit 1",
+                "python \"$GEJSONL\"",
+            ])
+            return content
+
+        if stage == "solve":
+            content = self._stage_header(stage, Config.SLURM_CPUS_PER_TASK, Config.SLURM_MEMORY,
+                                         Config.SLURM_SOLVE_TIME_LIMIT)
+        else:
+            content = self._stage_header(stage, Config.SLURM_CAE_CPUS, Config.SLURM_CAE_MEMORY,
+                                         Config.SLURM_CAE_TIME_LIMIT)
+        content.extend(self._resolve_job(stage))
+
+        if stage == "preprocess":
+            content.extend([
+                "if [ \"$JOB_NAME.inp\" -nt \"${JOB_NAME}_preprocess.py\" ]; then",
+                "    echo \"Input file up to date: $JOB_NAME.inp\"",
+                "    exit 0",
+                "fi",
+                f"{Config.ABAQUS_COMMAND}=\"${{JOB_NAME}}_preprocess.py\"",
+                "if [ ! -f \"$JOB_NAME.inp\" ]; then",
+                "    echo \"ERROR: preprocessing failed for $JOB_NAME\"",
+                "    exit 1",
+                "fi",
+            ])
+        elif stage == "solve":
+            scratch = " ".join(f"\"$JOB_NAME{ext}\"" for ext in Config.SOLVER_SCRATCH_EXTENSIONS)
+            content.extend([
+                "rm -f \"$JOB_NAME.lck\"",
+                "echo y | abaqus job=$JOB_NAME input=$JOB_NAME.inp cpus=$SLURM_CPUS_PER_TASK interactive",
+                f"rm -rf {scratch}",
+                "if [ ! -f \"$JOB_NAME.odb\" ]; then",
+                "    echo \"ERROR: solver produced no ODB for $JOB_NAME\"",
+                "    exit 1",
+                "fi",
+            ])
+        else:
+            content.extend([
+                f"{Config.ABAQUS_COMMAND}=\"${{JOB_NAME}}_postprocess.py\"",
+                "rm -f \"$JOB_NAME.odb\"",
+                "if ! grep -q \"status: successful\" feature_data.txt 2>/dev/null; then",
+                "    echo \"ERROR: postprocessing failed for $JOB_NAME\"",
+                "    exit 1",
+                "fi",
+            ])
+        content.append("echo \"Stage finished: $JOB_NAME\"")
+        return content
+
+    def generate_header(self) -> List[str]:
+        """生成提交脚本头部"""
+        return [
+            "#!/bin/bash",
+            "# Submit the sweep as chained SLURM job arrays:",
+            "#   preprocess (CAE) -> solve -> postprocess (CAE) -> dataset aggregation",
+            "cd \"$(dirname \"$0\")\" || exit 1",
+            f"mkdir -p \"{self.task_path}/logs\"",
+            "",
+        ]
+
+    def generate_script_loop(self) -> List[str]:
+        """生成依次提交各阶段的命令：数组之间按下标 aftercorr 串联，汇总作业在全部后处理结束后运行"""
+        array = f"1-{self.job_count}"
+        # 上一阶段失败的下标永远无法满足依赖，--kill-on-invalid-dep 让其取消而不是一直排队
+        chained = "--kill-on-invalid-dep=yes --dependency=aftercorr"
+        post_after = ""
+        if Config.SLURM_CAE_LICENSE:
+            # license 由SLURM统一计数，两个数组都可用满 CAE_SLOTS
+            pre_slots = post_slots = Config.CAE_SLOTS
+            limit_note = f"# CAE sessions are limited by the {Config.SLURM_CAE_LICENSE} license count"
+        else:
+            pre_slots, post_slots, serial = self.cae_array_limits()
+            if serial:
+                # 只有一个CAE会话：后处理数组再等待整个前处理数组结束，两个阶段不会同时占用license
+                post_after = ",afterany:$PRE_ID"
+                limit_note = "# One CAE session: the postprocess array starts after the whole preprocess array"
+            else:
+                limit_note = (f"# Preprocess and postprocess arrays run concurrently: "
+                              f"at most {pre_slots} + {post_slots} CAE sessions")
+        return [
+            limit_note,
+            f"PRE_ID=$(sbatch --parsable --array={array}%{pre_slots} "
+            f"{self.get_stage_filename('preprocess')}) || exit 1",
+            "PRE_ID=${PRE_ID%%;*}",
+            f"SOLVE_ID=$(sbatch --parsable --array={array} {chained}:$PRE_ID "
+            f"{self.get_stage_filename('solve')}) || exit 1",
+            "SOLVE_ID=${SOLVE_ID%%;*}",
+            f"POST_ID=$(sbatch --parsable --array={array}%{post_slots} {chained}:$SOLVE_ID{post_after} "
+            f"{self.get_stage_filename('postprocess')}) || exit 1",
+            "POST_ID=${POST_ID%%;*}",
+            # 汇总不要求全部作业成功，已完成的样本照常进入数据集
+            f"AGG_ID=$(sbatch --parsable --dependency=afterany:$POST_ID {self.get_stage_filename('aggregate')}) || exit 1",
+            "AGG_ID=${AGG_ID%%;*}",
+            "",
+        ]
+
+    def generate_footer(self) -> List[str]:
+        """生成提交脚本尾部"""
+        return [
+            f"echo \"Submitted {self.job_count} jobs: preprocess $PRE_ID, solve $SOLVE_ID, "
+            f"postprocess $POST_ID, aggregate $AGG_ID\"",
+            f"echo \"Logs: {self.task_path}/logs\"",
+            "echo \"Cancel all: scancel $PRE_ID $SOLVE_ID $POST_ID $AGG_ID\"",
+        ]
+
+    def write_file(self, content: str, file_path: str):
+        """写入脚本并设置执行权限（Unix换行符）"""
+        with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(content)
+        try:
+            import stat
+            os.chmod(file_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+        except Exception as e:
+            print(f"警告: 无法设置执行权限: {e}")
+
+
+def generate_slurm_arrays(python_files: List[str], output_dir: str, config_name: Optional[str] = None) -> Optional[str]:
+    """
+    生成SLURM分阶段作业数组脚本
+
+    Returns:
+        str: 提交脚本路径（在集群上执行 bash submit_slurm_<config>.sh），没有作业或失败时返回None
+    """
+    return SlurmArrayGenerator(python_files, output_dir, config_name).generate()
+
+
 def generate_shell_script(python_files: List[str], output_dir: str, script_type: str = "sh",
                           group_number: Optional[int] = None, config_name: Optional[str] = None) -> Optional[str]:
     """
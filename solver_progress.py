@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+求解进度监视 - 增量读取每个求解作业的 .sta 文件，估算完成百分比和剩余时间，
+并将全部作业的进度写入任务目录下的状态文件（JSON）供其他工具显示
+"""
+import json
+import os
+from collections import deque
+import threading
+import time
+
+from config import Config
+
+
+def get_status_path(task_dir):
+    """任务目录下的求解状态文件路径"""
+    return os.path.join(task_dir, Config.SOLVER_STATUS_FILE)
+
+
+def read_step_periods(inp_path):
+    """
+    从.inp文件读取各分析步的时长（*Static / *Dynamic 数据行的第2个字段）
+
+    Returns:
+        float | None: 全部分析步时长之和，无法读取时返回 None
+    """
+    total = 0.0
+    expect_data = False
+    try:
+        with open(inp_path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                if line.startswith('**'):
+                    continue
+                if line.startswith('*'):
+                    keyword = line[1:].split(',')[0].strip().lower()
+                    expect_data = keyword in ('static', 'dynamic')
+                    continue
+                if expect_data:
+                    fields = [field.strip() for field in line.split(',')]
+                    if len(fields) > 1 and fields[1]:
+                        total += float(fields[1])
+                    expect_data = False
+    except (OSError, ValueError):
+        return None
+    return total or None
+
+
+def parse_sta_line(line):
+    """
+    解析.sta文件中的一行增量记录
+
+    - Abaqus/Standard: STEP INC ATT SEVERE EQUIL TOTAL TOTAL_TIME STEP_TIME INC_TIME ...
+    - Abaqus/Explicit: INCREMENT STEP_TIME TOTAL_TIME CPU_TIME(hh:mm:ss) STABLE_INC ...
+
+    Returns:
+        dict | None: 增量信息，不是增量记录的行返回 None
+    """
+    fields = line.split()
+    if len(fields) < 5 or not fields[0].isdigit():
+        return None
+    try:
+        if ':' in fields[3]:
+            return {
+                'increment': int(fields[0]),
+                'step_time': float(fields[1]),
+                'total_time': float(fields[2]),
+                'stable_increment': float(fields[4]),
+            }
+        if len(fields) >= 9 and fields[1].isdigit():
+            return {
+                'step': int(fields[0]),
+                'increment': int(fields[1]),
+                'total_time': float(fields[6]),
+                'step_time': float(fields[7]),
+            }
+    except ValueError:
+        pass
+    return None
+
+
+class StaTail:
+    """增量读取.sta文件：每次只读取上次读取之后新增的字节，未写完的最后一行留到下次"""
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.partial = b''
+
+    def read_lines(self):
+        """返回新增的完整行"""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return []
+        if size < self.offset:
+            # 文件被重新创建（作业重跑），从头读取
+            self.offset, self.partial = 0, b''
+        if size == self.offset:
+            return []
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        self.offset += len(data)
+        lines = (self.partial + data).split(b'\n')
+        self.partial = lines.pop()
+        return [line.decode('utf-8', errors='ignore') for line in lines]
+
+
+class JobProgress:
+    """单个求解作业的进度"""
+
+    def __init__(self, job, process=None):
+        self.job = job
+        self.process = process
+        self.job_name = job['job_name']
+        self.dir = job['dir']
+        self.key = job.get('key')
+        self.tail = StaTail(os.path.join(job['dir'], f"{self.job_name}.sta"))
+        self.start_time = time.time()
+        self.period = None
+        self.last = {}
+        self.state = 'solving'
+        self.samples = deque()  # (刷新时刻, 总分析时间)，用于判断停滞
+
+    def refresh(self):
+        """读取.sta新增内容并更新进度"""
+        if self.period is None:
+            self.period = read_step_periods(os.path.join(self.dir, f"{self.job_name}.inp"))
+        for line in self.tail.read_lines():
+            increment = parse_sta_line(line)
+            if increment:
+                self.last = increment
+            elif 'COMPLETED SUCCESSFULLY' in line:
+                self.state = 'completed'
+            elif 'HAS NOT BEEN COMPLETED' in line:
+                self.state = 'aborted'
+        if 'total_time' in self.last:
+            self.samples.append((time.time(), self.last['total_time']))
+
+    def is_stalled(self, window, min_progress):
+        """
+        最近 window 秒内总分析时间的推进不超过 min_progress × 分析步总时长时视为停滞
+        （增量反复回切或稳定时间增量过小）；.sta中出现第一个增量之前不判断
+        """
+        if self.state != 'solving' or not self.samples or window <= 0:
+            return False
+        now, current = self.samples[-1]
+        # 保留窗口起点之前的最后一个采样作为比较基准
+        while len(self.samples) > 1 and self.samples[1][0] <= now - window:
+            self.samples.popleft()
+        since, baseline = self.samples[0]
+        if now - since < window:
+            return False
+        threshold = min_progress * self.period if self.period else 0.0
+        return current - baseline <= threshold
+
+    @property
+    def fraction(self):
+        """完成比例 (0-1)，无法估算时返回 None"""
+        if self.state == 'completed':
+            return 1.0
+        if not self.period or 'total_time' not in self.last:
+            return None
+        return min(1.0, self.last['total_time'] / self.period)
+
+    @property
+    def eta(self):
+        """按已用时间线性外推的剩余秒数，无法估算时返回 None"""
+        fraction = self.fraction
+        if not fraction:
+            return None
+        return (time.time() - self.start_time) * (1 - fraction) / fraction
+
+    def to_dict(self):
+        fraction = self.fraction
+        eta = self.eta
+        status = {
+            'state': self.state,
+            'elapsed': round(time.time() - self.start_time, 1),
+            'percent': None if fraction is None else round(fraction * 100, 1),
+            'eta_seconds': None if eta is None else round(eta, 1),
+        }
+        status.update(self.last)
+        return status
+
+    def describe(self):
+        """用于终端输出的进度描述"""
+        parts = []
+        fraction = self.fraction
+        if fraction is not None:
+            parts.append(f"{fraction * 100:.1f}%")
+        if 'increment' in self.last:
+            parts.append(f"增量 {self.last['increment']}")
+        if 'stable_increment' in self.last:
+            parts.append(f"稳定时间增量 {self.last['stable_increment']:.2e}")
+        eta = self.eta
+        if eta is not None:
+            parts.append(f"预计剩余 {eta/60:.1f}分钟")
+        return "，".join(parts)
+
+
+class ProgressMonitor:
+    """
+    批量求解进度监视器
+
+    后台线程每隔 interval 秒刷新所有正在求解的作业，并原子写入状态文件：
+    {"updated": ..., "sweep": {...}, "jobs": {作业名: {...}}}
+    提供 history (RuntimeHistory) 时记录每个成功作业的求解用时；
+    提供 on_stall(job, process) 时，作业在 Config.STALL_WINDOW 秒内的推进不足
+    Config.STALL_MIN_PROGRESS 即标记为 stalled，并在独立线程中调用 on_stall 终止作业
+    """
+
+    def __init__(self, task_dir, total_jobs, interval=None, history=None, on_stall=None):
+        self.path = get_status_path(task_dir)
+        self.total_jobs = total_jobs
+        self.interval = Config.PROGRESS_INTERVAL if interval is None else interval
+        self.lock = threading.Lock()
+        self.running = {}
+        self.finished = {}  # 作业名 -> 状态
+        self.durations = []
+        self.history = history
+        self.on_stall = on_stall
+        self.sweep = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.refresh()
+
+    def start_job(self, job, process=None):
+        with self.lock:
+            self.running[job['job_name']] = JobProgress(job, process)
+
+    def cancel_job(self):
+        """有作业不再需要求解（如前处理失败）时从批次总数中扣除"""
+        with self.lock:
+            self.total_jobs = max(0, self.total_jobs - 1)
+
+    def finish_job(self, job_name, success):
+        with self.lock:
+            progress = self.running.pop(job_name, None)
+            if progress is None:
+                return
+            duration = time.time() - progress.start_time
+            progress.refresh()
+            if progress.state != 'stalled':
+                progress.state = 'completed' if success else 'failed'
+            self.finished[job_name] = progress.to_dict()
+            if success:
+                self.durations.append(duration)
+        if success and self.history is not None:
+            self.history.record(progress.key, duration)
+
+    def was_stalled(self, job_name):
+        """作业是否因停滞被终止"""
+        with self.lock:
+            progress = self.running.get(job_name)
+            state = progress.state if progress else self.finished.get(job_name, {}).get('state')
+        return state == 'stalled'
+
+    def describe(self, job_name):
+        """作业进度描述（最近一次刷新的结果）"""
+        with self.lock:
+            progress = self.running.get(job_name)
+            return progress.describe() if progress else ""
+
+    def describe_sweep(self):
+        """整个批次进度描述（最近一次刷新的结果）"""
+        with self.lock:
+            sweep = self.sweep
+        if sweep is None:
+            return ""
+        text = f"全部作业 {sweep['percent']:.1f}% ({sweep['finished']}/{sweep['total']} 已结束)"
+        if sweep['eta_seconds'] is not None:
+            text += f"，预计剩余 {sweep['eta_seconds']/60:.1f}分钟"
+        return text
+
+    def refresh(self):
+        """刷新所有正在求解的作业并写入状态文件"""
+        stalled = []
+        with self.lock:
+            for progress in self.running.values():
+                progress.refresh()
+                if self.on_stall is not None and progress.is_stalled(Config.STALL_WINDOW, Config.STALL_MIN_PROGRESS):
+                    progress.state = 'stalled'
+                    stalled.append(progress)
+            self.sweep = self._sweep_status()
+            status = {
+                'updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'sweep': self.sweep,
+                'jobs': dict(self.finished, **{name: progress.to_dict() for name, progress in self.running.items()}),
+            }
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(status, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"警告: 无法写入求解状态文件: {e}")
+
+        for progress in stalled:
+            threading.Thread(target=self.on_stall, args=(progress.job, progress.process), daemon=True).start()
+        return status
+
+    def _sweep_status(self):
+        """
+        整个批次的进度：已结束作业按1计，正在求解的按完成比例计；
+        剩余时间 = (正在求解作业的剩余时间 + 未开始作业数 × 平均求解时间) / 当前并发数
+        """
+        fractions = [progress.fraction or 0.0 for progress in self.running.values()]
+        done = len(self.finished) + sum(fractions)
+        waiting = max(0, self.total_jobs - len(self.finished) - len(self.running))
+
+        average = None
+        if self.durations:
+            average = sum(self.durations) / len(self.durations)
+        else:
+            projected = [time.time() - progress.start_time + progress.eta
+                         for progress in self.running.values() if progress.eta is not None]
+            if projected:
+                average = sum(projected) / len(projected)
+
+        eta = None
+        if average is not None:
+            remaining = sum(progress.eta if progress.eta is not None else average
+                            for progress in self.running.values())
+            eta = (remaining + waiting * average) / max(1, len(self.running))
+
+        return {
+            'total': self.total_jobs,
+            'finished': len(self.finished),
+            'failed': sum(1 for status in self.finished.values() if status['state'] == 'failed'),
+            'stalled': sum(1 for status in self.finished.values() if status['state'] == 'stalled'),
+            'running': len(self.running),
+            'percent': round(done / self.total_jobs * 100, 1) if self.total_jobs else 100.0,
+            'eta_seconds': None if eta is None else round(eta, 1),
+        }
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            self.refresh()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+模板编译引擎 - 将Abaqus模板一次性解析为"字面量片段 + 命名槽位"
+替代逐次 re.sub 全文扫描与复制，每个作业只需单次拼接即可生成脚本
+"""
+import re
+from typing import Dict, List, NamedTuple, Tuple
+
+
+class SlotSpec(NamedTuple):
+    """槽位定义"""
+    name: str        # 槽位名称，渲染时通过该名称填值
+    pattern: str     # 在原始模板中定位槽位的正则表达式
+    flags: int = 0   # 正则标志
+    count: int = 0   # 最多匹配次数，0表示全部（与 re.sub 的 count 语义一致）
+    group: int = 0   # 槽位覆盖的分组，0表示整个匹配
+
+
+class CompiledTemplate:
+    """编译后的模板：literals[0] slot[0] literals[1] slot[1] ... literals[n]"""
+
+    def __init__(self, text: str, slot_specs: List[SlotSpec]):
+        """
+        解析模板，定位所有槽位
+
+        Args:
+            text: 模板原文
+            slot_specs: 槽位定义列表，按优先级排列；
+                        与前面槽位重叠的匹配会被忽略（等价于逐次替换时被先行替换掉）
+
+        注意: 模板末尾的空白会被去除，与原先 content.rstrip() + 追加内容 的行为一致
+        """
+        spans: List[Tuple[int, int, str]] = []
+        for spec in slot_specs:
+            regex = re.compile(spec.pattern, spec.flags)
+            found = 0
+            for match in regex.finditer(text):
+                start, end = match.span(spec.group)
+                if any(start < e and s < end for s, e, _ in spans):
+                    continue
+                spans.append((start, end, spec.name))
+                found += 1
+                if spec.count and found >= spec.count:
+                    break
+        spans.sort()
+
+        self.literals: List[str] = []
+        self.slot_names: List[str] = []
+        self.defaults: List[str] = []  # 未填值时保留模板原文
+        position = 0
+        for start, end, name in spans:
+            self.literals.append(text[position:start])
+            self.slot_names.append(name)
+            self.defaults.append(text[start:end])
+            position = end
+        self.literals.append(text[position:].rstrip())
+        # 末尾字面量为空时，尾部空白可能来自槽位值，需要在渲染时整体去除
+        self._strip_on_render = not self.literals[-1]
+
+    @property
+    def names(self) -> List[str]:
+        """模板中出现的槽位名称（去重，按出现顺序）"""
+        return list(dict.fromkeys(self.slot_names))
+
+    def render(self, values: Dict[str, str], tail: str = "") -> str:
+        """
+        单次拼接生成最终文本
+
+        Args:
+            values: 槽位名称 -> 替换文本；未提供的槽位保留模板原文
+            tail: 追加在模板末尾的内容
+
+        Returns:
+            str: 渲染结果
+        """
+        literals = self.literals
+        parts = [literals[0]]
+        for index, name in enumerate(self.slot_names):
+            parts.append(values.get(name, self.defaults[index]))
+            parts.append(literals[index + 1])
+        if self._strip_on_render:
+            return ''.join(parts).rstrip() + tail
+        parts.append(tail)
+        return ''.join(parts)
+
+
+_compiled_cache: Dict[Tuple[Tuple[SlotSpec, ...], str], CompiledTemplate] = {}
+
+
+def compile_template(text: str, slot_specs: List[SlotSpec]) -> CompiledTemplate:
+    """
+    编译模板（带缓存），相同的模板文本与槽位定义只解析一次
+
+    Args:
+        text: 模板原文
+        slot_specs: 槽位定义列表
+
+    Returns:
+        CompiledTemplate: 编译后的模板
+    """
+    key = (tuple(slot_specs), text)
+    compiled = _compiled_cache.get(key)
+    if compiled is None:
+        compiled = CompiledTemplate(text, slot_specs)
+        _compiled_cache[key] = compiled
+    return compiled
@@ -4,7 +4,7 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
-from structure_set import get_crystal_structure
+from structure_set import get_structure_geometry
 
 
 class CellVisualizationWidget(QWidget):
@@ -49,60 +49,14 @@ class CellVisualizationWidget(QWidget):
         # self.ax.view_init(elev=20, azim=135)
 
     def parse_structure_from_set(self, cell_type, slider_value=4):
-        """Parse structure data from structure_set.py"""
+        """Get structure nodes (N×3) and edges (M×2) from structure_set.py"""
         try:
-            # 获取结构数据字符串，传入slider值
-            structure_data = get_crystal_structure(cell_type, slider_value)
-
-            if "结构" in structure_data and "不存在" in structure_data:
+            # 直接使用结构几何接口（已按 cell_type, slider 缓存），无需解析字符串
+            geometry = get_structure_geometry(cell_type, slider_value)
+            if geometry is None or len(geometry.nodes) == 0 or len(geometry.edges) == 0:
                 return None, None
 
-            # 解析坐标
-            points = []
-            point_names = {}
-            lines = structure_data.split('\n')
-
-            # 提取坐标定义
-            for line in lines:
-                if '=' in line and '[' in line and ']' in line:
-                    parts = line.strip().split('=')
-                    if len(parts) == 2:
-                        name = parts[0].strip()
-                        coord_str = parts[1].strip().strip('[]')
-                        try:
-                            coords = [float(x.strip()) for x in coord_str.split(',')]
-                            if len(coords) == 3:
-                                points.append(coords)
-                                point_names[name] = len(points) - 1
-                        except:
-                            continue
-
-            # 提取连接关系
-            connections = []
-            in_cylinders = False
-            for line in lines:
-                line = line.strip()
-                if 'cylinders = [' in line:
-                    in_cylinders = True
-                    continue
-                elif in_cylinders and ']' in line and '(' not in line:
-                    break
-                elif in_cylinders and '(' in line and ')' in line:
-                    # 提取连接对
-                    start = line.find('(')
-                    end = line.find(')')
-                    if start != -1 and end != -1:
-                        pair_str = line[start+1:end]
-                        parts = [p.strip() for p in pair_str.split(',')]
-                        if len(parts) == 2:
-                            point1, point2 = parts
-                            if point1 in point_names and point2 in point_names:
-                                connections.append([point_names[point1], point_names[point2]])
-
-            if points and connections:
-                return np.array(points), connections
-            else:
-                return None, None
+            return geometry.nodes, geometry.edges
 
         except Exception as e:
             print(f"Error parsing structure {cell_type}: {e}")